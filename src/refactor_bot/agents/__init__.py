@@ -1,5 +1,8 @@
 """Agent components for the refactor bot."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from refactor_bot.agents.exceptions import (
     AgentError,
     DiffGenerationError,
@@ -10,11 +13,33 @@ from refactor_bot.agents.exceptions import (
     SourceFileError,
     TaskDependencyError,
 )
-from refactor_bot.agents.consistency_auditor import ConsistencyAuditor
-from refactor_bot.agents.planner import Planner
-from refactor_bot.agents.refactor_executor import RefactorExecutor
-from refactor_bot.agents.repo_indexer import RepoIndexer
-from refactor_bot.agents.test_validator import TestValidator
+
+if TYPE_CHECKING:
+    from refactor_bot.agents.consistency_auditor import ConsistencyAuditor
+    from refactor_bot.agents.planner import Planner
+    from refactor_bot.agents.refactor_executor import RefactorExecutor
+    from refactor_bot.agents.repo_indexer import RepoIndexer
+    from refactor_bot.agents.test_validator import TestValidator
+
+# Agents pull in LLM clients, the vector store and tree-sitter, so they are
+# imported on first access; importing the exceptions alone stays cheap
+_LAZY_EXPORTS = {
+    "ConsistencyAuditor": "refactor_bot.agents.consistency_auditor",
+    "Planner": "refactor_bot.agents.planner",
+    "RefactorExecutor": "refactor_bot.agents.refactor_executor",
+    "RepoIndexer": "refactor_bot.agents.repo_indexer",
+    "TestValidator": "refactor_bot.agents.test_validator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "AgentError",
@@ -1,6 +1,9 @@
 """Consistency Auditor agent: checks diffs for structural integrity."""
 
+import functools
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from tree_sitter import Language, Parser, Query, QueryCursor, Tree
@@ -49,16 +52,75 @@ ANTI_PATTERN_SIGNALS: dict[str, list[str]] = {
     "server-parallel-fetching": ["await fetchNavigation()"],
     "server-after-nonblocking": ["await analytics.track("],
 }
+ANTI_PATTERN_RULE_SET_CACHE_SIZE = 32
+# tree-sitter releases the GIL while parsing, so diffs are parsed on threads
+# once a batch is large enough to cover the pool start-up
+PARALLEL_AUDIT_MIN_DIFFS = 4
+
+# Import binding queries for orphaned-import detection
+# Named import specifiers: import { useState, useCallback } from '...'
+NAMED_BINDING_QUERY = """
+    (import_statement
+        (import_clause
+            (named_imports
+                (import_specifier
+                    name: (identifier) @binding))))
+"""
+# Namespace imports: import * as foo from '...'
+NAMESPACE_BINDING_QUERY = """
+    (import_statement
+        (import_clause
+            (namespace_import
+                (identifier) @binding)))
+"""
+# Default imports: import foo from '...'
+DEFAULT_BINDING_QUERY = """
+    (import_statement
+        (import_clause
+            (identifier) @binding))
+"""
+BINDING_QUERIES = (NAMED_BINDING_QUERY, NAMESPACE_BINDING_QUERY, DEFAULT_BINDING_QUERY)
+
+
+@functools.cache
+def _binding_queries(language: Language) -> tuple[Query, ...]:
+    """BINDING_QUERIES compiled for `language`, once per process."""
+    return tuple(Query(language, source) for source in BINDING_QUERIES)
+
+
+@functools.lru_cache(maxsize=ANTI_PATTERN_RULE_SET_CACHE_SIZE)
+def _signals_for_rules(
+    rule_ids: frozenset[str] | None,
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """ANTI_PATTERN_SIGNALS entries for rule_ids (all of them for None), in table order."""
+    return tuple(
+        (rule_id, tuple(signals))
+        for rule_id, signals in ANTI_PATTERN_SIGNALS.items()
+        if rule_ids is None or rule_id in rule_ids
+    )
 
 
 class ConsistencyAuditor:
     """Checks diffs for structural consistency: orphaned imports,
     signature mismatches, dependency integrity, and React anti-patterns."""
 
-    def __init__(self, react_rules: list[ReactRule] | None = None) -> None:
-        """Initialize with optional rule override (defaults to REACT_RULES)."""
+    def __init__(
+        self,
+        react_rules: list[ReactRule] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize with optional rule override (defaults to REACT_RULES).
+
+        max_workers bounds the threads used to parse diffs; None uses the
+        CPU count, 1 parses serially. Raises ValueError below 1.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
         self._rules: list[ReactRule] = react_rules if react_rules is not None else list(REACT_RULES)
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
         self._finding_counter: int = 0
+        # (file_path, modified_content) -> parse result, for the audit in progress
+        self._parsed: dict[tuple[str, str], tuple[Tree, Language] | None] = {}
 
     def audit(
         self,
@@ -76,29 +138,34 @@ class ConsistencyAuditor:
         if not effective_rules:
             effective_rules = list(registry.get_all_rules()) or list(REACT_RULES)
 
-        for diff in diffs:
-            orphan_findings = self._check_orphaned_imports(diff)
-            all_findings.extend(orphan_findings)
-
-        # Signature mismatch across all diffs
-        sig_findings = self._check_signature_mismatches(diffs, repo_index)
-        all_findings.extend(sig_findings)
-
-        # Dependency integrity across all diffs
-        dep_findings = self._check_dependency_integrity(diffs, repo_index)
-        all_findings.extend(dep_findings)
-
-        # Anti-pattern checks (only for React projects)
-        if repo_index.is_react_project:
+        # Every check below reuses these trees instead of re-parsing each diff
+        self._parsed = self._parse_diffs(diffs)
+        try:
             for diff in diffs:
-                ap_findings = self._check_react_anti_patterns(
-                    diff,
-                    effective_rules,
-                )
-                all_findings.extend(ap_findings)
-
-        # Note: if parseable_count == 0, all diffs had unsupported extensions.
-        # This is not an error — we silently return a passing report.
+                orphan_findings = self._check_orphaned_imports(diff)
+                all_findings.extend(orphan_findings)
+
+            # Signature mismatch across all diffs
+            sig_findings = self._check_signature_mismatches(diffs, repo_index)
+            all_findings.extend(sig_findings)
+
+            # Dependency integrity across all diffs
+            dep_findings = self._check_dependency_integrity(diffs, repo_index)
+            all_findings.extend(dep_findings)
+
+            # Anti-pattern checks (only for React projects)
+            if repo_index.is_react_project:
+                for diff in diffs:
+                    ap_findings = self._check_react_anti_patterns(
+                        diff,
+                        effective_rules,
+                    )
+                    all_findings.extend(ap_findings)
+
+            # Note: if parseable_count == 0, all diffs had unsupported extensions.
+            # This is not an error — we silently return a passing report.
+        finally:
+            self._parsed = {}
 
         # Compute counts
         error_count = sum(1 for f in all_findings if f.severity == FindingSeverity.ERROR)
@@ -130,56 +197,16 @@ class ConsistencyAuditor:
         # Collect all import bindings (named, namespace, default)
         import_bindings: list[tuple[str, int | None]] = []  # (name, line_number)
 
-        # Query for named import specifiers: import { useState, useCallback } from '...'
-        named_query = Query(language, """
-            (import_statement
-                (import_clause
-                    (named_imports
-                        (import_specifier
-                            name: (identifier) @binding))))
-        """)
-        named_cursor = QueryCursor(named_query)
-        for match in named_cursor.matches(tree.root_node):
-            _, captures = match
-            if "binding" in captures:
-                for node in captures["binding"]:
-                    name = node.text.decode("utf-8") if node.text else ""
-                    line = node.start_point[0] + 1
-                    if name:
-                        import_bindings.append((name, line))
-
-        # Query for namespace imports: import * as foo from '...'
-        namespace_query = Query(language, """
-            (import_statement
-                (import_clause
-                    (namespace_import
-                        (identifier) @binding)))
-        """)
-        namespace_cursor = QueryCursor(namespace_query)
-        for match in namespace_cursor.matches(tree.root_node):
-            _, captures = match
-            if "binding" in captures:
-                for node in captures["binding"]:
-                    name = node.text.decode("utf-8") if node.text else ""
-                    line = node.start_point[0] + 1
-                    if name:
-                        import_bindings.append((name, line))
-
-        # Query for default imports: import foo from '...'
-        default_query = Query(language, """
-            (import_statement
-                (import_clause
-                    (identifier) @binding))
-        """)
-        default_cursor = QueryCursor(default_query)
-        for match in default_cursor.matches(tree.root_node):
-            _, captures = match
-            if "binding" in captures:
-                for node in captures["binding"]:
-                    name = node.text.decode("utf-8") if node.text else ""
-                    line = node.start_point[0] + 1
-                    if name:
-                        import_bindings.append((name, line))
+        # Named, then namespace, then default bindings, as before
+        for query in _binding_queries(language):
+            for match in QueryCursor(query).matches(tree.root_node):
+                _, captures = match
+                if "binding" in captures:
+                    for node in captures["binding"]:
+                        name = node.text.decode("utf-8") if node.text else ""
+                        line = node.start_point[0] + 1
+                        if name:
+                            import_bindings.append((name, line))
 
         if not import_bindings:
             return findings
@@ -408,19 +435,19 @@ class ConsistencyAuditor:
         content = diff.modified_content
 
         # Build signals from self._rules if available, fall back to module-level
-        signals_map = ANTI_PATTERN_SIGNALS
         active_rules = react_rules or self._rules
-        if active_rules:
-            # Build rule_id set for filtering
-            active_rule_ids = {r.rule_id for r in active_rules}
-            signals_map = {
-                k: v for k, v in ANTI_PATTERN_SIGNALS.items()
-                if k in active_rule_ids
-            }
-
-        for rule_id, signals in signals_map.items():
+        signals_map = _signals_for_rules(
+            frozenset(r.rule_id for r in active_rules) if active_rules else None
+        )
+
+        # Some signals back several rules; search the content once per signal
+        present: dict[str, bool] = {}
+        for rule_id, signals in signals_map:
             for signal in signals:
-                if signal in content:
+                found = present.get(signal)
+                if found is None:
+                    found = present[signal] = signal in content
+                if found:
                     findings.append(AuditFinding(
                         finding_id=self._next_finding_id(),
                         file_path=diff.file_path,
@@ -438,6 +465,22 @@ class ConsistencyAuditor:
 
         return findings
 
+    def _parse_diffs(
+        self,
+        diffs: list[FileDiff],
+    ) -> dict[tuple[str, str], tuple[Tree, Language] | None]:
+        """Parse each distinct (file_path, modified_content) once, on threads
+        for large batches. Results are keyed, so order does not matter."""
+        keys = list(dict.fromkeys((diff.file_path, diff.modified_content) for diff in diffs))
+        workers = min(self.max_workers, len(keys))
+        if workers <= 1 or len(keys) < PARALLEL_AUDIT_MIN_DIFFS:
+            results = [self._parse_uncached(*key) for key in keys]
+        else:
+            # get_parser keeps one Parser per thread, so workers never share one
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda key: self._parse_uncached(*key), keys))
+        return dict(zip(keys, results))
+
     def _parse_content(
         self,
         file_path: str,
@@ -445,6 +488,17 @@ class ConsistencyAuditor:
     ) -> tuple[Tree, Language] | None:
         """Parse content string via tree-sitter.
         Returns (tree, language) or None for unsupported extensions."""
+        key = (file_path, content)
+        if key in self._parsed:
+            return self._parsed[key]
+        return self._parse_uncached(file_path, content)
+
+    def _parse_uncached(
+        self,
+        file_path: str,
+        content: str,
+    ) -> tuple[Tree, Language] | None:
+        """Parse content without consulting the per-audit results."""
         try:
             lang_name = get_language_for_file(file_path)
         except ValueError:
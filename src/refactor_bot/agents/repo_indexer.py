@@ -2,6 +2,9 @@
 
 import hashlib
 import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -9,29 +12,42 @@ from refactor_bot.models.schemas import FileInfo, ReactMetadata, RepoIndex
 from refactor_bot.utils.ast_parser import (
     detect_barrel_file,
     detect_server_component,
-    detect_suspense_boundary,
-    extract_exports,
-    extract_imports,
-    extract_symbols,
+    extract_file_data,
     parse_file,
 )
 
+# Parsed FileInfo results kept per indexer, keyed by content hash
+FILE_INDEX_CACHE_SIZE = 4096
+# Each spawned worker starts a fresh interpreter and re-imports the indexer
+# (about 3 s), so worker processes only take batches at least this large
+PARALLEL_INDEX_MIN_FILES = 2000
+
 
 class RepoIndexer:
     """Repository indexer for JavaScript/TypeScript codebases."""
 
-    def __init__(self, exclude_patterns: list[str] | None = None):
+    def __init__(self, exclude_patterns: list[str] | None = None, max_workers: int = 1):
         """Initialize the repo indexer.
 
         Args:
             exclude_patterns: List of directory/file patterns to exclude
+            max_workers: Worker processes for parsing uncached files; 1 parses
+                in-process
+
+        Raises:
+            ValueError: If max_workers is less than 1
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
         self.exclude_patterns = exclude_patterns or [
             "node_modules",
             "dist",
             ".git",
             "__pycache__",
         ]
+        # (file_path, repo_path, is_react, sha256) -> FileInfo before dependency resolution
+        self._file_cache: OrderedDict[tuple[str, str, bool, str], FileInfo] = OrderedDict()
 
     def index(self, repo_path: str) -> RepoIndex:
         """Index a repository and extract all symbols and dependencies.
@@ -53,23 +69,7 @@ class RepoIndexer:
         file_paths = self._discover_files(repo_path)
 
         # Index each file
-        files: list[FileInfo] = []
-        for file_path in file_paths:
-            try:
-                file_info = self._index_file(file_path, repo_path, is_react)
-                files.append(file_info)
-            except Exception as e:
-                # If parsing fails, create FileInfo with error
-                resolved_file = Path(file_path).resolve()
-                resolved_repo = Path(repo_path).resolve()
-                relative_path = str(resolved_file.relative_to(resolved_repo))
-                files.append(FileInfo(
-                    file_path=file_path,
-                    relative_path=relative_path,
-                    language="unknown",
-                    hash="",
-                    errors=[f"Failed to parse: {str(e)}"],
-                ))
+        files = self._index_files(file_paths, repo_path, is_react)
 
         # Build dependency graph
         dependency_graph = self._build_dependency_graph(files, repo_path)
@@ -160,8 +160,112 @@ class RepoIndexer:
             # If package.json is invalid, treat as non-React
             return False, None, None
 
+    def _index_files(
+        self, file_paths: list[str], repo_path: str, is_react: bool
+    ) -> list[FileInfo]:
+        """Index files in order, parsing uncached ones across worker processes.
+
+        Args:
+            file_paths: Absolute paths of the files to index
+            repo_path: Repository root path
+            is_react: Whether this is a React project
+
+        Returns:
+            One FileInfo per path, in input order
+        """
+        if self.max_workers == 1 or len(file_paths) < PARALLEL_INDEX_MIN_FILES:
+            return [
+                self._index_file_or_error(file_path, repo_path, is_react)
+                for file_path in file_paths
+            ]
+
+        # Serve unchanged files from the cache; the rest go to workers along
+        # with the bytes already read here, so no file is read twice
+        files: list[FileInfo | None] = []
+        pending: list[tuple[int, bytes]] = []
+        for i, file_path in enumerate(file_paths):
+            try:
+                source_bytes = Path(file_path).read_bytes()
+            except OSError:
+                files.append(self._index_file_or_error(file_path, repo_path, is_react))
+                continue
+            file_hash = hashlib.sha256(source_bytes).hexdigest()
+            cached = self._get_cached((file_path, repo_path, is_react, file_hash))
+            files.append(cached)
+            if cached is None:
+                pending.append((i, source_bytes))
+
+        if len(pending) < PARALLEL_INDEX_MIN_FILES:
+            for i, source_bytes in pending:
+                files[i] = self._index_file_or_error(
+                    file_paths[i], repo_path, is_react, source_bytes
+                )
+        else:
+            workers = min(self.max_workers, len(pending))
+            jobs = [
+                (file_paths[i], repo_path, is_react, source_bytes)
+                for i, source_bytes in pending
+            ]
+            # spawn: forking a process that may hold vector-store threads is unsafe
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                results = executor.map(
+                    _index_file_in_worker, jobs, chunksize=max(1, len(jobs) // (workers * 4))
+                )
+                for (i, _), file_info in zip(pending, results):
+                    files[i] = file_info
+                    if not file_info.errors:
+                        self._put_cached(
+                            (file_paths[i], repo_path, is_react, file_info.hash), file_info
+                        )
+
+        return [file_info for file_info in files if file_info is not None]
+
+    def _index_file_or_error(
+        self,
+        file_path: str,
+        repo_path: str,
+        is_react: bool,
+        source_bytes: bytes | None = None,
+    ) -> FileInfo:
+        """Index one file, recording a parse failure on the FileInfo instead of raising."""
+        try:
+            return self._index_file(file_path, repo_path, is_react, source_bytes)
+        except Exception as e:
+            # If parsing fails, create FileInfo with error
+            resolved_file = Path(file_path).resolve()
+            resolved_repo = Path(repo_path).resolve()
+            relative_path = str(resolved_file.relative_to(resolved_repo))
+            return FileInfo(
+                file_path=file_path,
+                relative_path=relative_path,
+                language="unknown",
+                hash="",
+                errors=[f"Failed to parse: {str(e)}"],
+            )
+
+    def _get_cached(self, cache_key: tuple[str, str, bool, str]) -> FileInfo | None:
+        """Return a copy of the cached FileInfo for cache_key, if any."""
+        cached = self._file_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._file_cache.move_to_end(cache_key)
+        # Callers mutate FileInfo (dependencies), so hand out a copy
+        return cached.model_copy(deep=True)
+
+    def _put_cached(self, cache_key: tuple[str, str, bool, str], file_info: FileInfo) -> None:
+        """Cache a copy of file_info, evicting the least recently used entries."""
+        self._file_cache[cache_key] = file_info.model_copy(deep=True)
+        while len(self._file_cache) > FILE_INDEX_CACHE_SIZE:
+            self._file_cache.popitem(last=False)
+
     def _index_file(
-        self, file_path: str, repo_path: str, is_react: bool
+        self,
+        file_path: str,
+        repo_path: str,
+        is_react: bool,
+        source_bytes: bytes | None = None,
     ) -> FileInfo:
         """Parse a single file and extract symbols, imports, exports.
 
@@ -169,20 +273,30 @@ class RepoIndexer:
             file_path: Absolute path to the file
             repo_path: Repository root path
             is_react: Whether this is a React project
+            source_bytes: File contents already read by the caller; the file
+                is read from disk when omitted
 
         Returns:
             FileInfo with all extracted data
-        """
-        # Parse the file
-        tree, language = parse_file(file_path)
 
-        # Read source bytes for hash and other operations
-        with open(file_path, "rb") as f:
-            source_bytes = f.read()
+        Unchanged files (same path and content hash) are served from a
+        per-indexer cache instead of being parsed again.
+        """
+        # Read source bytes once; hashing and parsing both use them
+        if source_bytes is None:
+            source_bytes = Path(file_path).read_bytes()
 
         # Compute hash
         file_hash = hashlib.sha256(source_bytes).hexdigest()
 
+        cache_key = (file_path, repo_path, is_react, file_hash)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        # Parse the file
+        tree, language = parse_file(file_path, source_bytes)
+
         # Get relative path (resolve both paths to handle symlinks)
         relative_path = str(Path(file_path).resolve().relative_to(Path(repo_path).resolve()))
 
@@ -190,12 +304,8 @@ class RepoIndexer:
         from refactor_bot.utils.ast_parser import get_language_for_file
         language_name = get_language_for_file(file_path)
 
-        # Extract symbols
-        symbols = extract_symbols(tree, language, file_path)
-
-        # Extract imports and exports
-        imports = extract_imports(tree, language)
-        exports = extract_exports(tree, language)
+        # Extract symbols, imports, exports and Suspense usage in one tree pass
+        symbols, imports, exports, has_suspense = extract_file_data(tree, language, file_path)
 
         # Initialize FileInfo
         file_info = FileInfo(
@@ -216,7 +326,7 @@ class RepoIndexer:
             react_metadata.is_barrel_file = detect_barrel_file(tree, language)
 
             # Check for Suspense
-            react_metadata.has_suspense_boundary = detect_suspense_boundary(tree, language)
+            react_metadata.has_suspense_boundary = has_suspense
 
             # Detect server component (only for TSX)
             if language_name == "tsx":
@@ -242,12 +352,14 @@ class RepoIndexer:
                     func_node = find_node_at_position(tree.root_node, symbol.start_byte)
                     if func_node:
                         # Check if it returns JSX (is a component)
-                        symbol.is_component = detect_react_component(func_node, source_bytes)
+                        symbol.is_component = detect_react_component(
+                            func_node, source_bytes, language
+                        )
                         if symbol.is_component:
                             has_any_component = True
 
                         # Detect hook usage
-                        symbol.uses_hooks = detect_hooks_usage(func_node, source_bytes)
+                        symbol.uses_hooks = detect_hooks_usage(func_node, source_bytes, language)
                         all_hooks.update(symbol.uses_hooks)
 
             # Set file-level flags
@@ -256,6 +368,7 @@ class RepoIndexer:
 
             file_info.react_metadata = react_metadata
 
+        self._put_cached(cache_key, file_info)
         return file_info
 
     def _build_dependency_graph(
@@ -342,3 +455,9 @@ class RepoIndexer:
                 return index_path
 
         return None
+
+
+def _index_file_in_worker(job: tuple[str, str, bool, bytes]) -> FileInfo:
+    """Index one file in a worker process (module-level so it can be pickled)."""
+    file_path, repo_path, is_react, source_bytes = job
+    return RepoIndexer()._index_file_or_error(file_path, repo_path, is_react, source_bytes)
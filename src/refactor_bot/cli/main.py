@@ -27,10 +27,14 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_TIMEOUT = 120
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 DEFAULT_VECTOR_STORE_DIR = "./data/embeddings"
+DEFAULT_INDEX_WORKERS = 1
 
 # Abort detection prefix — must match abort_node output in graph.py
 ABORT_PREFIX = "ABORT:"
 
+# Reused for every --output-json / PR artifact payload
+_JSON_ENCODER = json.JSONEncoder(indent=2, default=str)
+
 # Safe keys allowed in config output (no secrets)
 _SAFE_CONFIG_KEYS = frozenset({
     "directive", "repo_path", "max_retries", "model",
@@ -38,10 +42,18 @@ _SAFE_CONFIG_KEYS = frozenset({
     "skills", "allow_no_runner_pass", "llm_provider", "llm_fallback_provider",
     "allow_llm_fallback", "allow_no_runner_pass", "interactive_fallback",
     "output_pr_artifact",
-    "output_pr_artifact_format",
+    "output_pr_artifact_format", "index_workers",
 })
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build and return the argument parser."""
     parser = argparse.ArgumentParser(
@@ -143,6 +155,16 @@ def build_parser() -> argparse.ArgumentParser:
             f"Markdown renders schema version {PR_ARTIFACT_SCHEMA_VERSION}."
         ),
     )
+    parser.add_argument(
+        "--index-workers",
+        type=_positive_int,
+        default=DEFAULT_INDEX_WORKERS,
+        help=(
+            "Worker processes for parsing files while indexing (default: "
+            f"{DEFAULT_INDEX_WORKERS}); each worker costs a few seconds to start, "
+            "so this only helps on very large repositories"
+        ),
+    )
     return parser
 
 
@@ -204,7 +226,7 @@ def create_agents(args: argparse.Namespace) -> dict:
     retriever = Retriever(
         embedding_service=embedding_service, vector_store=vector_store
     )
-    indexer = RepoIndexer()
+    indexer = RepoIndexer(max_workers=args.index_workers)
     planner = Planner(
         api_key=api_key,
         model=args.model,
@@ -259,12 +281,52 @@ def format_result_json(result: dict) -> str:
         return obj
 
     prepared = {k: _serialize(v) for k, v in result.items()}
-    return json.dumps(prepared, indent=2, default=str)
+    return _JSON_ENCODER.encode(prepared)
+
+
+def _task_status(task, task_statuses: dict):
+    """Return a task's effective status, preferring the state's task_statuses."""
+    task_id = getattr(task, "task_id", None)
+    if task_id is None and isinstance(task, dict):
+        task_id = task.get("task_id")
+    if task_id in task_statuses:
+        return task_statuses[task_id]
+    status = getattr(task, "status", None)
+    if status is None and isinstance(task, dict):
+        status = task.get("status")
+    return status
+
+
+def _with_task_statuses(result: dict) -> dict:
+    """Return result with each task_tree entry carrying its effective status.
+
+    task_tree is frozen after planning, so status transitions live only in
+    task_statuses; this folds them back in for serialized output.
+    """
+    task_statuses = result.get("task_statuses") or {}
+    if not task_statuses:
+        return result
+
+    task_tree = []
+    for task in result.get("task_tree", []):
+        status = _task_status(task, task_statuses)
+        if hasattr(task, "model_copy"):
+            task = task.model_copy(update={"status": status})
+        elif isinstance(task, dict):
+            task = {**task, "status": status}
+        task_tree.append(task)
+    return {**result, "task_tree": task_tree}
+
+
+def _has_abort_error(errors: list) -> bool:
+    """Return True if any error is an abort_node summary."""
+    return any(str(err).startswith(ABORT_PREFIX) for err in errors)
 
 
 def _build_pr_artifact(directive: str, result: dict) -> PRArtifact:
     """Build a minimal PR-ready artifact from orchestrator result."""
     task_tree = result.get("task_tree", [])
+    task_statuses = result.get("task_statuses") or {}
     diffs = result.get("diffs", [])
     audit = result.get("audit_results")
     tests = result.get("test_results")
@@ -283,9 +345,7 @@ def _build_pr_artifact(directive: str, result: dict) -> PRArtifact:
     failed_count = 0
 
     for task in task_tree:
-        status = task.status
-        if status is None and isinstance(task, dict):
-            status = task.get("status")
+        status = _task_status(task, task_statuses)
         if isinstance(status, str):
             try:
                 status = TaskStatus(status)
@@ -302,7 +362,7 @@ def _build_pr_artifact(directive: str, result: dict) -> PRArtifact:
     tests_passed = bool(tests.passed) if isinstance(tests, TestReport) else False
     low_trust_pass = bool(getattr(tests, "low_trust_pass", False)) if isinstance(tests, TestReport) else False
 
-    if any(str(err).startswith(ABORT_PREFIX) for err in errors):
+    if _has_abort_error(errors):
         risk = PRRiskLevel.HIGH
     elif not audit_passed or not tests_passed:
         risk = PRRiskLevel.HIGH
@@ -468,11 +528,10 @@ def print_result_human(result: dict) -> None:
 
     tasks = result.get("task_tree", [])
     if tasks:
+        task_statuses = result.get("task_statuses") or {}
         status_counts: dict[str, int] = {}
         for task in tasks:
-            status = getattr(task, "status", None) or (
-                task.get("status") if isinstance(task, dict) else "unknown"
-            )
+            status = _task_status(task, task_statuses) or "unknown"
             status_counts[status] = status_counts.get(status, 0) + 1
         print(f"\nTasks ({len(tasks)} total):")
         for status, count in sorted(status_counts.items()):
@@ -503,9 +562,8 @@ def determine_exit_code(result: dict) -> int:
     errors = result.get("errors", [])
     if not errors:
         return EXIT_SUCCESS
-    for err in errors:
-        if str(err).startswith(ABORT_PREFIX):
-            return EXIT_GRAPH_ABORT
+    if _has_abort_error(errors):
+        return EXIT_GRAPH_ABORT
     return EXIT_ORCHESTRATOR_ERROR
 
 
@@ -561,6 +619,7 @@ def main(argv: list[str] | None = None) -> int:
         "allow_no_runner_pass": args.allow_no_runner_pass,
         "output_pr_artifact": args.output_pr_artifact,
         "output_pr_artifact_format": args.output_pr_artifact_format,
+        "index_workers": args.index_workers,
     }
 
     if args.dry_run:
@@ -588,7 +647,7 @@ def main(argv: list[str] | None = None) -> int:
         result = graph.invoke(state)
 
         if args.output_json:
-            print(format_result_json(result))
+            print(format_result_json(_with_task_statuses(result)))
         else:
             print_result_human(result)
 
@@ -6,6 +6,7 @@ from refactor_bot.models.report_models import (
     AuditReport,
     BreakingChange,
     FindingSeverity,
+    PR_ARTIFACT_SCHEMA_VERSION,
     PRArtifact,
     PRRiskLevel,
     TestReport,
@@ -32,6 +33,7 @@ __all__ = [
     "FileDiff",
     "FileInfo",
     "FindingSeverity",
+    "PR_ARTIFACT_SCHEMA_VERSION",
     "PRArtifact",
     "PRRiskLevel",
     "ReactMetadata",
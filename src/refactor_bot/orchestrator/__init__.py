@@ -1,8 +1,31 @@
 """LangGraph orchestrator package for the refactor pipeline."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from refactor_bot.orchestrator.exceptions import GraphBuildError, OrchestratorError
-from refactor_bot.orchestrator.graph import build_graph
-from refactor_bot.orchestrator.state import RefactorState, make_initial_state
+
+if TYPE_CHECKING:
+    from refactor_bot.orchestrator.graph import build_graph
+    from refactor_bot.orchestrator.state import RefactorState, make_initial_state
+
+# The graph imports langgraph and every agent, so it is imported on first
+# access; importing the exceptions alone stays cheap
+_LAZY_EXPORTS = {
+    "RefactorState": "refactor_bot.orchestrator.state",
+    "build_graph": "refactor_bot.orchestrator.graph",
+    "make_initial_state": "refactor_bot.orchestrator.state",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "GraphBuildError",
@@ -4,7 +4,11 @@ Wires RepoIndexer, Retriever, Planner, RefactorExecutor, ConsistencyAuditor,
 and TestValidator into a StateGraph with retry/skip/abort recovery logic.
 """
 
-from typing import Callable
+import contextvars
+import functools
+import itertools
+import logging
+from typing import Any, Callable, Iterator, NamedTuple
 
 from langgraph.graph import END, START, StateGraph
 
@@ -13,7 +17,7 @@ from refactor_bot.agents.planner import Planner
 from refactor_bot.agents.refactor_executor import RefactorExecutor
 from refactor_bot.agents.repo_indexer import RepoIndexer
 from refactor_bot.agents.test_validator import TestValidator
-from refactor_bot.models import AuditReport, TaskStatus, TestReport, TestRunResult
+from refactor_bot.models import AuditReport, TaskNode, TaskStatus, TestReport, TestRunResult
 from refactor_bot.orchestrator.exceptions import GraphBuildError
 from refactor_bot.skills.manager import activate_skills_for_repo
 from refactor_bot.skills.registry import registry
@@ -21,16 +25,39 @@ from refactor_bot.orchestrator.recovery import (
     compute_test_pass_rate,
     find_task_index,
     get_next_pending_task,
+    get_ready_tasks,
     get_task_diffs,
     next_task_or_end,
 )
 from refactor_bot.orchestrator.state import RefactorState
+from refactor_bot.rag.exceptions import EmbeddingError, VectorStoreError
 from refactor_bot.rag.retriever import Retriever
 
+logger = logging.getLogger(__name__)
+
 # Constants
 TEST_PASS_RATE_ABORT_THRESHOLD = 0.85
 PLAN_NODE_TOP_K = 10
 EXECUTE_NODE_TOP_K = 5
+EXECUTE_PREFETCH_BATCH_SIZE = 8
+COMPILED_GRAPH_CACHE_SIZE = 16
+
+
+class _GraphAgents(NamedTuple):
+    """Agent instances a cached compiled graph runs with."""
+
+    indexer: RepoIndexer
+    retriever: Retriever
+    planner: Planner
+    executor: RefactorExecutor
+    auditor: ConsistencyAuditor
+    validator: TestValidator
+
+
+# Agents for the graph run in progress; set by _BoundGraph around each run
+_BOUND_AGENTS: contextvars.ContextVar[_GraphAgents] = contextvars.ContextVar(
+    "refactor_bot_graph_agents"
+)
 
 
 def make_index_node(
@@ -78,7 +105,9 @@ def make_plan_node(planner: Planner, retriever: Retriever) -> Callable[[Refactor
     1. Calls retriever.query(state["directive"], top_k=10) -> context
     2. Stores context in context_bundles["planning"]
     3. Calls planner.decompose(directive, repo_index, context) -> list[TaskNode]
-    4. Returns {"task_tree": tasks, "context_bundles": updated, "active_rules": rule_ids}
+    4. Embeds all task descriptions in one retriever.query_batch call and
+       stores each task's execution context in context_bundles[task_id]
+    5. Returns {"task_tree": tasks, "context_bundles": updated, "active_rules": rule_ids}
 
     On error: returns {"errors": [str], "task_tree": []}
     """
@@ -95,17 +124,25 @@ def make_plan_node(planner: Planner, retriever: Retriever) -> Callable[[Refactor
                 context=context,
             )
 
-            # Collect rule IDs referenced by tasks
-            rule_ids: list[str] = []
-            for task in tasks:
-                rule_ids.extend(task.applicable_rules)
-            # Deduplicate while preserving order
-            seen: set[str] = set()
-            unique_rules: list[str] = []
-            for rule_id in rule_ids:
-                if rule_id not in seen:
-                    seen.add(rule_id)
-                    unique_rules.append(rule_id)
+            # Prefetch execution context for every task with a single embedding
+            # request. Retrieval failures are non-fatal: execute_node retrieves
+            # lazily.
+            if tasks:
+                try:
+                    task_contexts = retriever.query_batch(
+                        [task.description for task in tasks],
+                        top_k=EXECUTE_NODE_TOP_K,
+                    )
+                    updated_bundles.update(
+                        zip((task.task_id for task in tasks), task_contexts)
+                    )
+                except (EmbeddingError, VectorStoreError) as exc:
+                    logger.warning("plan_node context prefetch failed: %s", exc)
+
+            # Collect rule IDs referenced by tasks, deduplicated in first-seen order
+            unique_rules = list(
+                dict.fromkeys(rule_id for task in tasks for rule_id in task.applicable_rules)
+            )
 
             return {
                 "task_tree": tasks,
@@ -121,25 +158,57 @@ def make_plan_node(planner: Planner, retriever: Retriever) -> Callable[[Refactor
     return plan_node
 
 
+def _fetch_frontier_contexts(
+    task: TaskNode, state: RefactorState, retriever: Retriever
+) -> dict[str, list]:
+    """Retrieve execution context for task and the rest of the ready frontier.
+
+    Independent ready tasks are fetched in one batched retriever call so that
+    later execute_node passes find their context already in context_bundles.
+
+    Returns:
+        Mapping of task_id -> list[RetrievalResult], always including task.
+    """
+    frontier = [task] + [
+        ready
+        for ready in get_ready_tasks(state["task_tree"], state["task_statuses"])
+        if ready.task_id != task.task_id
+        and ready.task_id not in state["context_bundles"]
+    ][: EXECUTE_PREFETCH_BATCH_SIZE - 1]
+
+    if len(frontier) == 1:
+        return {task.task_id: retriever.query(task.description, top_k=EXECUTE_NODE_TOP_K)}
+
+    batched = retriever.query_batch(
+        [ready.description for ready in frontier],
+        top_k=EXECUTE_NODE_TOP_K,
+    )
+    return {ready.task_id: context for ready, context in zip(frontier, batched)}
+
+
 def make_execute_node(
     executor: RefactorExecutor, retriever: Retriever
 ) -> Callable[[RefactorState], dict]:
     """Factory: returns a node closure that executes the next pending task.
 
     The closure:
-    1. Calls get_next_pending_task(state["task_tree"]) to find eligible task
-    2. Calls retriever.query(task.description, top_k=5) -> context
+    1. Calls get_next_pending_task(task_tree, task_statuses) to find eligible task
+    2. Reuses context_bundles[task_id] if present (retries), else retrieves
+       context for the task — batched with other ready tasks via
+       retriever.query_batch, at most EXECUTE_PREFETCH_BATCH_SIZE tasks in
+       total — and stores it there
     3. Calls executor.execute(task, repo_index, context) -> diffs
-    4. Updates task status to IN_PROGRESS in task_tree
-    5. Returns {"diffs": diffs, "task_tree": updated, "current_task_index": idx}
+    4. Records task status IN_PROGRESS in task_statuses
+    5. Returns {"diffs": diffs, "task_statuses": {id: status}, "current_task_index": idx}
+       plus "context_bundles" when a new context was retrieved
 
-    On error: returns {"errors": [str], "diffs": [], "task_tree": updated_with_FAILED}
+    On error: returns {"errors": [str], "diffs": [], "task_statuses": {id: FAILED}}
 
     IMPORTANT: always returns diffs as list (never None) for Annotated reducer.
     """
 
     def execute_node(state: RefactorState) -> dict:
-        task = get_next_pending_task(state["task_tree"])
+        task = get_next_pending_task(state["task_tree"], state["task_statuses"])
 
         if task is None:
             return {
@@ -148,18 +217,16 @@ def make_execute_node(
                 "current_task_index": -1,
             }
 
-        updated_tree = list(state["task_tree"])
-        task_idx = find_task_index(updated_tree, task.task_id)
-
-        # Mark task as IN_PROGRESS (transient — no checkpointer in MVP;
-        # apply_node/retry_node will transition to COMPLETED/PENDING)
-        if task_idx >= 0:
-            updated_tree[task_idx] = updated_tree[task_idx].model_copy(
-                update={"status": TaskStatus.IN_PROGRESS}
-            )
+        task_idx = find_task_index(state["task_tree"], task.task_id)
 
         try:
-            context = retriever.query(task.description, top_k=EXECUTE_NODE_TOP_K)
+            update: dict = {}
+            context = state["context_bundles"].get(task.task_id)
+            if context is None:
+                fetched = _fetch_frontier_contexts(task, state, retriever)
+                context = fetched[task.task_id]
+                update["context_bundles"] = {**state["context_bundles"], **fetched}
+
             diffs = executor.execute(
                 task=task,
                 repo_index=state["repo_index"],
@@ -169,21 +236,19 @@ def make_execute_node(
             if diffs is None:
                 diffs = []
 
-            return {
+            # Mark task as IN_PROGRESS (transient — no checkpointer in MVP;
+            # apply_node/retry_node will transition to COMPLETED/PENDING)
+            update.update({
                 "diffs": diffs,
-                "task_tree": updated_tree,
+                "task_statuses": {task.task_id: TaskStatus.IN_PROGRESS},
                 "current_task_index": task_idx,
-            }
+            })
+            return update
         except Exception as exc:
-            # Mark task as FAILED
-            if task_idx >= 0:
-                updated_tree[task_idx] = updated_tree[task_idx].model_copy(
-                    update={"status": TaskStatus.FAILED}
-                )
             return {
                 "errors": [f"execute_node error for task {task.task_id}: {exc}"],
                 "diffs": [],
-                "task_tree": updated_tree,
+                "task_statuses": {task.task_id: TaskStatus.FAILED},
                 "current_task_index": task_idx,
             }
 
@@ -278,21 +343,23 @@ def make_validate_node(validator: TestValidator) -> Callable[[RefactorState], di
     return validate_node
 
 
+def _set_current_task_status(state: RefactorState, status: TaskStatus) -> dict:
+    """Return a task_statuses update for the current task, or {} if out of bounds."""
+    task_tree = state["task_tree"]
+    current_idx = state["current_task_index"]
+
+    if 0 <= current_idx < len(task_tree):
+        return {"task_statuses": {task_tree[current_idx].task_id: status}}
+    return {}
+
+
 def apply_node(state: RefactorState) -> dict:
     """Mark current task as COMPLETED.
 
     Returns:
-        {"task_tree": updated} with current task status set to COMPLETED.
+        {"task_statuses": {task_id: COMPLETED}} for the current task.
     """
-    updated_tree = list(state["task_tree"])
-    current_idx = state["current_task_index"]
-
-    if 0 <= current_idx < len(updated_tree):
-        updated_tree[current_idx] = updated_tree[current_idx].model_copy(
-            update={"status": TaskStatus.COMPLETED}
-        )
-
-    return {"task_tree": updated_tree}
+    return _set_current_task_status(state, TaskStatus.COMPLETED)
 
 
 def retry_node(state: RefactorState) -> dict:
@@ -302,25 +369,24 @@ def retry_node(state: RefactorState) -> dict:
     the re-execution has feedback for improvement.
 
     Returns:
-        {"retry_counts": updated, "task_tree": updated, "errors": [context_msg]}
+        {"retry_counts": updated, "task_statuses": {task_id: PENDING}, "errors": [context_msg]}
     """
-    updated_tree = list(state["task_tree"])
+    task_tree = state["task_tree"]
     current_idx = state["current_task_index"]
     updated_counts = dict(state["retry_counts"])
 
     context_messages: list[str] = []
+    update: dict = {}
 
-    if 0 <= current_idx < len(updated_tree):
-        task = updated_tree[current_idx]
+    if 0 <= current_idx < len(task_tree):
+        task = task_tree[current_idx]
         task_id = task.task_id
 
         # Increment retry count
         updated_counts[task_id] = updated_counts.get(task_id, 0) + 1
 
         # Mark task PENDING for re-execution
-        updated_tree[current_idx] = task.model_copy(
-            update={"status": TaskStatus.PENDING}
-        )
+        update["task_statuses"] = {task_id: TaskStatus.PENDING}
 
         # Build feedback context from audit results
         if state["audit_results"] is not None:
@@ -350,28 +416,18 @@ def retry_node(state: RefactorState) -> dict:
             "retry_node: current_task_index out of bounds, cannot retry"
         )
 
-    return {
-        "retry_counts": updated_counts,
-        "task_tree": updated_tree,
-        "errors": context_messages,
-    }
+    update["retry_counts"] = updated_counts
+    update["errors"] = context_messages
+    return update
 
 
 def skip_node(state: RefactorState) -> dict:
     """Mark current task as SKIPPED.
 
     Returns:
-        {"task_tree": updated} with current task status set to SKIPPED.
+        {"task_statuses": {task_id: SKIPPED}} for the current task.
     """
-    updated_tree = list(state["task_tree"])
-    current_idx = state["current_task_index"]
-
-    if 0 <= current_idx < len(updated_tree):
-        updated_tree[current_idx] = updated_tree[current_idx].model_copy(
-            update={"status": TaskStatus.SKIPPED}
-        )
-
-    return {"task_tree": updated_tree}
+    return _set_current_task_status(state, TaskStatus.SKIPPED)
 
 
 def abort_node(state: RefactorState) -> dict:
@@ -414,14 +470,49 @@ def abort_node(state: RefactorState) -> dict:
     return {"errors": [summary]}
 
 
+def _route_decision(
+    audit_passed: bool,
+    tests_passed: bool,
+    low_trust: bool,
+    pass_rate_below: bool,
+    retries_exhausted: bool,
+) -> str:
+    """Resolve one post-validate routing decision from its predicate values.
+
+    Used once per combination at import time to build DECIDE_ROUTES.
+    """
+    if low_trust:
+        return "abort"
+    if audit_passed and tests_passed:
+        return "apply"
+    if pass_rate_below:
+        return "abort"
+    if not retries_exhausted:
+        return "retry"
+    # Audit-only failures with passing tests skip the task; anything else aborts
+    if tests_passed:
+        return "skip"
+    return "abort"
+
+
+# Routing table indexed by
+# (audit_passed << 4) | (tests_passed << 3) | (low_trust << 2)
+# | (pass_rate_below << 1) | retries_exhausted
+DECIDE_ROUTES: tuple[str, ...] = tuple(
+    _route_decision(*bits) for bits in itertools.product((False, True), repeat=5)
+)
+
+
 def make_decide_fn() -> Callable[[RefactorState], str]:
     """Factory: returns router function for post-validate conditional edge.
 
-    Decision logic:
-    1. audit passed AND tests passed -> "apply"
-    2. test pass rate < 85% -> "abort"
-    3. retries < max_retries -> "retry"
-    4. else -> "abort" (retries exhausted)
+    Decision logic (precomputed in DECIDE_ROUTES):
+    1. low-trust test pass -> "abort"
+    2. audit passed AND tests passed -> "apply"
+    3. test pass rate < 85% -> "abort"
+    4. retries < max_retries -> "retry"
+    5. audit failed but tests passed -> "skip"
+    6. else -> "abort" (retries exhausted)
 
     Returns:
         Callable that returns one of: "apply", "retry", "skip", "abort"
@@ -432,50 +523,36 @@ def make_decide_fn() -> Callable[[RefactorState], str]:
         test_results = state["test_results"]
         current_idx = state["current_task_index"]
         task_tree = state["task_tree"]
-        retry_counts = state["retry_counts"]
-        max_retries = state["max_retries"]
 
         # If there is no valid current task, do not retry in-place repeatedly.
         # This can happen when planning produced zero tasks or state became desynced.
         if not (0 <= current_idx < len(task_tree)):
             return "abort"
 
-        # Determine current task id for retry count lookup
-        task_id = "unknown"
-        if 0 <= current_idx < len(task_tree):
-            task_id = task_tree[current_idx].task_id
-
-        # Check audit result
+        task_id = task_tree[current_idx].task_id
         audit_passed = audit_results is not None and audit_results.passed
 
-        # Check test result
-        tests_passed = test_results is not None and test_results.passed
-
-        if test_results is not None and getattr(test_results, "low_trust_pass", False):
-            return "abort"
+        if test_results is not None:
+            tests_passed = test_results.passed
+            low_trust = getattr(test_results, "low_trust_pass", False)
+            pass_rate_below = (
+                compute_test_pass_rate(test_results) < TEST_PASS_RATE_ABORT_THRESHOLD
+            )
+        else:
+            tests_passed = low_trust = pass_rate_below = False
 
-        if audit_passed and tests_passed:
-            return "apply"
+        retries_exhausted = (
+            state["retry_counts"].get(task_id, 0) >= state["max_retries"]
+        )
 
-        # Check test pass rate threshold for immediate abort
-        if test_results is not None:
-            pass_rate = compute_test_pass_rate(test_results)
-            if pass_rate < TEST_PASS_RATE_ABORT_THRESHOLD:
-                return "abort"
-
-        # Check retry budget first for audit failures
-        current_retries = retry_counts.get(task_id, 0)
-        if not audit_passed and test_results is not None and test_results.passed:
-            if current_retries < max_retries:
-                return "retry"
-            return "skip"
-
-        # Check retry budget
-        if current_retries < max_retries:
-            return "retry"
-
-        # Retries exhausted — abort
-        return "abort"
+        bits = (
+            (bool(audit_passed) << 4)
+            | (bool(tests_passed) << 3)
+            | (bool(low_trust) << 2)
+            | (pass_rate_below << 1)
+            | retries_exhausted
+        )
+        return DECIDE_ROUTES[bits]
 
     return decide_fn
 
@@ -502,6 +579,12 @@ def build_graph(
 
     No checkpointer (MVP — in-memory state only).
 
+    Compiled graphs are cached per agent-class set and skill selection, so
+    callers that create fresh agents for every run still reuse the compiled
+    graph instead of re-validating the topology. The nodes look the agents up
+    when they run; the returned graph binds this call's instances around
+    invoke, ainvoke and stream.
+
     Args:
         indexer: RepoIndexer agent instance.
         retriever: Retriever agent instance.
@@ -509,71 +592,146 @@ def build_graph(
         executor: RefactorExecutor agent instance.
         auditor: ConsistencyAuditor agent instance.
         validator: TestValidator agent instance.
+        selected_skills: Optional skill names to activate instead of auto-detection.
 
     Returns:
-        CompiledStateGraph ready to invoke.
+        Compiled graph ready to invoke, bound to the given agents.
 
     Raises:
         GraphBuildError: If graph construction fails.
     """
+    agents = _GraphAgents(indexer, retriever, planner, executor, auditor, validator)
     try:
-        graph = StateGraph(RefactorState)
-
-        # Create node closures
-        _index_node = make_index_node(indexer, retriever, selected_skills)
-        _plan_node = make_plan_node(planner, retriever)
-        _execute_node = make_execute_node(executor, retriever)
-        _audit_node = make_audit_node(auditor)
-        _validate_node = make_validate_node(validator)
-        _decide_fn = make_decide_fn()
-
-        # Register nodes
-        graph.add_node("index_node", _index_node)
-        graph.add_node("plan_node", _plan_node)
-        graph.add_node("execute_node", _execute_node)
-        graph.add_node("audit_node", _audit_node)
-        graph.add_node("validate_node", _validate_node)
-        graph.add_node("apply_node", apply_node)
-        graph.add_node("retry_node", retry_node)
-        graph.add_node("skip_node", skip_node)
-        graph.add_node("abort_node", abort_node)
-
-        # Linear edges: START -> index -> plan -> execute -> audit -> validate
-        graph.add_edge(START, "index_node")
-        graph.add_edge("index_node", "plan_node")
-        graph.add_edge("plan_node", "execute_node")
-        graph.add_edge("execute_node", "audit_node")
-        graph.add_edge("audit_node", "validate_node")
-
-        # Conditional edge: validate -> {apply, retry, abort}
-        graph.add_conditional_edges(
-            "validate_node",
-            _decide_fn,
-            {
-                "apply": "apply_node",
-                "retry": "retry_node",
-                "skip": "skip_node",
-                "abort": "abort_node",
-            },
+        compiled = _compile_graph(
+            tuple(agent.__class__ for agent in agents),
+            tuple(selected_skills) if selected_skills else None,
         )
+    except Exception as exc:
+        raise GraphBuildError(f"Failed to build orchestrator graph: {exc}") from exc
+    return _BoundGraph(compiled, agents)
 
-        # apply_node: loop back to execute or end
-        graph.add_conditional_edges(
-            "apply_node",
-            next_task_or_end,
-            {
-                "continue": "execute_node",
-                "done": END,
-            },
-        )
 
-        # retry_node: always goes back to execute
-        graph.add_edge("retry_node", "execute_node")
+class _BoundGraph:
+    """A cached compiled graph paired with the agent instances it runs with.
 
-        # abort_node: always ends
-        graph.add_edge("abort_node", END)
+    Other attributes (get_graph, nodes, ...) are forwarded to the compiled graph.
+    """
 
-        return graph.compile()
+    def __init__(self, compiled: Any, agents: _GraphAgents) -> None:
+        self.compiled = compiled
+        self.agents = agents
 
-    except Exception as exc:
-        raise GraphBuildError(f"Failed to build orchestrator graph: {exc}") from exc
+    def _bound_context(self) -> contextvars.Context:
+        context = contextvars.copy_context()
+        context.run(_BOUND_AGENTS.set, self.agents)
+        return context
+
+    def invoke(self, *args: Any, **kwargs: Any) -> Any:
+        return self._bound_context().run(self.compiled.invoke, *args, **kwargs)
+
+    async def ainvoke(self, *args: Any, **kwargs: Any) -> Any:
+        token = _BOUND_AGENTS.set(self.agents)
+        try:
+            return await self.compiled.ainvoke(*args, **kwargs)
+        finally:
+            _BOUND_AGENTS.reset(token)
+
+    def stream(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        context = self._bound_context()
+        chunks = context.run(self.compiled.stream, *args, **kwargs)
+        while True:
+            try:
+                yield context.run(next, chunks)
+            except StopIteration:
+                return
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.compiled, name)
+
+
+def _bound_node(
+    make_node: Callable[..., Callable[[RefactorState], dict]],
+    *agent_fields: str,
+    **options: Any,
+) -> Callable[[RefactorState], dict]:
+    """Wrap a node factory so the node is built from the agents bound to the run."""
+
+    def node(state: RefactorState) -> dict:
+        agents = _BOUND_AGENTS.get()
+        return make_node(*(getattr(agents, field) for field in agent_fields), **options)(state)
+
+    return node
+
+
+@functools.lru_cache(maxsize=COMPILED_GRAPH_CACHE_SIZE)
+def _compile_graph(
+    agent_types: tuple[type, ...],
+    selected_skills: tuple[str, ...] | None,
+):
+    """Construct and compile the StateGraph (cached by build_graph).
+
+    agent_types only keys the cache; nodes take the agent instances from
+    _BOUND_AGENTS when they run. Failures are not cached.
+    """
+    graph = StateGraph(RefactorState)
+
+    # Create node closures
+    _index_node = _bound_node(
+        make_index_node,
+        "indexer",
+        "retriever",
+        selected_skills=list(selected_skills) if selected_skills else None,
+    )
+    _plan_node = _bound_node(make_plan_node, "planner", "retriever")
+    _execute_node = _bound_node(make_execute_node, "executor", "retriever")
+    _audit_node = _bound_node(make_audit_node, "auditor")
+    _validate_node = _bound_node(make_validate_node, "validator")
+    _decide_fn = make_decide_fn()
+
+    # Register nodes
+    graph.add_node("index_node", _index_node)
+    graph.add_node("plan_node", _plan_node)
+    graph.add_node("execute_node", _execute_node)
+    graph.add_node("audit_node", _audit_node)
+    graph.add_node("validate_node", _validate_node)
+    graph.add_node("apply_node", apply_node)
+    graph.add_node("retry_node", retry_node)
+    graph.add_node("skip_node", skip_node)
+    graph.add_node("abort_node", abort_node)
+
+    # Linear edges: START -> index -> plan -> execute -> audit -> validate
+    graph.add_edge(START, "index_node")
+    graph.add_edge("index_node", "plan_node")
+    graph.add_edge("plan_node", "execute_node")
+    graph.add_edge("execute_node", "audit_node")
+    graph.add_edge("audit_node", "validate_node")
+
+    # Conditional edge: validate -> {apply, retry, abort}
+    graph.add_conditional_edges(
+        "validate_node",
+        _decide_fn,
+        {
+            "apply": "apply_node",
+            "retry": "retry_node",
+            "skip": "skip_node",
+            "abort": "abort_node",
+        },
+    )
+
+    # apply_node: loop back to execute or end
+    graph.add_conditional_edges(
+        "apply_node",
+        next_task_or_end,
+        {
+            "continue": "execute_node",
+            "done": END,
+        },
+    )
+
+    # retry_node: always goes back to execute
+    graph.add_edge("retry_node", "execute_node")
+
+    # abort_node: always ends
+    graph.add_edge("abort_node", END)
+
+    return graph.compile()
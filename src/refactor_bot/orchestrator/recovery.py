@@ -23,33 +23,73 @@ def find_task_index(task_tree: list[TaskNode], task_id: str) -> int:
     return -1
 
 
-def get_next_pending_task(task_tree: list[TaskNode]) -> TaskNode | None:
-    """Return first PENDING task whose dependencies are all COMPLETED.
+def get_task_status(
+    task: TaskNode, task_statuses: dict[str, TaskStatus] | None = None
+) -> TaskStatus:
+    """Return the effective status of a task.
 
-    Respects DAG ordering — does NOT just return the first PENDING by index.
-    A task is eligible only if every task_id listed in its dependencies
-    has status COMPLETED in the task_tree.
+    Args:
+        task: The TaskNode to look up.
+        task_statuses: Status overrides keyed by task_id (from state).
+
+    Returns:
+        The status recorded in task_statuses, falling back to task.status.
+    """
+    if task_statuses:
+        return task_statuses.get(task.task_id, task.status)
+    return task.status
+
+
+def get_ready_tasks(
+    task_tree: list[TaskNode],
+    task_statuses: dict[str, TaskStatus] | None = None,
+) -> list[TaskNode]:
+    """Return every PENDING task whose dependencies are all COMPLETED.
+
+    This is the current DAG frontier: tasks in it are independent of each
+    other and could run in any order.
 
     Args:
         task_tree: List of TaskNode objects representing the task DAG.
+        task_statuses: Status overrides keyed by task_id (from state).
 
     Returns:
-        The first eligible PENDING TaskNode, or None if no eligible task found.
+        Eligible PENDING TaskNodes in task_tree order.
     """
     completed_ids = {
         task.task_id
         for task in task_tree
-        if task.status == TaskStatus.COMPLETED
+        if get_task_status(task, task_statuses) == TaskStatus.COMPLETED
     }
 
-    for task in task_tree:
-        if task.status != TaskStatus.PENDING:
-            continue
+    return [
+        task
+        for task in task_tree
+        if get_task_status(task, task_statuses) == TaskStatus.PENDING
         # All dependencies must be completed
-        if all(dep_id in completed_ids for dep_id in task.dependencies):
-            return task
+        and all(dep_id in completed_ids for dep_id in task.dependencies)
+    ]
 
-    return None
+
+def get_next_pending_task(
+    task_tree: list[TaskNode],
+    task_statuses: dict[str, TaskStatus] | None = None,
+) -> TaskNode | None:
+    """Return first PENDING task whose dependencies are all COMPLETED.
+
+    Respects DAG ordering — does NOT just return the first PENDING by index.
+    A task is eligible only if every task_id listed in its dependencies
+    has status COMPLETED in the task_tree.
+
+    Args:
+        task_tree: List of TaskNode objects representing the task DAG.
+        task_statuses: Status overrides keyed by task_id (from state).
+
+    Returns:
+        The first eligible PENDING TaskNode, or None if no eligible task found.
+    """
+    ready = get_ready_tasks(task_tree, task_statuses)
+    return ready[0] if ready else None
 
 
 def get_current_task(state: RefactorState) -> TaskNode | None:
@@ -108,6 +148,6 @@ def next_task_or_end(state: RefactorState) -> str:
     Returns:
         "continue" if get_next_pending_task finds an eligible task, "done" otherwise.
     """
-    if get_next_pending_task(state["task_tree"]) is not None:
+    if get_next_pending_task(state["task_tree"], state["task_statuses"]) is not None:
         return "continue"
     return "done"
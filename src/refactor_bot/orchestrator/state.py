@@ -3,16 +3,31 @@
 import operator
 from typing import Annotated, TypedDict
 
-from refactor_bot.models import AuditReport, FileDiff, RepoIndex, TaskNode, TestReport
+from refactor_bot.models import (
+    AuditReport,
+    FileDiff,
+    RepoIndex,
+    TaskNode,
+    TaskStatus,
+    TestReport,
+)
 
 MAX_RETRIES_LIMIT = 10
 
 
+def merge_task_statuses(
+    left: dict[str, TaskStatus], right: dict[str, TaskStatus]
+) -> dict[str, TaskStatus]:
+    """Reducer for task_statuses: later status updates win per task_id."""
+    return {**left, **right}
+
+
 class RefactorState(TypedDict):
     """State for the LangGraph refactor orchestrator.
 
     Fields with Annotated[list, operator.add] reducers accumulate across nodes.
-    All other fields use default overwrite semantics.
+    task_statuses merges per-task status updates; task_tree itself is never
+    rewritten after planning. All other fields use default overwrite semantics.
     """
 
     # Input
@@ -28,6 +43,7 @@ class RefactorState(TypedDict):
     # Planning
     context_bundles: dict[str, list]
     task_tree: list[TaskNode]
+    task_statuses: Annotated[dict[str, TaskStatus], merge_task_statuses]
     active_rules: list[str]
     current_task_index: int
 
@@ -69,6 +85,7 @@ def make_initial_state(
         "embedding_stats": None,
         "context_bundles": {},
         "task_tree": [],
+        "task_statuses": {},
         "active_rules": [],
         "current_task_index": 0,
         "diffs": [],
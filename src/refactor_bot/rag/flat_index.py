@@ -0,0 +1,111 @@
+"""In-memory exact cosine index for small vector collections."""
+
+from typing import Any
+
+import numpy as np
+
+# Rows upcast per block when scoring a reduced-precision matrix
+SCORE_TILE_ROWS = 4096
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row of a float32 matrix, leaving all-zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    normalized: np.ndarray = matrix / norms
+    return normalized
+
+
+class FlatIndex:
+    """Brute-force cosine search over one contiguous float32 or float16 matrix.
+
+    For collections up to tens of thousands of vectors a single BLAS matmul
+    beats an HNSW lookup plus its storage round trip, and results are exact.
+    The index is immutable; rebuild it when the underlying records change.
+
+    With dtype=np.float16 the matrix takes half the memory; scoring upcasts
+    SCORE_TILE_ROWS rows at a time to float32 for the matmul.
+    """
+
+    def __init__(
+        self,
+        ids: list[str],
+        embeddings: Any,
+        documents: list[str | None],
+        metadatas: list[dict[str, Any]],
+        dtype: Any = np.float32,
+    ):
+        """Initialize the index.
+
+        Args:
+            ids: Record IDs, one per embedding row.
+            embeddings: Array-like of shape (n, dim).
+            documents: Source text per record.
+            metadatas: Raw (serialized) metadata per record.
+            dtype: Storage dtype for the normalized matrix (float32 or float16).
+        """
+        self.ids = ids
+        self.documents = documents
+        self.metadatas = metadatas
+        self._matrix = normalize_rows(np.asarray(embeddings, dtype=np.float32)).astype(
+            dtype, copy=False
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the embedding matrix."""
+        return self._matrix.nbytes
+
+    def _score(self, queries: np.ndarray) -> np.ndarray:
+        """Cosine scores of normalized queries against every stored row."""
+        if self._matrix.dtype == np.float32:
+            scores: np.ndarray = queries @ self._matrix.T
+            return scores
+
+        scores = np.empty((len(queries), len(self.ids)), dtype=np.float32)
+        for start in range(0, len(self.ids), SCORE_TILE_ROWS):
+            tile = self._matrix[start : start + SCORE_TILE_ROWS].astype(np.float32)
+            scores[:, start : start + len(tile)] = queries @ tile.T
+        return scores
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(
+        self, query_embeddings: list[list[float]], top_k: int
+    ) -> list[list[tuple[int, float]]]:
+        """Find the nearest records for each query embedding.
+
+        Args:
+            query_embeddings: Query vectors (need not be normalized).
+            top_k: Number of results to return per query.
+
+        Returns:
+            Per query, up to top_k (row index, cosine distance) pairs ordered
+            by ascending distance.
+        """
+        count = len(self.ids)
+        k = min(top_k, count)
+        if len(query_embeddings) == 0 or k <= 0:
+            return [[] for _ in query_embeddings]
+
+        queries = normalize_rows(np.asarray(query_embeddings, dtype=np.float32))
+        scores = self._score(queries)
+
+        results: list[list[tuple[int, float]]] = []
+        for row_scores in scores:
+            if k < count:
+                # Partial selection around the k-th best score; ties at the
+                # boundary go to the lowest row index so results are stable.
+                kth = np.partition(row_scores, count - k)[count - k]
+                above = np.flatnonzero(row_scores > kth)
+                tied = np.flatnonzero(row_scores == kth)[: k - len(above)]
+                candidates = np.concatenate((above, tied))
+            else:
+                candidates = np.arange(count)
+
+            order = candidates[np.lexsort((candidates, -row_scores[candidates]))]
+            results.append(
+                [(int(i), float(1.0 - row_scores[i])) for i in order.tolist()]
+            )
+        return results
@@ -1,13 +1,68 @@
 """Retriever for querying code symbols."""
 
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
 from refactor_bot.models import EmbeddingRecord, RepoIndex, RetrievalResult
 from refactor_bot.rag.exceptions import EmbeddingError, VectorStoreError
 
 from .embeddings import EmbeddingService
-from .vector_store import VectorStore
+from .vector_store import VectorStore, symbol_content_hash
 
 MAX_QUERY_LENGTH = 8000
 MAX_TOP_K = 1000
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+
+def _validate_query(query: str) -> None:
+    """Reject empty or oversized query strings."""
+    if not query or not query.strip():
+        raise ValueError("Query cannot be empty")
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValueError(f"Query exceeds maximum length of {MAX_QUERY_LENGTH}")
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse surrounding and repeated whitespace for cache lookups."""
+    return " ".join(query.split())
+
+
+def _to_retrieval_results(
+    raw_results: list[dict[str, Any]],
+    similarity_threshold: float,
+) -> list[RetrievalResult]:
+    """Convert raw vector-store rows into thresholded, sorted RetrievalResults."""
+    # Similarity from cosine distance, thresholded and ranked in one pass
+    distances = np.fromiter(
+        (raw.get("distance", 0.0) for raw in raw_results),
+        dtype=np.float64,
+        count=len(raw_results),
+    )
+    similarities = 1.0 - distances
+    kept = np.flatnonzero(similarities >= similarity_threshold)
+    # Stable sort keeps store order for equal similarities (descending)
+    order = kept[np.argsort(-similarities[kept], kind="stable")]
+
+    results = []
+    for i in order.tolist():
+        raw = raw_results[i]
+        metadata = raw.get("metadata", {})
+        results.append(
+            RetrievalResult(
+                id=raw["id"],
+                file_path=metadata.get("file_path", ""),
+                symbol=metadata.get("symbol", ""),
+                type=metadata.get("type", ""),
+                source_code=raw.get("document", ""),
+                distance=float(distances[i]),
+                similarity=float(similarities[i]),
+                metadata=metadata,
+            )
+        )
+
+    return results
 
 
 class Retriever:
@@ -22,6 +77,7 @@ class Retriever:
         """
         self.embedding_service = embedding_service
         self.vector_store = vector_store
+        self._query_embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
 
     def query(
         self,
@@ -39,57 +95,84 @@ class Retriever:
         Returns:
             List of RetrievalResult objects sorted by similarity (descending).
         """
+        return self.query_batch([query], top_k, similarity_threshold)[0]
+
+    def query_batch(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[list[RetrievalResult]]:
+        """Query for several strings with one embedding call and one store query.
+
+        Args:
+            queries: Query strings to search for.
+            top_k: Number of results to return per query.
+            similarity_threshold: Minimum similarity score (0-1) to include.
+
+        Returns:
+            One list of RetrievalResult objects per query, in input order,
+            each sorted by similarity (descending).
+        """
         # Validate inputs
-        if not query or not query.strip():
-            raise ValueError("Query cannot be empty")
-        if len(query) > MAX_QUERY_LENGTH:
-            raise ValueError(f"Query exceeds maximum length of {MAX_QUERY_LENGTH}")
+        for query in queries:
+            _validate_query(query)
         if not 1 <= top_k <= MAX_TOP_K:
             raise ValueError(f"top_k must be between 1 and {MAX_TOP_K}")
         if not 0.0 <= similarity_threshold <= 1.0:
             raise ValueError("similarity_threshold must be between 0.0 and 1.0")
 
+        if not queries:
+            return []
+        # Nothing indexed: skip the embedding request entirely
         try:
-            query_embedding = self.embedding_service.embed_texts([query])[0]
+            is_empty = self.vector_store.count() == 0
         except Exception as e:
-            raise EmbeddingError(f"Failed to embed query: {e}") from e
+            raise VectorStoreError(f"Failed to query vector store: {e}") from e
+        if is_empty:
+            return [[] for _ in queries]
+
+        query_embeddings = self._embed_queries(queries)
 
         try:
-            raw_results = self.vector_store.query_by_embedding(
-                query_embedding=query_embedding,
+            raw_batches = self.vector_store.query_by_embeddings(
+                query_embeddings=query_embeddings,
                 top_k=top_k,
             )
         except Exception as e:
             raise VectorStoreError(f"Failed to query vector store: {e}") from e
 
-        # Convert to RetrievalResult objects
-        results = []
-        for raw in raw_results:
-            # Calculate similarity from distance (cosine distance)
-            distance = raw.get("distance", 0.0)
-            similarity = 1.0 - distance
+        return [_to_retrieval_results(raw, similarity_threshold) for raw in raw_batches]
 
-            # Skip results below threshold
-            if similarity < similarity_threshold:
-                continue
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed queries, reusing cached vectors for repeated query strings.
 
-            metadata = raw.get("metadata", {})
-            result = RetrievalResult(
-                id=raw["id"],
-                file_path=metadata.get("file_path", ""),
-                symbol=metadata.get("symbol", ""),
-                type=metadata.get("type", ""),
-                source_code=raw.get("document", ""),
-                distance=distance,
-                similarity=similarity,
-                metadata=metadata,
-            )
-            results.append(result)
+        Uncached queries are embedded together in one embed_texts call. The
+        cache is LRU-bounded by QUERY_EMBEDDING_CACHE_SIZE.
+
+        Raises:
+            EmbeddingError: If the embedding service fails.
+        """
+        cache = self._query_embedding_cache
+        keys = [_normalize_query(query) for query in queries]
+        missing = [key for key in dict.fromkeys(keys) if key not in cache]
+
+        if missing:
+            try:
+                embeddings = self.embedding_service.embed_texts(missing)
+            except Exception as e:
+                raise EmbeddingError(f"Failed to embed query: {e}") from e
+            cache.update(zip(missing, embeddings))
+
+        vectors = []
+        for key in keys:
+            cache.move_to_end(key)
+            vectors.append(cache[key])
 
-        # Sort by similarity (descending)
-        results.sort(key=lambda r: r.similarity, reverse=True)
+        while len(cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
 
-        return results
+        return vectors
 
     def index_repo(self, repo_index: RepoIndex, force: bool = False) -> dict[str, int]:
         """Index a repository's symbols into the vector store.
@@ -99,69 +182,92 @@ class Retriever:
             force: If True, re-embed all symbols. If False, only embed changed symbols.
 
         Returns:
-            Statistics dictionary with keys: total, embedded, skipped, deleted.
+            Statistics dictionary with keys: total, embedded, skipped, deleted,
+            reused. "embedded" counts records written to the store; "reused"
+            counts those whose vector came from identical source code (already
+            stored, or repeated within this run) instead of a new API embedding.
         """
-        # Build list of EmbeddingRecord from repo_index
-        all_records: list[EmbeddingRecord] = []
+        existing_hashes = {} if force else self.vector_store.get_all_hashes()
+
+        # One pass over the index: count symbols, track live ids, and only
+        # build EmbeddingRecords for symbols that are new or whose hash changed
+        records_to_embed: list[EmbeddingRecord] = []
+        current_ids: set[str] = set()
+        total = 0
         for file_info in repo_index.files:
             for symbol_info in file_info.symbols:
                 record_id = f"{file_info.file_path}::{symbol_info.name}"
-                record = EmbeddingRecord(
-                    id=record_id,
-                    file_path=file_info.file_path,
-                    symbol=symbol_info.name,
-                    type=symbol_info.type,
-                    source_code=symbol_info.source_code,
-                    hash=file_info.hash,
-                    dependencies=file_info.dependencies,
-                    imports=file_info.imports,
-                )
-                all_records.append(record)
-
-        total = len(all_records)
+                total += 1
+                current_ids.add(record_id)
+                if force or existing_hashes.get(record_id) != file_info.hash:
+                    records_to_embed.append(
+                        EmbeddingRecord(
+                            id=record_id,
+                            file_path=file_info.file_path,
+                            symbol=symbol_info.name,
+                            type=symbol_info.type,
+                            source_code=symbol_info.source_code,
+                            hash=file_info.hash,
+                            dependencies=file_info.dependencies,
+                            imports=file_info.imports,
+                        )
+                    )
+
         embedded = 0
-        skipped = 0
         deleted = 0
+        reused = 0
+
+        # Embed changed/new records (all records when force=True)
+        if records_to_embed:
+            reused = self._embed_records(records_to_embed, reuse_stored=not force)
+            self.vector_store.upsert(records_to_embed)
+            embedded = len(records_to_embed)
+
+        skipped = total - embedded
 
-        if force:
-            # Re-embed all records
-            embedded_records = self.embedding_service.embed_symbols(all_records)
-            self.vector_store.upsert(embedded_records)
-            embedded = len(embedded_records)
-        else:
-            # Get existing hashes
-            existing_hashes = self.vector_store.get_all_hashes()
-
-            # Determine which records need embedding
-            records_to_embed: list[EmbeddingRecord] = []
-            current_ids = set()
-
-            for record in all_records:
-                current_ids.add(record.id)
-                existing_hash = existing_hashes.get(record.id)
-
-                # Embed if new or hash changed
-                if existing_hash != record.hash:
-                    records_to_embed.append(record)
-
-            # Embed changed/new records
-            if records_to_embed:
-                embedded_records = self.embedding_service.embed_symbols(records_to_embed)
-                self.vector_store.upsert(embedded_records)
-                embedded = len(embedded_records)
-
-            skipped = total - embedded
-
-            # Delete removed records
-            existing_ids = set(existing_hashes.keys())
-            ids_to_delete = list(existing_ids - current_ids)
-            if ids_to_delete:
-                self.vector_store.delete(ids_to_delete)
-                deleted = len(ids_to_delete)
+        # Delete removed records
+        ids_to_delete = list(existing_hashes.keys() - current_ids)
+        if ids_to_delete:
+            self.vector_store.delete(ids_to_delete)
+            deleted = len(ids_to_delete)
 
         return {
             "total": total,
             "embedded": embedded,
             "skipped": skipped,
             "deleted": deleted,
+            "reused": reused,
         }
+
+    def _embed_records(self, records: list[EmbeddingRecord], reuse_stored: bool) -> int:
+        """Set embedding_vector on records, embedding each distinct source once.
+
+        Records are grouped by symbol_content_hash. When reuse_stored is True,
+        groups whose source is already in the vector store take that vector;
+        the rest are embedded with one representative per group.
+
+        Returns:
+            Number of records that did not need a new embedding.
+        """
+        groups: dict[str, list[EmbeddingRecord]] = {}
+        for record in records:
+            groups.setdefault(symbol_content_hash(record.source_code), []).append(record)
+
+        stored = (
+            self.vector_store.get_embeddings_by_content_hash(list(groups))
+            if reuse_stored
+            else {}
+        )
+
+        to_embed = [
+            group[0] for content_hash, group in groups.items() if content_hash not in stored
+        ]
+        if to_embed:
+            self.embedding_service.embed_symbols(to_embed)
+
+        for content_hash, group in groups.items():
+            vector = stored.get(content_hash, group[0].embedding_vector)
+            for record in group:
+                record.embedding_vector = vector
+
+        return len(records) - len(to_embed)
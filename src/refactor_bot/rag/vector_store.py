@@ -1,12 +1,41 @@
 """Vector store using ChromaDB."""
 
+import functools
+import hashlib
 import json
 import os
 from typing import Any, Optional, cast
 
 import chromadb
+import numpy as np
 
 from refactor_bot.models import EmbeddingRecord
+from refactor_bot.rag.flat_index import FlatIndex, normalize_rows
+
+# Chroma throughput flattens out past a few hundred records per call
+UPSERT_BATCH_SIZE = 200
+HASH_CACHE_SUFFIX = ".hashes.json"
+JSON_FIELD_CACHE_SIZE = 4096
+# Collections up to this size are queried from an in-memory FlatIndex
+FLAT_INDEX_MAX_RECORDS = 20_000
+
+
+# One Chroma client per persist directory for the life of the process
+_CLIENT_CACHE: dict[str, Any] = {}
+
+
+def _get_client(persist_dir: str) -> Any:
+    """Return the shared PersistentClient for persist_dir, creating it once."""
+    key = os.path.abspath(persist_dir)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = chromadb.PersistentClient(path=persist_dir)
+    return client
+
+
+def symbol_content_hash(source_code: str) -> str:
+    """Hash a symbol's source so identical code can share one embedding."""
+    return hashlib.sha256(source_code.encode("utf-8")).hexdigest()
 
 
 def _validate_file_path(file_path: str) -> None:
@@ -15,12 +44,20 @@ def _validate_file_path(file_path: str) -> None:
         raise ValueError(f"Invalid file_path: path traversal detected in '{file_path}'")
 
 
+@functools.lru_cache(maxsize=JSON_FIELD_CACHE_SIZE)
+def _decode_json_field(encoded: str) -> Any:
+    """Decode a JSON metadata string; results from the same file repeat often."""
+    return json.loads(encoded)
+
+
 def _deserialize_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     """Deserialize JSON-encoded metadata fields."""
     result = dict(metadata)
     for field in ("dependencies", "imports"):
         if field in result and isinstance(result[field], str):
-            result[field] = json.loads(result[field])
+            decoded = _decode_json_field(result[field])
+            # Hand each caller its own list so cached values stay unmodified
+            result[field] = list(decoded) if isinstance(decoded, list) else decoded
     return result
 
 
@@ -31,24 +68,45 @@ class VectorStore:
         self,
         persist_dir: str = "./data/embeddings",
         collection_name: str = "symbols",
+        flat_index_max_records: int = FLAT_INDEX_MAX_RECORDS,
+        flat_index_dtype: Any = np.float32,
     ):
         """Initialize the vector store.
 
         Args:
             persist_dir: Directory to persist the ChromaDB data.
             collection_name: Name of the collection to use.
+            flat_index_max_records: Largest collection served from the
+                in-memory FlatIndex; bigger ones (or 0) query Chroma directly.
+            flat_index_dtype: FlatIndex storage dtype; np.float16 halves its
+                memory at a cosine error around 1e-3.
         """
-        self.client = chromadb.PersistentClient(path=persist_dir)
+        self.client = _get_client(persist_dir)
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
             metadata={"hnsw:space": "cosine"},
         )
+        self.flat_index_max_records = flat_index_max_records
+        self.flat_index_dtype = flat_index_dtype
+        self._flat_index: FlatIndex | None = None
+        self._count_cache: int | None = None
+        self._hash_cache: dict[str, str] | None = None
+        self._hash_cache_path = os.path.join(
+            persist_dir, f"{collection_name}{HASH_CACHE_SUFFIX}"
+        )
 
-    def upsert(self, records: list[EmbeddingRecord]) -> None:
+    def upsert(
+        self,
+        records: list[EmbeddingRecord],
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> None:
         """Insert or update embedding records in the vector store.
 
+        Records are sent to Chroma in slices of at most batch_size.
+
         Args:
             records: List of EmbeddingRecord instances to upsert.
+            batch_size: Maximum number of records per collection.upsert call.
 
         Raises:
             ValueError: If any record has an invalid file_path.
@@ -58,30 +116,59 @@ class VectorStore:
         if not valid_records:
             return
 
-        for r in valid_records:
-            _validate_file_path(r.file_path)
-
-        ids = [r.id for r in valid_records]
-        embeddings = cast(list[list[float]], [r.embedding_vector for r in valid_records])
-        documents = [r.source_code for r in valid_records]
-        metadatas: list[dict[str, Any]] = [
-            {
+        # Build the columns in a single pass; embeddings go to Chroma as one
+        # contiguous float32 matrix instead of a list of Python float lists.
+        n = len(valid_records)
+        dim = len(cast(list[float], valid_records[0].embedding_vector))
+        ids: list[str] = [""] * n
+        documents: list[str] = [""] * n
+        metadatas: list[dict[str, Any]] = [{}] * n
+        embeddings = np.empty((n, dim), dtype=np.float32)
+        # Symbols of one file share dependency/import lists; encode each once
+        json_cache: dict[tuple[str, ...], str] = {}
+
+        def encode(values: list[str]) -> str:
+            key = tuple(values)
+            encoded = json_cache.get(key)
+            if encoded is None:
+                encoded = json_cache[key] = json.dumps(values)
+            return encoded
+
+        validated_paths: set[str] = set()
+
+        for i, r in enumerate(valid_records):
+            # Symbols of one file share a path; validate each path once
+            if r.file_path not in validated_paths:
+                _validate_file_path(r.file_path)
+                validated_paths.add(r.file_path)
+            ids[i] = r.id
+            documents[i] = r.source_code
+            metadatas[i] = {
                 "file_path": r.file_path,
                 "symbol": r.symbol,
                 "type": r.type,
                 "hash": r.hash,
-                "dependencies": json.dumps(r.dependencies),
-                "imports": json.dumps(r.imports),
+                "content_hash": symbol_content_hash(r.source_code),
+                "dependencies": encode(r.dependencies),
+                "imports": encode(r.imports),
             }
-            for r in valid_records
-        ]
-
-        self.collection.upsert(
-            ids=ids,
-            embeddings=embeddings,  # type: ignore[arg-type]
-            documents=documents,
-            metadatas=metadatas,  # type: ignore[arg-type]
-        )
+            embeddings[i] = cast(list[float], r.embedding_vector)
+
+        # Store unit vectors so cosine distance is exactly 1 - dot product
+        embeddings = normalize_rows(embeddings)
+
+        for start in range(0, n, batch_size):
+            end = start + batch_size
+            self.collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],  # type: ignore[arg-type]
+            )
+
+        self._flat_index = None
+        self._count_cache = None
+        self._update_hash_cache(upserted={r.id: r.hash for r in valid_records})
 
     def delete(self, ids: list[str]) -> None:
         """Delete records by their IDs.
@@ -91,6 +178,15 @@ class VectorStore:
         """
         if ids:
             self.collection.delete(ids=ids)
+            self._flat_index = None
+            self._count_cache = None
+            self._update_hash_cache(deleted=ids)
+
+    def count(self) -> int:
+        """Return the number of records, cached until the next upsert/delete."""
+        if self._count_cache is None:
+            self._count_cache = self.collection.count()
+        return self._count_cache
 
     def get_by_file(self, file_path: str) -> list[dict[str, Any]]:
         """Get all records for a specific file.
@@ -100,12 +196,16 @@ class VectorStore:
 
         Returns:
             List of records as dictionaries with deserialized metadata.
+            Embeddings are not fetched, so "embedding" is None.
 
         Raises:
             ValueError: If file_path contains traversal sequences.
         """
         _validate_file_path(file_path)
-        results = self.collection.get(where={"file_path": file_path})
+        results = self.collection.get(
+            where={"file_path": file_path},
+            include=["documents", "metadatas"],
+        )
 
         records: list[dict[str, Any]] = []
         if results["ids"]:
@@ -125,6 +225,38 @@ class VectorStore:
 
         return records
 
+    def get_embeddings_by_content_hash(
+        self, content_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        """Look up stored embeddings for symbols with the given source hashes.
+
+        Args:
+            content_hashes: symbol_content_hash values to look up.
+
+        Returns:
+            Mapping of content hash -> embedding vector for hashes already stored.
+        """
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(content_hashes))
+
+        for start in range(0, len(unique), UPSERT_BATCH_SIZE):
+            results = self.collection.get(
+                where={"content_hash": {"$in": unique[start : start + UPSERT_BATCH_SIZE]}},
+                include=["embeddings", "metadatas"],
+            )
+            ids = results["ids"]
+            embeds = results["embeddings"]
+            metas = results["metadatas"]
+            if not ids or embeds is None or metas is None:
+                continue
+
+            for i in range(len(ids)):
+                content_hash = metas[i].get("content_hash")
+                if isinstance(content_hash, str) and content_hash not in found:
+                    found[content_hash] = np.asarray(embeds[i], dtype=np.float32).tolist()
+
+        return found
+
     def query_by_embedding(
         self,
         query_embedding: list[float],
@@ -141,38 +273,132 @@ class VectorStore:
         Returns:
             List of query results as dictionaries with deserialized metadata.
         """
+        return self.query_by_embeddings([query_embedding], top_k=top_k, where=where)[0]
+
+    def query_by_embeddings(
+        self,
+        query_embeddings: list[list[float]],
+        top_k: int = 10,
+        where: Optional[dict[str, Any]] = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Query the vector store with several embedding vectors in one request.
+
+        Unfiltered queries against collections of at most
+        flat_index_max_records are answered exactly from an in-memory
+        FlatIndex; everything else goes to Chroma.
+
+        Args:
+            query_embeddings: Embedding vectors to search for.
+            top_k: Number of results to return per query.
+            where: Optional filter criteria applied to every query.
+
+        Returns:
+            One list of query results per input embedding, in input order.
+        """
+        if not query_embeddings:
+            return []
+        count = self.count()
+        if count == 0:
+            return [[] for _ in query_embeddings]
+
+        flat_index = self._get_flat_index() if where is None else None
+        if flat_index is not None:
+            return [
+                [
+                    {
+                        "id": flat_index.ids[i],
+                        "document": flat_index.documents[i],
+                        "metadata": _deserialize_metadata(flat_index.metadatas[i]),
+                        "distance": distance,
+                    }
+                    for i, distance in hits
+                ]
+                for hits in flat_index.search(query_embeddings, top_k)
+            ]
+
         results = self.collection.query(
-            query_embeddings=[query_embedding],  # type: ignore[arg-type]
-            n_results=top_k,
+            query_embeddings=normalize_rows(np.asarray(query_embeddings, dtype=np.float32)),
+            n_results=min(top_k, count),
             where=where,
         )
 
-        records: list[dict[str, Any]] = []
-        result_ids = results["ids"]
-        if result_ids and result_ids[0]:
-            row_ids = result_ids[0]
-            row_docs = results["documents"][0] if results["documents"] else [None] * len(row_ids)  # type: ignore[index]
-            row_metas = results["metadatas"][0] if results["metadatas"] else [{}] * len(row_ids)  # type: ignore[index]
-            row_dists = results["distances"][0] if results["distances"] else [0.0] * len(row_ids)  # type: ignore[index]
-
-            for i in range(len(row_ids)):
-                metadata = _deserialize_metadata(row_metas[i])  # type: ignore[arg-type]
-                records.append({
-                    "id": row_ids[i],
-                    "document": row_docs[i],
-                    "metadata": metadata,
-                    "distance": row_dists[i],
-                })
+        batches: list[list[dict[str, Any]]] = []
+        result_ids = results["ids"] or []
+        documents = results["documents"]
+        metadatas = results["metadatas"]
+        distances = results["distances"]
+        for row in range(len(query_embeddings)):
+            records: list[dict[str, Any]] = []
+            row_ids = result_ids[row] if row < len(result_ids) else []
+            if row_ids:
+                row_docs = documents[row] if documents else [None] * len(row_ids)
+                row_metas = metadatas[row] if metadatas else [{}] * len(row_ids)
+                row_dists = distances[row] if distances else [0.0] * len(row_ids)
+
+                for i in range(len(row_ids)):
+                    metadata = _deserialize_metadata(row_metas[i])  # type: ignore[arg-type]
+                    records.append({
+                        "id": row_ids[i],
+                        "document": row_docs[i],
+                        "metadata": metadata,
+                        "distance": row_dists[i],
+                    })
+            batches.append(records)
+
+        return batches
+
+    def _get_flat_index(self) -> FlatIndex | None:
+        """Return the in-memory index, loading it if the collection is small enough."""
+        if self._flat_index is None:
+            count = self.count()
+            if count == 0 or count > self.flat_index_max_records:
+                return None
+
+            results = self.collection.get(include=["embeddings", "documents", "metadatas"])
+            ids = results["ids"]
+            self._flat_index = FlatIndex(
+                ids=ids,
+                embeddings=results["embeddings"],
+                documents=results["documents"] or [None] * len(ids),  # type: ignore[arg-type]
+                metadatas=results["metadatas"] or [{}] * len(ids),  # type: ignore[arg-type]
+                dtype=self.flat_index_dtype,
+            )
 
-        return records
+        return self._flat_index
 
     def get_all_hashes(self) -> dict[str, str]:
         """Get all record IDs and their hashes.
 
+        Served from an in-memory cache kept current by upsert/delete. On first
+        use the cache is loaded from the on-disk sidecar when its size still
+        matches the collection, otherwise rebuilt by scanning the collection.
+
         Returns:
             Dictionary mapping record ID to hash.
         """
-        results = self.collection.get()
+        if self._hash_cache is None:
+            cached = self._load_hash_sidecar()
+            if cached is None or len(cached) != self.count():
+                cached = self._scan_hashes()
+                self._hash_cache = cached
+                self._write_hash_sidecar()
+            else:
+                self._hash_cache = cached
+
+        return dict(self._hash_cache)
+
+    def invalidate_hash_cache(self) -> None:
+        """Drop the in-memory and on-disk hash cache so the next read rescans."""
+        self._hash_cache = None
+        try:
+            os.remove(self._hash_cache_path)
+        except FileNotFoundError:
+            pass
+
+    def _scan_hashes(self) -> dict[str, str]:
+        """Read every record's hash from collection metadata."""
+        # Metadata only: skip documents and embeddings for every record
+        results = self.collection.get(include=["metadatas"])
 
         hashes: dict[str, str] = {}
         if results["ids"]:
@@ -185,3 +411,42 @@ class VectorStore:
                     hashes[record_id] = hash_value
 
         return hashes
+
+    def _update_hash_cache(
+        self,
+        upserted: Optional[dict[str, str]] = None,
+        deleted: Optional[list[str]] = None,
+    ) -> None:
+        """Apply a write to the hash cache, or drop a sidecar it would make stale."""
+        if self._hash_cache is None:
+            self.invalidate_hash_cache()
+            return
+
+        if upserted:
+            self._hash_cache.update(upserted)
+        for record_id in deleted or []:
+            self._hash_cache.pop(record_id, None)
+        self._write_hash_sidecar()
+
+    def _load_hash_sidecar(self) -> dict[str, str] | None:
+        """Read the persisted hash cache, or None if missing or unreadable."""
+        try:
+            with open(self._hash_cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_hash_sidecar(self) -> None:
+        """Persist the hash cache atomically next to the Chroma data."""
+        tmp_path = f"{self._hash_cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._hash_cache, f)
+            os.replace(tmp_path, self._hash_cache_path)
+        except OSError:
+            # The sidecar is only an optimization; never leave a stale one.
+            try:
+                os.remove(self._hash_cache_path)
+            except OSError:
+                pass
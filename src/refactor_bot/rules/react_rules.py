@@ -2,7 +2,7 @@
 
 from refactor_bot.rules.rule_engine import ReactRule
 
-REACT_RULES = [
+REACT_RULES: tuple[ReactRule, ...] = (
     # Category 1: Eliminating Waterfalls (CRITICAL)
     ReactRule(
         rule_id="async-defer-await",
@@ -552,4 +552,4 @@ async function submitForm(formData: FormData) {
 }
 """,
     ),
-]
+)
@@ -1,11 +1,63 @@
 """Rule engine for React refactoring patterns."""
 
-from pydantic import BaseModel
+import functools
+import re
+from collections.abc import Sequence
+
+from pydantic import BaseModel, ConfigDict
+
+RULE_SELECTION_CACHE_SIZE = 256
+
+HIGH_RULE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "server-auth-actions": ("auth", "authentication", "authorization", "security"),
+    "server-cache-react": ("cache", "caching", "dedupe", "deduplication"),
+    "server-cache-lru": ("cache", "caching", "lru", "persistent"),
+    "server-dedup-props": ("props", "duplicate", "redundant"),
+    "server-serialization": ("serialize", "serialization", "hydration"),
+    "server-parallel-fetching": ("parallel", "layout", "waterfall"),
+    "server-after-nonblocking": ("async", "nonblocking", "after", "analytics"),
+}
+
+
+def _build_keyword_index() -> tuple[re.Pattern[str], dict[str, tuple[str, ...]]]:
+    """Compile HIGH_RULE_KEYWORDS into one substring-matching regex.
+
+    The zero-width lookahead tries every position, and longest-first
+    alternation reports the longest keyword there; each keyword's rule set
+    also carries the rules of keywords that are its prefixes, so the result
+    equals a plain substring check per keyword.
+    """
+    rules_by_keyword: dict[str, list[str]] = {}
+    for rule_id, keywords in HIGH_RULE_KEYWORDS.items():
+        for keyword in keywords:
+            rules_by_keyword.setdefault(keyword, []).append(rule_id)
+
+    expanded = {
+        keyword: tuple(
+            dict.fromkeys(
+                rule_id
+                for other, rule_ids in rules_by_keyword.items()
+                if keyword.startswith(other)
+                for rule_id in rule_ids
+            )
+        )
+        for keyword in rules_by_keyword
+    }
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(expanded, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))"), expanded
+
+
+_HIGH_RULE_KEYWORD_RE, _HIGH_RULES_BY_KEYWORD = _build_keyword_index()
 
 
 class ReactRule(BaseModel):
     """Represents a single React refactoring rule."""
 
+    # Rules are shared read-only table entries
+    model_config = ConfigDict(frozen=True)
+
     rule_id: str
     category: str
     priority: str
@@ -17,7 +69,7 @@ class ReactRule(BaseModel):
 def select_applicable_rules(
     directive: str,
     is_react_project: bool,
-    all_rules: list[ReactRule] | None = None,
+    all_rules: Sequence[ReactRule] | None = None,
 ) -> list[str]:
     """Select applicable rules based on directive and project type.
 
@@ -32,31 +84,34 @@ def select_applicable_rules(
     if not is_react_project:
         return []
 
+    # Always include CRITICAL rules for React projects
     if all_rules is None:
-        from refactor_bot.rules.react_rules import REACT_RULES
+        critical_rules = _default_critical_rule_ids()
+    else:
+        critical_rules = tuple(
+            rule.rule_id for rule in all_rules if rule.priority == "CRITICAL"
+        )
 
-        all_rules = REACT_RULES
+    # Include HIGH priority rules whose keywords appear in the directive
+    high_rules = _match_high_rules(directive.lower())
 
-    # Always include CRITICAL rules for React projects
-    critical_rules = [rule.rule_id for rule in all_rules if rule.priority == "CRITICAL"]
-
-    # Check for keywords to include HIGH priority rules
-    directive_lower = directive.lower()
-
-    high_rule_keywords = {
-        "server-auth-actions": ["auth", "authentication", "authorization", "security"],
-        "server-cache-react": ["cache", "caching", "dedupe", "deduplication"],
-        "server-cache-lru": ["cache", "caching", "lru", "persistent"],
-        "server-dedup-props": ["props", "duplicate", "redundant"],
-        "server-serialization": ["serialize", "serialization", "hydration"],
-        "server-parallel-fetching": ["parallel", "layout", "waterfall"],
-        "server-after-nonblocking": ["async", "nonblocking", "after", "analytics"],
-    }
+    # Combine critical and matched high priority rules (deduplicated)
+    return list(dict.fromkeys(critical_rules + high_rules))
 
-    high_rules = []
-    for rule_id, keywords in high_rule_keywords.items():
-        if any(keyword in directive_lower for keyword in keywords):
-            high_rules.append(rule_id)
 
-    # Combine critical and matched high priority rules (deduplicated)
-    return list(set(critical_rules + high_rules))
+@functools.cache
+def _default_critical_rule_ids() -> tuple[str, ...]:
+    """CRITICAL rule IDs of the built-in REACT_RULES table, computed once."""
+    from refactor_bot.rules.react_rules import REACT_RULES
+
+    return tuple(rule.rule_id for rule in REACT_RULES if rule.priority == "CRITICAL")
+
+
+@functools.lru_cache(maxsize=RULE_SELECTION_CACHE_SIZE)
+def _match_high_rules(directive_lower: str) -> tuple[str, ...]:
+    """HIGH rule IDs whose keywords occur in the directive, in one regex pass."""
+    return tuple(
+        rule_id
+        for match in _HIGH_RULE_KEYWORD_RE.finditer(directive_lower)
+        for rule_id in _HIGH_RULES_BY_KEYWORD[match.group(1)]
+    )
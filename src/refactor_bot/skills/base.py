@@ -2,13 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 from ..models.skill_models import SkillMetadata
 from ..models.task_models import TaskNode
 from ..models.skill_models import RefactorRule
 
 
-@runtime_checkable
 class Skill(Protocol):
     """Core Skill Protocol – matches Vercel Agent Skills 2026 standard."""
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import importlib
+import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from .base import Skill
 from ..models.skill_models import RefactorRule
@@ -10,15 +12,49 @@ from ..models.skill_models import RefactorRule
 if TYPE_CHECKING:
     from ..models.schemas import RepoIndex
 
+logger = logging.getLogger(__name__)
+
+SKILL_NAME_CACHE_SIZE = 512
+
+# Known skill names -> packages under refactor_bot.skills, imported on first use
+SKILL_PACKAGES: Dict[str, str] = {
+    "vercel-react-best-practices": "vercel_react_best_practices",
+}
+
+
+@functools.lru_cache(maxsize=SKILL_NAME_CACHE_SIZE)
+def _normalize_name(value: str) -> str:
+    # Skill names come from a small fixed vocabulary, so nearly every call hits the cache
+    return value.strip().replace("_", "-").lower()
+
 
 class SkillRegistry:
+    __slots__ = (
+        "_skills",
+        "_active_skills",
+        "_registered_packages",
+        "_rules_cache",
+        "_prompt_context_cache",
+    )
+
     _instance = None
-    _skills: Dict[str, Skill] = {}
-    _active_skills: List[Skill] = []
+    _skills: Dict[str, Skill]
+    # Immutable snapshot, replaced wholesale so readers never see a partial update
+    _active_skills: Tuple[Skill, ...]
+    _registered_packages: Dict[str, str]
+    # Derived data, tagged with the _active_skills snapshot it was built from
+    _rules_cache: Tuple[Tuple[Skill, ...], List[RefactorRule]] | None
+    _prompt_context_cache: Tuple[Tuple[Skill, ...], Dict[str, str]]
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._skills = {}
+            instance._active_skills = ()
+            instance._registered_packages = {}
+            instance._rules_cache = None
+            instance._prompt_context_cache = ((), {})
+            cls._instance = instance
         return cls._instance
 
     @classmethod
@@ -26,15 +62,25 @@ class SkillRegistry:
         return cls()
 
     def register(self, skill: Skill) -> None:
-        self._skills[self._normalize_name(skill.metadata.name)] = skill
+        self._skills[_normalize_name(skill.metadata.name)] = skill
 
     def has_skill(self, name: str) -> bool:
-        return self._normalize_name(name) in self._skills
+        return _normalize_name(name) in self._skills
 
     def normalize_skill_names(self, names: List[str]) -> List[str]:
-        return [self._normalize_name(name) for name in names]
+        return [_normalize_name(name) for name in names]
+
+    def ensure_registered(self, name: str) -> None:
+        """Import and register a skill by name unless it is already registered."""
+        normalized_name = _normalize_name(name)
+        if normalized_name in self._skills:
+            return
+        self.register_from_package(SKILL_PACKAGES.get(normalized_name, normalized_name))
 
     def register_from_package(self, package_name: str) -> None:
+        # Skip the import and load_from_disk when this package's skill is still registered
+        if self._registered_packages.get(package_name) in self._skills:
+            return
         try:
             module_name = package_name.replace("-", "_")
             module = importlib.import_module(f"refactor_bot.skills.{module_name}")
@@ -45,16 +91,19 @@ class SkillRegistry:
                     if package_dir is not None:
                         skill.load_from_disk(package_dir)
                 except Exception as e:
-                    print(f"[SkillRegistry] Skill load failed for {package_name}: {e}")
+                    logger.warning("Skill load failed for %s: %s", package_name, e)
                 self.register(skill)
+                self._registered_packages[package_name] = _normalize_name(
+                    skill.metadata.name
+                )
         except Exception as e:
-            print(f"[SkillRegistry] Failed to register {package_name}: {e}")
+            logger.warning("Failed to register %s: %s", package_name, e)
 
     def auto_activate(self, repo_index: "RepoIndex", directive: str | None = None) -> List[Skill]:
-        self._active_skills = [
+        self._active_skills = tuple(
             s for s in self._skills.values() if s.applies_to(repo_index, directive)
-        ]
-        return self._active_skills
+        )
+        return list(self._active_skills)
 
     def activate_by_name(self, names: List[str]) -> None:
         normalized_names = self.normalize_skill_names(names)
@@ -71,28 +120,43 @@ class SkillRegistry:
                 continue
             activated.append(skill)
             seen.add(name)
-        self._active_skills = activated
+        self._active_skills = tuple(activated)
 
     def get_active_skills(self) -> List[Skill]:
-        return self._active_skills
+        return list(self._active_skills)
 
     def get_prompt_context_for_all_active(self, directive: str, task: Any = None) -> str:
-        return "\n\n".join(
-            s.get_prompt_context(directive, task) for s in self._active_skills
-        )
+        active = self._active_skills
+        # Task-specific context may depend on the task, so only task-less calls are cached
+        if task is None:
+            snapshot, contexts = self._prompt_context_cache
+            if snapshot is not active:
+                contexts = {}
+                self._prompt_context_cache = (active, contexts)
+            if directive in contexts:
+                return contexts[directive]
+
+        context = "\n\n".join(s.get_prompt_context(directive, task) for s in active)
+        if task is None:
+            contexts[directive] = context
+        return context
 
     def get_all_rules(self) -> List["RefactorRule"]:
-        rules = []
-        for s in self._active_skills:
-            try:
-                rules.extend(s.get_rules())
-            except Exception as exc:
-                print(f"[SkillRegistry] Failed to load rules from skill '{s.metadata.name}': {exc}")
-        return rules
-
-    @staticmethod
-    def _normalize_name(value: str) -> str:
-        return value.strip().replace("_", "-").lower()
+        active = self._active_skills
+        cached = self._rules_cache
+        if cached is None or cached[0] is not active:
+            rules = []
+            for s in active:
+                try:
+                    rules.extend(s.get_rules())
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to load rules from skill '%s': %s", s.metadata.name, exc
+                    )
+            cached = (active, rules)
+            self._rules_cache = cached
+        # Callers may extend the returned list; keep the cached one intact
+        return list(cached[1])
 
 
 registry = SkillRegistry.get_instance()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Tuple
 
 import re
 
@@ -13,13 +15,25 @@ from refactor_bot.rules.react_rules import REACT_RULES
 SECTION_HEADER_RE = re.compile(
     r"^#{1,6}\s+(?:\d+\.\s*)?(?P<section>.+?)\s*(?:\((?P<priority>[^)]+)\))?\s*$"
 )
-RULE_ITEM_RE = re.compile(
-    r"^[\t ]*(?:[-*+]|\d+[.)])\s+`(?P<rule_id>[^`]+)`\s*(?:[-–—:]\s*)?(?P<description>.*)$"
-)
-TABLE_ROW_RE = re.compile(
-    r"^\|?\s*`(?P<rule_id>[^`]+)`\s*\|\s*(?P<description>[^|]+)"
+# Bulleted or numbered rule item: - `rule-id` - description
+RULE_ITEM_PATTERN = (
+    r"[\t ]*(?:[-*+]|\d+[.)])\s+`(?P<item_id>[^`]+)`\s*(?:[-–—:]\s*)?(?P<item_desc>.*)$"
 )
+# Markdown table row: | `rule-id` | description |
+TABLE_ROW_PATTERN = r"\|?\s*`(?P<row_id>[^`]+)`\s*\|\s*(?P<row_desc>[^|]+)"
+# List item or table row in one match; group names differ per branch since
+# an alternation cannot repeat them
+RULE_LINE_RE = re.compile(f"^(?:{RULE_ITEM_PATTERN}|{TABLE_ROW_PATTERN})")
 SECTION_PRIORITY_RE = re.compile(r"\b(CRITICAL|HIGH|MEDIUM|LOW)\b", re.IGNORECASE)
+# Fenced code block through its closing fence, or to end of file if unclosed
+FENCED_BLOCK_RE = re.compile(
+    r"^[ \t]*```[^\n]*(?:\n.*?^[ \t]*```[^\n]*$|.*\Z)", re.MULTILINE | re.DOTALL
+)
+SKILL_CATALOG_CACHE_SIZE = 16
+# (rule_id, category, priority, description) per catalog rule, in file order
+CatalogEntries = Tuple[Tuple[str, str, str, str], ...]
+# Canonical priority strings, shared by every parsed rule
+_PRIORITIES = {priority: priority for priority in ("CRITICAL", "HIGH", "MEDIUM", "LOW")}
 
 
 def _normalize_priority(raw_priority: str) -> str:
@@ -27,58 +41,69 @@ def _normalize_priority(raw_priority: str) -> str:
     match = SECTION_PRIORITY_RE.search(raw_priority or "")
     if not match:
         return "MEDIUM"
-    return match.group(1).upper()
+    return _PRIORITIES[match.group(1).upper()]
 
 
 def _strip_numeric_prefix(section: str) -> str:
     return re.sub(r"^\d+\.\s*", "", section).strip()
 
 
-def _parse_skill_catalog(skill_markdown_path: Path) -> Dict[str, Tuple[str, str, str]]:
-    """Parse rule id, category, and priority from SKILL.md quick-reference section."""
-    rules: Dict[str, Tuple[str, str, str]] = {}
-    current_section = "General"
-    current_priority = "MEDIUM"
+def _parse_skill_catalog(skill_markdown_path: Path) -> CatalogEntries:
+    """Parse rule id, category, and priority from SKILL.md quick-reference section.
 
-    if not skill_markdown_path.exists():
-        return rules
+    Returns (rule_id, category, priority, description) tuples in file order,
+    one per rule id. Results are cached per (path, mtime, size), so repeated
+    calls only stat the file until it is edited.
+    """
+    try:
+        stat = skill_markdown_path.stat()
+    except OSError:
+        return ()
+    return _parse_skill_catalog_cached(str(skill_markdown_path), stat.st_mtime_ns, stat.st_size)
 
-    in_code_block = False
 
-    with skill_markdown_path.open(encoding="utf-8") as fp:
-        for raw_line in fp:
-            line = raw_line.rstrip()
+@functools.lru_cache(maxsize=SKILL_CATALOG_CACHE_SIZE)
+def _parse_skill_catalog_cached(path: str, mtime_ns: int, size: int) -> CatalogEntries:
+    """Parse SKILL.md; mtime_ns and size only key the cache."""
+    entries: list[Tuple[str, str, str, str]] = []
+    seen_ids: set[str] = set()
+    current_section = "General"
+    current_priority = "MEDIUM"
 
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
+    # Bound once; the loop runs per line of SKILL.md
+    match_header = SECTION_HEADER_RE.match
+    match_rule = RULE_LINE_RE.match
 
-            line = line.strip()
-            if not line:
-                continue
+    text = FENCED_BLOCK_RE.sub("", Path(path).read_text(encoding="utf-8"))
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
 
-            section_match = SECTION_HEADER_RE.match(line)
-            if section_match:
-                current_section = _strip_numeric_prefix(section_match.group("section").strip())
-                current_priority = _normalize_priority(
-                    section_match.group("priority") or current_priority
-                )
-                continue
+        section_match = match_header(line)
+        if section_match:
+            current_section = sys.intern(
+                _strip_numeric_prefix(section_match.group("section").strip())
+            )
+            current_priority = _normalize_priority(
+                section_match.group("priority") or current_priority
+            )
+            continue
 
-            rule_match = RULE_ITEM_RE.match(line)
-            if not rule_match:
-                rule_match = TABLE_ROW_RE.match(line)
-            if not rule_match:
-                continue
+        rule_match = match_rule(line)
+        if not rule_match:
+            continue
 
-            rule_id = rule_match.group("rule_id").strip()
-            description = rule_match.group("description").strip()
-            if rule_id and not rule_id.startswith("#") and rule_id not in rules:
-                rules[rule_id] = (current_section, current_priority, description)
+        if rule_match.group("item_id") is not None:
+            rule_id, description = rule_match.group("item_id", "item_desc")
+        else:
+            rule_id, description = rule_match.group("row_id", "row_desc")
+        rule_id = rule_id.strip()
+        if rule_id and not rule_id.startswith("#") and rule_id not in seen_ids:
+            seen_ids.add(rule_id)
+            entries.append((rule_id, current_section, current_priority, description.strip()))
 
-    return rules
+    return tuple(entries)
 
 
 def _normalize_rule(
@@ -117,24 +142,20 @@ def _normalize_rule(
     )
 
 
-def _build_rules(catalog: Dict[str, Tuple[str, str, str]]) -> list[RefactorRule]:
+@functools.cache
+def _react_rules_as_refactor_rules() -> Tuple[RefactorRule, ...]:
+    """REACT_RULES converted once; rule models are frozen, so sharing is safe."""
+    return tuple(RefactorRule(**rule.model_dump()) for rule in REACT_RULES)
+
+
+def _build_rules(catalog: CatalogEntries) -> list[RefactorRule]:
     if not catalog:
-        return [
-            RefactorRule(
-                rule_id=rule.rule_id,
-                category=rule.category,
-                priority=rule.priority,
-                description=rule.description,
-                incorrect_pattern=rule.incorrect_pattern,
-                correct_pattern=rule.correct_pattern,
-            )
-            for rule in REACT_RULES
-        ]
+        return list(_react_rules_as_refactor_rules())
 
     react_rule_index = {rule.rule_id: rule for rule in REACT_RULES}
     rules: list[RefactorRule] = []
 
-    for rule_id, (category, priority, description) in catalog.items():
+    for rule_id, category, priority, description in catalog:
         template = react_rule_index.get(rule_id)
         rules.append(_normalize_rule(rule_id, category, priority, description, template))
 
@@ -143,18 +164,9 @@ def _build_rules(catalog: Dict[str, Tuple[str, str, str]]) -> list[RefactorRule]
 
 def _add_missing_rules_from_react(catalog_rules: list[RefactorRule]) -> list[RefactorRule]:
     catalog_ids = {rule.rule_id for rule in catalog_rules}
-    for rule in REACT_RULES:
-        if rule.rule_id not in catalog_ids:
-            catalog_rules.append(
-                RefactorRule(
-                    rule_id=rule.rule_id,
-                    category=rule.category,
-                    priority=rule.priority,
-                    description=rule.description,
-                    incorrect_pattern=rule.incorrect_pattern,
-                    correct_pattern=rule.correct_pattern,
-                )
-            )
+    catalog_rules.extend(
+        rule for rule in _react_rules_as_refactor_rules() if rule.rule_id not in catalog_ids
+    )
     return catalog_rules
 
 
@@ -9,6 +9,11 @@ from .rules import get_rules
 class VercelReactBestPracticesSkill(Skill):
     def __init__(self) -> None:
         self._skill_path: Path | None = None
+        # filename -> resolved path (or None), fixed until load_from_disk changes _skill_path
+        self._resolved_files: dict[str, Path | None] = {}
+        # AGENTS.md text, reread only when (path, mtime, size) changes
+        self._prompt_cache_key: tuple[str, int, int] | None = None
+        self._prompt_cache = ""
 
     metadata = SkillMetadata(
         name="vercel-react-best-practices",
@@ -31,12 +36,21 @@ class VercelReactBestPracticesSkill(Skill):
 
     def get_prompt_context(self, directive: str, task=None) -> str:
         ag_path = self._active_skill_file("AGENTS.md")
-        if ag_path and ag_path.exists():
-            return ag_path.read_text(encoding="utf-8")
+        if ag_path:
+            try:
+                stat = ag_path.stat()
+            except OSError:
+                return "Vercel React Best Practices loaded."
+            key = (str(ag_path), stat.st_mtime_ns, stat.st_size)
+            if key != self._prompt_cache_key:
+                self._prompt_cache = ag_path.read_text(encoding="utf-8")
+                self._prompt_cache_key = key
+            return self._prompt_cache
         return "Vercel React Best Practices loaded."
 
     def load_from_disk(self, skill_path: Path) -> None:
         self._skill_path = skill_path
+        self._resolved_files.clear()
 
         metadata_path = skill_path / "metadata.json"
         if metadata_path.exists():
@@ -58,10 +72,13 @@ class VercelReactBestPracticesSkill(Skill):
                 )
 
     def _active_skill_file(self, filename: str = "SKILL.md") -> Path | None:
+        if filename in self._resolved_files:
+            return self._resolved_files[filename]
+
         candidate = self._skill_path or (Path(__file__).parent)
-        if filename and (candidate / filename).exists():
-            return candidate / filename
-        return None
+        resolved = candidate / filename if filename and (candidate / filename).exists() else None
+        self._resolved_files[filename] = resolved
+        return resolved
 
 
 skill = VercelReactBestPracticesSkill()
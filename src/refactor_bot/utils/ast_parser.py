@@ -1,11 +1,15 @@
 """AST parser utility for JavaScript/TypeScript using tree-sitter."""
 
+import functools
+import itertools
+import os
 import re
+import threading
 from pathlib import Path
 
 import tree_sitter_javascript as tsjs
 import tree_sitter_typescript as tsts
-from tree_sitter import Language, Parser, Query, QueryCursor, Tree
+from tree_sitter import Language, Node, Parser, Query, QueryCursor, Tree
 
 from refactor_bot.models.schemas import SymbolInfo
 
@@ -14,7 +18,138 @@ JS_LANGUAGE = Language(tsjs.language())
 TS_LANGUAGE = Language(tsts.language_typescript())
 TSX_LANGUAGE = Language(tsts.language_tsx())
 
+# File extension -> language name, and language name -> grammar
+LANGUAGE_NAMES_BY_EXTENSION = {
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+}
+LANGUAGES_BY_NAME = {
+    "javascript": JS_LANGUAGE,
+    "typescript": TS_LANGUAGE,
+    "tsx": TSX_LANGUAGE,
+}
+
+LANGUAGE_CACHE_SIZE = 4096
+HOOK_NAME_RE = re.compile(r"use[A-Z]")
+# Leading lines searched for a "use client" directive
+USE_CLIENT_SCAN_LINES = 10
+
+# Per-thread {language name: Parser}, filled by get_parser
+_PARSER_LOCAL = threading.local()
+
+# Query sources, compiled once per language below
+FUNCTION_QUERY = """
+    (function_declaration
+        name: (identifier) @name) @func
+"""
+ARROW_QUERY = """
+    (variable_declarator
+        name: (identifier) @name
+        value: (arrow_function) @arrow) @decl
+"""
+# JavaScript names classes with 'identifier', TypeScript/TSX with 'type_identifier'
+JS_CLASS_QUERY = """
+    (class_declaration
+        name: (identifier) @name) @class
+"""
+TS_CLASS_QUERY = """
+    (class_declaration
+        name: (type_identifier) @name) @class
+"""
+METHOD_QUERY = """
+    (method_definition
+        name: (property_identifier) @name) @method
+"""
+IMPORT_QUERY = """
+    (import_statement
+        source: (string) @source)
+"""
+EXPORT_QUERY = """
+    (export_statement) @export
+"""
+HOOK_CALL_QUERY = """
+    (call_expression
+        function: (identifier) @name
+        (#match? @name "^use[A-Z]"))
+"""
+# JSX node types exist only in the JavaScript and TSX grammars
+JSX_QUERY = """
+    [(jsx_element) (jsx_self_closing_element)] @jsx
+"""
+SUSPENSE_QUERY = """
+    (jsx_opening_element
+        name: (identifier) @name
+        (#eq? @name "Suspense"))
+    (jsx_self_closing_element
+        name: (identifier) @name
+        (#eq? @name "Suspense"))
+"""
+
+
+# Top-level node types that make a file more than a barrel of re-exports
+BARREL_DEFINITION_TYPES = frozenset({"function_declaration", "class_declaration"})
+
+# (symbol type, capture holding the whole symbol node) per pattern of the
+# combined symbol query, in pattern order
+SYMBOL_PATTERNS = (
+    ("function", "func"),
+    ("arrow_function", "decl"),
+    ("class", "class"),
+    ("method", "method"),
+)
+# Pattern indices of the import and export patterns in the combined file query
+IMPORT_PATTERN = len(SYMBOL_PATTERNS)
+EXPORT_PATTERN = IMPORT_PATTERN + 1
+
+
+def _compile_queries(language: Language, class_query: str, jsx: bool) -> dict[str, Query]:
+    """Compile every extraction query for one language."""
+    queries = {
+        # Pattern order must match SYMBOL_PATTERNS
+        "symbol": Query(
+            language, FUNCTION_QUERY + ARROW_QUERY + class_query + METHOD_QUERY
+        ),
+        "import": Query(language, IMPORT_QUERY),
+        "export": Query(language, EXPORT_QUERY),
+        "hook_call": Query(language, HOOK_CALL_QUERY),
+    }
+    # Every per-file extraction in one query; pattern order must match
+    # SYMBOL_PATTERNS, then IMPORT_PATTERN, EXPORT_PATTERN, suspense patterns
+    file_query = FUNCTION_QUERY + ARROW_QUERY + class_query + METHOD_QUERY
+    file_query += IMPORT_QUERY + EXPORT_QUERY
+    if jsx:
+        queries["jsx"] = Query(language, JSX_QUERY)
+        queries["suspense"] = Query(language, SUSPENSE_QUERY)
+        file_query += SUSPENSE_QUERY
+    queries["file"] = Query(language, file_query)
+    return queries
+
+
+_QUERIES: dict[Language, dict[str, Query]] = {
+    JS_LANGUAGE: _compile_queries(JS_LANGUAGE, JS_CLASS_QUERY, jsx=True),
+    TS_LANGUAGE: _compile_queries(TS_LANGUAGE, TS_CLASS_QUERY, jsx=False),
+    TSX_LANGUAGE: _compile_queries(TSX_LANGUAGE, TS_CLASS_QUERY, jsx=True),
+}
+
+
+def _language_queries(language: Language) -> dict[str, Query]:
+    """Return the precompiled queries for `language`, compiling on first use."""
+    queries = _QUERIES.get(language)
+    if queries is None:
+        queries = _QUERIES.setdefault(
+            language, _compile_queries(language, JS_CLASS_QUERY, jsx=True)
+        )
+    return queries
+
+
+def _get_query(language: Language, name: str) -> Query:
+    """Return the precompiled query `name` for `language`."""
+    return _language_queries(language)[name]
 
+
+@functools.lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
 def get_language_for_file(file_path: str) -> str:
     """Map file extension to tree-sitter language name.
 
@@ -27,44 +162,49 @@ def get_language_for_file(file_path: str) -> str:
     Raises:
         ValueError: If file extension is not supported
     """
-    ext = Path(file_path).suffix
-    mapping = {
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".tsx": "tsx",
-        ".jsx": "javascript",
-    }
-    if ext not in mapping:
+    # splitext reads the extension straight off the string, without a Path
+    ext = os.path.splitext(file_path)[1]
+    language_name = LANGUAGE_NAMES_BY_EXTENSION.get(ext)
+    if language_name is None:
         raise ValueError(f"Unsupported file extension: {ext}")
-    return mapping[ext]
+    return language_name
 
 
 def get_parser(language: str) -> Parser:
     """Return a tree-sitter Parser for the given language name.
 
+    Parsers are created once per language and thread, then reused; a Parser
+    must not be shared between threads.
+
     Args:
         language: Language name ("javascript", "typescript", "tsx")
 
     Returns:
         Configured Parser instance
     """
-    parser = Parser()
-    if language == "javascript":
-        parser.language = JS_LANGUAGE
-    elif language == "typescript":
-        parser.language = TS_LANGUAGE
-    elif language == "tsx":
-        parser.language = TSX_LANGUAGE
-    else:
+    parsers: dict[str, Parser] | None = getattr(_PARSER_LOCAL, "parsers", None)
+    if parsers is None:
+        parsers = {}
+        _PARSER_LOCAL.parsers = parsers
+
+    parser = parsers.get(language)
+    if parser is not None:
+        return parser
+
+    grammar = LANGUAGES_BY_NAME.get(language)
+    if grammar is None:
         raise ValueError(f"Unsupported language: {language}")
+    parser = parsers[language] = Parser(grammar)
     return parser
 
 
-def parse_file(file_path: str) -> tuple[Tree, Language]:
+def parse_file(file_path: str, source_bytes: bytes | None = None) -> tuple[Tree, Language]:
     """Read file as bytes, determine language, parse with tree-sitter.
 
     Args:
         file_path: Path to the file to parse
+        source_bytes: File contents already read by the caller; the file is
+            read from disk when omitted
 
     Returns:
         Tuple of (tree, language)
@@ -72,30 +212,77 @@ def parse_file(file_path: str) -> tuple[Tree, Language]:
     Raises:
         FileNotFoundError: If file does not exist
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    if source_bytes is None:
+        try:
+            source_bytes = Path(file_path).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
     language_name = get_language_for_file(file_path)
     parser = get_parser(language_name)
-
-    # Get the appropriate Language object
-    if language_name == "javascript":
-        language = JS_LANGUAGE
-    elif language_name == "typescript":
-        language = TS_LANGUAGE
-    elif language_name == "tsx":
-        language = TSX_LANGUAGE
-    else:
-        raise ValueError(f"Unsupported language: {language_name}")
-
-    with open(file_path, "rb") as f:
-        source_bytes = f.read()
+    language = LANGUAGES_BY_NAME[language_name]
 
     tree = parser.parse(source_bytes)
     return tree, language
 
 
+def _symbol_from_match(  # type: ignore
+    pattern_index: int, captures, source_view: memoryview, base: int, file_path: str
+) -> SymbolInfo | None:
+    """Build the SymbolInfo for one symbol-pattern match, or None if it is empty."""
+    symbol_type, node_capture = SYMBOL_PATTERNS[pattern_index]
+    if "name" not in captures or node_capture not in captures:
+        return None
+    symbol_node = captures[node_capture][0]  # Get first node from list
+    name_node = captures["name"][0]
+
+    start_byte, end_byte = symbol_node.start_byte, symbol_node.end_byte
+    name_start, name_end = name_node.start_byte, name_node.end_byte
+    if name_end <= name_start or end_byte <= start_byte:
+        return None
+    return SymbolInfo(
+        name=str(source_view[name_start - base:name_end - base], "utf-8"),
+        type=symbol_type,
+        file_path=file_path,
+        start_line=symbol_node.start_point[0] + 1,
+        end_line=symbol_node.end_point[0] + 1,
+        start_byte=start_byte,
+        end_byte=end_byte,
+        source_code=str(source_view[start_byte - base:end_byte - base], "utf-8"),
+    )
+
+
+def _import_from_captures(captures: dict[str, list[Node]]) -> str | None:
+    """Return the import path of one import-pattern match."""
+    if "source" in captures:
+        source_text = captures["source"][0].text
+        if source_text:
+            # Remove quotes from string literal
+            return source_text.decode("utf-8").strip("'\"")
+    return None
+
+
+def _collect_export_names(export_node, exports: list[str]) -> None:  # type: ignore
+    """Append the names exported by one export_statement to exports."""
+    # Extract identifiers from the export statement, depth-first in source
+    # order; an explicit stack avoids a Python call per node
+    stack = [export_node]
+    while stack:
+        node = stack.pop()
+        if node.type == "export_specifier":
+            # Get the identifier from the export_specifier
+            for child in node.children:
+                if child.type == "identifier":
+                    exports.append(child.text.decode("utf-8"))
+                    break  # Take first identifier (the exported name)
+        elif node.type == "identifier":
+            # Direct identifier export
+            exports.append(node.text.decode("utf-8"))
+        else:
+            # Children pushed in reverse so the leftmost is visited first
+            stack.extend(reversed(node.children))
+
+
 def extract_symbols(tree: Tree, language: Language, file_path: str) -> list[SymbolInfo]:
     """Extract symbols (functions, classes, methods, arrow functions) from the AST.
 
@@ -108,130 +295,29 @@ def extract_symbols(tree: Tree, language: Language, file_path: str) -> list[Symb
         List of SymbolInfo objects
     """
     symbols: list[SymbolInfo] = []
-    source_bytes = tree.root_node.text
+    root = tree.root_node
+    source_bytes = root.text
     if not source_bytes:
         return symbols  # Empty file or parsing error
 
-    # Query for function declarations
-    func_query = Query(language, """
-        (function_declaration
-            name: (identifier) @name) @func
-    """)
-    func_cursor = QueryCursor(func_query)
-
-    for match in func_cursor.matches(tree.root_node):
-        # match is a tuple: (pattern_index, captures_dict)
-        # captures_dict maps capture names to lists of nodes
-        _, captures = match
-        if "name" in captures and "func" in captures:
-            func_node = captures["func"][0]  # Get first node from list
-            name_node = captures["name"][0]  # Get first node from list
-
-            name_text = name_node.text
-            func_text = func_node.text
-            if name_text and func_text:
-                symbols.append(SymbolInfo(
-                    name=name_text.decode("utf-8"),
-                    type="function",
-                    file_path=file_path,
-                    start_line=func_node.start_point[0] + 1,
-                    end_line=func_node.end_point[0] + 1,
-                    start_byte=func_node.start_byte,
-                    end_byte=func_node.end_byte,
-                    source_code=source_bytes[func_node.start_byte:func_node.end_byte].decode("utf-8"),
-                ))
-
-    # Query for arrow functions assigned to variables
-    arrow_query = Query(language, """
-        (variable_declarator
-            name: (identifier) @name
-            value: (arrow_function) @arrow) @decl
-    """)
-    arrow_cursor = QueryCursor(arrow_query)
-
-    for match in arrow_cursor.matches(tree.root_node):
-        _, captures = match
-        if "name" in captures and "decl" in captures:
-            decl_node = captures["decl"][0]  # Use the entire declarator
-            name_node = captures["name"][0]
-
-            name_text = name_node.text
-            decl_text = decl_node.text
-            if name_text and decl_text:
-                symbols.append(SymbolInfo(
-                    name=name_text.decode("utf-8"),
-                    type="arrow_function",
-                    file_path=file_path,
-                    start_line=decl_node.start_point[0] + 1,
-                    end_line=decl_node.end_point[0] + 1,
-                    start_byte=decl_node.start_byte,
-                    end_byte=decl_node.end_byte,
-                    source_code=source_bytes[decl_node.start_byte:decl_node.end_byte].decode("utf-8"),
-                ))
-
-    # Query for class declarations
-    # Note: JavaScript uses 'identifier' while TypeScript/TSX uses 'type_identifier'
-    # Determine which to use based on the language
-    if language == TS_LANGUAGE or language == TSX_LANGUAGE:
-        class_query_str = """
-            (class_declaration
-                name: (type_identifier) @name) @class
-        """
-    else:
-        class_query_str = """
-            (class_declaration
-                name: (identifier) @name) @class
-        """
-    class_query = Query(language, class_query_str)
-    class_cursor = QueryCursor(class_query)
-
-    for match in class_cursor.matches(tree.root_node):
-        _, captures = match
-        if "name" in captures and "class" in captures:
-            class_node = captures["class"][0]
-            name_node = captures["name"][0]
-
-            name_text = name_node.text
-            class_text = class_node.text
-            if name_text and class_text:
-                symbols.append(SymbolInfo(
-                    name=name_text.decode("utf-8"),
-                    type="class",
-                    file_path=file_path,
-                    start_line=class_node.start_point[0] + 1,
-                    end_line=class_node.end_point[0] + 1,
-                    start_byte=class_node.start_byte,
-                    end_byte=class_node.end_byte,
-                    source_code=source_bytes[class_node.start_byte:class_node.end_byte].decode("utf-8"),
-                ))
-
-    # Query for method definitions
-    method_query = Query(language, """
-        (method_definition
-            name: (property_identifier) @name) @method
-    """)
-    method_cursor = QueryCursor(method_query)
-
-    for match in method_cursor.matches(tree.root_node):
-        _, captures = match
-        if "name" in captures and "method" in captures:
-            method_node = captures["method"][0]
-            name_node = captures["name"][0]
-
-            name_text = name_node.text
-            method_text = method_node.text
-            if name_text and method_text:
-                symbols.append(SymbolInfo(
-                    name=name_text.decode("utf-8"),
-                    type="method",
-                    file_path=file_path,
-                    start_line=method_node.start_point[0] + 1,
-                    end_line=method_node.end_point[0] + 1,
-                    start_byte=method_node.start_byte,
-                    end_byte=method_node.end_byte,
-                    source_code=source_bytes[method_node.start_byte:method_node.end_byte].decode("utf-8"),
-                ))
+    # Root text starts at the first token, so node offsets are shifted by
+    # root.start_byte; names and bodies are decoded straight from this buffer
+    base = root.start_byte
+    source_view = memoryview(source_bytes)
+
+    # One query walks the tree once for all symbol kinds; matches are bucketed
+    # by pattern so results stay grouped functions, arrows, classes, methods
+    buckets: list[list[SymbolInfo]] = [[] for _ in SYMBOL_PATTERNS]
+    symbol_cursor = QueryCursor(_get_query(language, "symbol"))
+
+    for pattern_index, captures in symbol_cursor.matches(root):
+        # captures maps capture names to lists of nodes
+        symbol = _symbol_from_match(pattern_index, captures, source_view, base, file_path)
+        if symbol is not None:
+            buckets[pattern_index].append(symbol)
 
+    for bucket in buckets:
+        symbols.extend(bucket)
     return symbols
 
 
@@ -248,21 +334,12 @@ def extract_imports(tree: Tree, language: Language) -> list[str]:
     imports = []
 
     # Query for import statements
-    import_query = Query(language, """
-        (import_statement
-            source: (string) @source)
-    """)
-    import_cursor = QueryCursor(import_query)
-
-    for match in import_cursor.matches(tree.root_node):
-        _, captures = match
-        if "source" in captures:
-            source_node = captures["source"][0]
-            source_text = source_node.text
-            if source_text:
-                # Remove quotes from string literal
-                import_path = source_text.decode("utf-8").strip("'\"")
-                imports.append(import_path)
+    import_cursor = QueryCursor(_get_query(language, "import"))
+
+    for _, captures in import_cursor.matches(tree.root_node):
+        import_path = _import_from_captures(captures)
+        if import_path is not None:
+            imports.append(import_path)
 
     return imports
 
@@ -277,50 +354,86 @@ def extract_exports(tree: Tree, language: Language) -> list[str]:
     Returns:
         List of exported symbol names
     """
-    exports = []
+    exports: list[str] = []
 
     # Query for named exports
-    export_query = Query(language, """
-        (export_statement) @export
-    """)
-    export_cursor = QueryCursor(export_query)
+    export_cursor = QueryCursor(_get_query(language, "export"))
 
-    for match in export_cursor.matches(tree.root_node):
-        _, captures = match
+    for _, captures in export_cursor.matches(tree.root_node):
         if "export" in captures:
-            export_node = captures["export"][0]
-            # Extract identifiers from the export statement
-            # Look for export_specifier nodes which contain identifiers
-            def extract_identifiers(node):  # type: ignore
-                if node.type == "export_specifier":
-                    # Get the identifier from the export_specifier
-                    for child in node.children:
-                        if child.type == "identifier":
-                            exports.append(child.text.decode("utf-8"))
-                            break  # Take first identifier (the exported name)
-                elif node.type == "identifier":
-                    # Direct identifier export
-                    exports.append(node.text.decode("utf-8"))
-                else:
-                    # Recurse into children
-                    for child in node.children:
-                        extract_identifiers(child)
-
-            extract_identifiers(export_node)
+            _collect_export_names(captures["export"][0], exports)
 
     return exports
 
 
-def detect_react_component(node, source_bytes: bytes) -> bool:  # type: ignore
+def extract_file_data(
+    tree: Tree, language: Language, file_path: str
+) -> tuple[list[SymbolInfo], list[str], list[str], bool]:
+    """Run every per-file extraction in a single query pass.
+
+    Equivalent to calling extract_symbols, extract_imports, extract_exports
+    and detect_suspense_boundary, but the tree is walked once.
+
+    Args:
+        tree: Parsed tree-sitter Tree
+        language: Language object
+        file_path: Path to the source file
+
+    Returns:
+        Tuple of (symbols, imports, exports, has_suspense_boundary)
+    """
+    root = tree.root_node
+    source_bytes = root.text
+    if not source_bytes:
+        return [], [], [], False  # Empty file or parsing error
+
+    base = root.start_byte
+    source_view = memoryview(source_bytes)
+
+    buckets: list[list[SymbolInfo]] = [[] for _ in SYMBOL_PATTERNS]
+    imports: list[str] = []
+    exports: list[str] = []
+    has_suspense = False
+
+    for pattern_index, captures in QueryCursor(_get_query(language, "file")).matches(root):
+        if pattern_index < IMPORT_PATTERN:
+            symbol = _symbol_from_match(pattern_index, captures, source_view, base, file_path)
+            if symbol is not None:
+                buckets[pattern_index].append(symbol)
+        elif pattern_index == IMPORT_PATTERN:
+            import_path = _import_from_captures(captures)
+            if import_path is not None:
+                imports.append(import_path)
+        elif pattern_index == EXPORT_PATTERN:
+            if "export" in captures:
+                _collect_export_names(captures["export"][0], exports)
+        else:
+            has_suspense = True
+
+    symbols = [symbol for bucket in buckets for symbol in bucket]
+    return symbols, imports, exports, has_suspense
+
+
+def detect_react_component(  # type: ignore
+    node, source_bytes: bytes, language: Language | None = None
+) -> bool:
     """Return True if a function/arrow function returns JSX.
 
     Args:
         node: Tree-sitter node to check
         source_bytes: Source code as bytes
+        language: Language the node was parsed with; enables a compiled
+            query instead of a Python tree walk
 
     Returns:
         True if the node returns JSX elements
     """
+    if language is not None:
+        jsx_query = _language_queries(language).get("jsx")
+        if jsx_query is None:
+            return False  # Grammar has no JSX nodes
+        return bool(QueryCursor(jsx_query).captures(node))
+
     # Check for jsx_element or jsx_self_closing_element in the node
     def has_jsx(n) -> bool:  # type: ignore
         if n.type in ("jsx_element", "jsx_self_closing_element"):
@@ -333,25 +446,37 @@ def detect_react_component(node, source_bytes: bytes) -> bool:  # type: ignore
     return bool(has_jsx(node))
 
 
-def detect_hooks_usage(node, source_bytes: bytes) -> list[str]:  # type: ignore
+def detect_hooks_usage(  # type: ignore
+    node, source_bytes: bytes, language: Language | None = None
+) -> list[str]:
     """Find hook calls matching use[A-Z]* pattern within a function body.
 
     Args:
         node: Tree-sitter node to check
         source_bytes: Source code as bytes
+        language: Language the node was parsed with; enables a compiled
+            query instead of a Python tree walk
 
     Returns:
         List of hook names found
     """
     hooks = []
 
+    if language is not None:
+        captures = QueryCursor(_get_query(language, "hook_call")).captures(node)
+        # Source order, matching a depth-first walk
+        for name_node in sorted(captures.get("name", []), key=lambda n: n.start_byte):
+            if name_node.text:
+                hooks.append(name_node.text.decode("utf-8"))
+        return hooks
+
     def find_hooks(n):
         # Look for call_expression with identifier matching use[A-Z]*
         if n.type == "call_expression":
             for child in n.children:
                 if child.type == "identifier":
                     name = child.text.decode("utf-8")
-                    if re.match(r"use[A-Z]", name):
+                    if HOOK_NAME_RE.match(name):
                         hooks.append(name)
 
         for child in n.children:
@@ -371,20 +496,10 @@ def detect_suspense_boundary(tree: Tree, language: Language) -> bool:
     Returns:
         True if Suspense boundary is found
     """
-    # Look for jsx elements with Suspense identifier
-    def has_suspense(node) -> bool:  # type: ignore
-        if node.type in ("jsx_opening_element", "jsx_self_closing_element"):
-            for child in node.children:
-                if child.type == "identifier" and child.text.decode("utf-8") == "Suspense":
-                    return True
-
-        for child in node.children:
-            if has_suspense(child):
-                return True
-
-        return False
-
-    return bool(has_suspense(tree.root_node))
+    suspense_query = _language_queries(language).get("suspense")
+    if suspense_query is None:
+        return False  # Grammar has no JSX nodes
+    return bool(QueryCursor(suspense_query).captures(tree.root_node))
 
 
 def detect_barrel_file(tree: Tree, language: Language) -> bool:
@@ -397,29 +512,17 @@ def detect_barrel_file(tree: Tree, language: Language) -> bool:
     Returns:
         True if the file is a barrel file
     """
-    # Count function/class declarations and export statements
-    has_definitions = False
+    # Variable declarations may just feed exports, so only these count as definitions
     has_exports = False
-
     for child in tree.root_node.children:
-        if child.type in (
-            "function_declaration",
-            "class_declaration",
-            "lexical_declaration",
-            "variable_declaration",
-        ):
-            # Check if it's not just an export
-            if child.type in ("lexical_declaration", "variable_declaration"):
-                # These might be part of exports, check context
-                pass
-            else:
-                has_definitions = True
-
-        if child.type in ("export_statement",):
+        child_type = child.type
+        if child_type in BARREL_DEFINITION_TYPES:
+            return False  # Barrel files contain no definitions
+        if child_type == "export_statement":
             has_exports = True
 
     # Barrel file has exports but no definitions
-    return has_exports and not has_definitions
+    return has_exports
 
 
 def detect_server_component(source_bytes: bytes) -> bool:
@@ -433,12 +536,27 @@ def detect_server_component(source_bytes: bytes) -> bool:
     Returns:
         True if this is a server component (no "use client")
     """
-    # Check first few lines for "use client" directive
-    source_str = source_bytes.decode("utf-8")
-    lines = source_str.split("\n")[:10]  # Check first 10 lines
+    # Check first few lines for "use client" directive, on the raw bytes:
+    # cut at the last scanned newline instead of decoding and splitting the whole file
+    end = -1
+    for _ in range(USE_CLIENT_SCAN_LINES):
+        end = source_bytes.find(b"\n", end + 1)
+        if end == -1:
+            break
+    head = source_bytes if end == -1 else source_bytes[:end]
 
-    for line in lines:
-        if '"use client"' in line or "'use client'" in line:
-            return False
+    return b'"use client"' not in head and b"'use client'" not in head
 
-    return True
+
+def detect_server_component_path(file_path: str) -> bool:
+    """Like detect_server_component, but reads only the head of the file.
+
+    Args:
+        file_path: Path to the source file
+
+    Returns:
+        True if this is a server component (no "use client")
+    """
+    with open(file_path, "rb") as f:
+        head = b"".join(itertools.islice(f, USE_CLIENT_SCAN_LINES))
+    return detect_server_component(head)
@@ -1,10 +1,21 @@
 """Utilities for generating and validating code diffs."""
 
 import difflib
+import functools
+import os
+import re
 import subprocess
 import tempfile
 from pathlib import Path
 
+import numpy as np
+
+CODE_STYLE_CACHE_SIZE = 256
+_SPACE, _TAB, _NEWLINE, _CR = b" \t\n\r"
+# Files longer than this (in lines) are diffed by git's C implementation
+GIT_DIFF_MIN_LINES = 2000
+HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
 
 def generate_unified_diff(
     file_path: str,
@@ -29,6 +40,11 @@ def generate_unified_diff(
     original_lines = original_content.splitlines(keepends=True)
     modified_lines = modified_content.splitlines(keepends=True)
 
+    if max(len(original_lines), len(modified_lines)) > GIT_DIFF_MIN_LINES:
+        git_diff = _git_unified_diff(file_path, original_content, modified_content)
+        if git_diff is not None:
+            return git_diff
+
     # Generate unified diff with lineterm="" to avoid adding extra newlines
     diff_gen = difflib.unified_diff(
         original_lines,
@@ -38,34 +54,216 @@ def generate_unified_diff(
         lineterm="",
     )
 
-    # Convert generator to list and join
-    # Each line from diff already has its newline from keepends=True
-    # So we need to strip the trailing newlines before joining with \n
-    diff_lines = []
-    for line in diff_gen:
-        # Remove trailing newline if present (from keepends=True)
-        if line.endswith('\n'):
-            diff_lines.append(line[:-1])
-        else:
-            diff_lines.append(line)
+    # Each line from diff already has its newline from keepends=True, so strip
+    # it while streaming the generator straight into the join
+    return "\n".join(line[:-1] if line.endswith("\n") else line for line in diff_gen)
 
-    return "\n".join(diff_lines)
+
+def _git_unified_diff(
+    file_path: str,
+    original_content: str,
+    modified_content: str,
+) -> str | None:
+    """Diff two contents with git diff --no-index.
+
+    Returns the diff with a/ b/ headers for file_path, or None when git is
+    unavailable or produces no text hunks (e.g. content it treats as binary).
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original_path = Path(tmpdir) / "original"
+        modified_path = Path(tmpdir) / "modified"
+        original_path.write_text(original_content, encoding="utf-8")
+        modified_path.write_text(modified_content, encoding="utf-8")
+        try:
+            result = subprocess.run(
+                [
+                    "git", "diff", "--no-index", "--no-color", "--no-ext-diff",
+                    "--unified=3", str(original_path), str(modified_path),
+                ],
+                capture_output=True,
+                # Keep user diff settings (prefixes, algorithms, colors) out of the
+                # output; running outside any repo also skips a local .git/config
+                cwd=tmpdir,
+                env={**os.environ, "GIT_CONFIG_GLOBAL": os.devnull, "GIT_CONFIG_NOSYSTEM": "1"},
+            )
+        except OSError:
+            return None
+
+    # Exit status 1 means the files differ
+    if result.returncode != 1:
+        return None
+    output = result.stdout.decode("utf-8")
+    hunks_start = output.find("\n@@ ")
+    if hunks_start == -1:
+        return None
+    hunks = output[hunks_start:].removesuffix("\n")
+    # Swap git's temp-file headers for the repo-relative ones difflib would emit
+    return f"--- a/{file_path}\n+++ b/{file_path}{hunks}"
+
+
+def _parse_hunks(
+    diff_text: str,
+) -> list[tuple[str, list[tuple[int, int, list[str], bool, bool]]]] | None:
+    """Split a plain unified diff into per-file hunks.
+
+    Returns (path, hunks) pairs, where each hunk is (source_start,
+    source_length, source_lines, has_leading_context, has_trailing_context),
+    or None when the diff uses anything beyond modified-file text hunks
+    (new/deleted files, renames, binary or mode headers, missing-newline
+    markers, malformed counts).
+    """
+    files: list[tuple[str, list[tuple[int, int, list[str], bool, bool]]]] = []
+    lines = diff_text.split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line or line.startswith(("diff --git ", "index ")):
+            i += 1
+            continue
+        if not (line.startswith("--- a/") and i + 1 < len(lines)):
+            return None
+        old_path = line[6:].split("\t", 1)[0]
+        new_line = lines[i + 1]
+        if not new_line.startswith("+++ b/") or new_line[6:].split("\t", 1)[0] != old_path:
+            return None
+        i += 2
+
+        hunks: list[tuple[int, int, list[str], bool, bool]] = []
+        while i < len(lines) and lines[i].startswith("@@"):
+            header = HUNK_HEADER_RE.match(lines[i])
+            if header is None:
+                return None
+            source_start = int(header.group(1))
+            source_length = int(header.group(2) or 1)
+            target_length = int(header.group(4) or 1)
+            i += 1
+
+            source_lines: list[str] = []
+            kinds: list[str] = []
+            target_seen = 0
+            while len(source_lines) < source_length or target_seen < target_length:
+                if i >= len(lines):
+                    return None
+                body = lines[i]
+                kind = body[:1]
+                if kind == " ":
+                    source_lines.append(body[1:])
+                    target_seen += 1
+                elif kind == "-":
+                    source_lines.append(body[1:])
+                elif kind == "+":
+                    target_seen += 1
+                else:
+                    return None
+                kinds.append(kind)
+                i += 1
+            if len(source_lines) != source_length or target_seen != target_length or not kinds:
+                return None
+            hunks.append(
+                (source_start, source_length, source_lines, kinds[0] == " ", kinds[-1] == " ")
+            )
+        if not hunks:
+            return None
+        files.append((old_path, hunks))
+    return files or None
+
+
+def _check_hunks_in_memory(
+    diff_text: str,
+    original_files: dict[str, str],
+) -> tuple[bool, str] | None:
+    """Decide a plain text diff against in-memory originals where that is exact.
+
+    Accepts when every hunk's context matches at its stated line, which git
+    apply accepts too. Rejects when a file is missing or a file's first hunk
+    matches nowhere in it, which git apply rejects too. Anything else
+    (offset or later-hunk mismatches, unusual constructs) returns None so
+    the caller can defer to git.
+    """
+    parsed = _parse_hunks(diff_text)
+    if parsed is None:
+        return None
+
+    # Same key filtering as the temp directory writes in validate_diff_with_git
+    contents: dict[str, str] = {}
+    for relative_path, original in original_files.items():
+        file_path = Path(relative_path)
+        if ".." in file_path.parts or file_path.is_absolute():
+            continue
+        contents[file_path.as_posix()] = original
+
+    if len({path for path, _ in parsed}) != len(parsed):
+        return None
+
+    for path, hunks in parsed:
+        content = contents.get(path)
+        if content is None:
+            return False, f"error: {path}: No such file or directory\n"
+        original_lines = content.split("\n")
+        # A final line without "\n" needs a missing-newline marker; leave it to git
+        has_incomplete_line = original_lines[-1] != ""
+        if not has_incomplete_line:
+            original_lines.pop()
+        line_count = len(original_lines)
+
+        previous_end = 0
+        for index, (start, length, source_lines, leading, trailing) in enumerate(hunks):
+            offset = start - 1 if length else start
+            end = offset + length
+            if (
+                offset >= previous_end
+                and original_lines[offset:end] == source_lines
+                # git apply pins context-free hunk edges to the file start/end
+                and (leading or offset == 0)
+                and (trailing or end == line_count)
+                and not (has_incomplete_line and end == line_count)
+            ):
+                previous_end = end
+                continue
+            if index == 0 and not _contains_block(original_lines, source_lines):
+                return False, (
+                    f"error: patch failed: {path}:{start}\n"
+                    f"error: {path}: patch does not apply\n"
+                )
+            return None
+    return True, ""
+
+
+def _contains_block(lines: list[str], block: list[str]) -> bool:
+    """Whether block occurs as a contiguous run anywhere in lines."""
+    if not block:
+        return True
+    first = block[0]
+    size = len(block)
+    return any(
+        lines[i] == first and lines[i : i + size] == block
+        for i in range(len(lines) - size + 1)
+    )
 
 
 def validate_diff_with_git(
     diff_text: str,
     original_files: dict[str, str],
 ) -> tuple[bool, str]:
-    """Validate a diff by running git apply --check in a temp repo.
+    """Validate a diff as git apply --check would.
+
+    Plain text hunks are checked in memory against original_files; only
+    diffs that check cannot settle are written to a temp directory and run
+    through git apply --check.
 
     Args:
         diff_text: The unified diff to validate.
         original_files: Mapping of {relative_path: content} for files
-            referenced in the diff. These are written into a temp git repo.
+            referenced in the diff. These are written into a temp directory
+            when git is needed.
 
     Returns:
         Tuple of (is_valid, error_message). error_message is empty on success.
     """
+    in_memory = _check_hunks_in_memory(diff_text, original_files)
+    if in_memory is not None:
+        return in_memory
+
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_path = Path(tmpdir)
 
@@ -82,46 +280,17 @@ def validate_diff_with_git(
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(content)
 
-        # Initialize git repo
-        subprocess.run(
-            ["git", "init"],
-            cwd=tmpdir,
-            capture_output=True,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=tmpdir,
-            capture_output=True,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=tmpdir,
-            capture_output=True,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "add", "."],
-            cwd=tmpdir,
-            capture_output=True,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "init"],
-            cwd=tmpdir,
-            capture_output=True,
-            check=True,
-        )
-
         # Run git apply --check
         # Ensure diff ends with newline for git apply
         diff_input = diff_text if diff_text.endswith('\n') else diff_text + '\n'
+        # git apply works outside a repository, checking against the files on
+        # disk; the ceiling keeps it from adopting a repo that encloses tmpdir
         result = subprocess.run(
             ["git", "apply", "--check"],
             input=diff_input.encode("utf-8"),
             cwd=tmpdir,
             capture_output=True,
+            env={**os.environ, "GIT_CEILING_DIRECTORIES": str(resolved_tmp.parent)},
         )
 
         is_valid = result.returncode == 0
@@ -141,45 +310,28 @@ def detect_code_style(source_code: str) -> dict[str, str]:
             "indent": e.g. "2 spaces", "4 spaces", "tabs"
             "quotes": "single" or "double"
     """
+    indent_style, quote_style = _detect_code_style_cached(source_code)
+    # Callers get their own dict; the cache holds an immutable tuple
+    return {"indent": indent_style, "quotes": quote_style}
+
+
+@functools.lru_cache(maxsize=CODE_STYLE_CACHE_SIZE)
+def _detect_code_style_cached(source_code: str) -> tuple[str, str]:
+    """Return (indent, quotes) for source_code, cached per content."""
     # Default values
     indent_style = "4 spaces"
     quote_style = "double"
 
     # Return defaults for empty source
     if not source_code:
-        return {"indent": indent_style, "quotes": quote_style}
+        return indent_style, quote_style
 
     # Detect indentation
-    indent_counts: dict[int, int] = {}
-    lines = source_code.splitlines()
-
-    for line in lines:
-        if not line or not line[0].isspace():
-            continue
-
-        # Count leading spaces
-        spaces = 0
-        for char in line:
-            if char == " ":
-                spaces += 1
-            elif char == "\t":
-                # Found a tab - assume tabs
-                indent_style = "tabs"
-                break
-            else:
-                break
-
-        if indent_style == "tabs":
-            break
-
-        if spaces > 0:
-            indent_counts[spaces] = indent_counts.get(spaces, 0) + 1
-
-    # If we didn't find tabs, determine most common space indent
-    if indent_style != "tabs" and indent_counts:
-        # Find the smallest non-zero indent level (likely the base indent)
-        base_indent = min(indent_counts.keys())
-        indent_style = f"{base_indent} spaces"
+    indent_step = _most_common_indent_step(source_code.encode("utf-8"))
+    if indent_step == -1:
+        indent_style = "tabs"
+    elif indent_step:
+        indent_style = f"{indent_step} spaces"
 
     # Detect quotes
     single_quote_count = source_code.count("'")
@@ -190,4 +342,41 @@ def detect_code_style(source_code: str) -> dict[str, str]:
     else:
         quote_style = "double"
 
-    return {"indent": indent_style, "quotes": quote_style}
+    return indent_style, quote_style
+
+
+def _most_common_indent_step(source: bytes) -> int:
+    """Return the most common change in leading spaces between content lines.
+
+    Steps are measured between consecutive non-blank lines (the first one
+    against column 0), so nested 2-space code still reads as 2 and a few
+    odd lines such as " * " comment continuations do not win. All offsets
+    come from whole-buffer numpy operations rather than a per-line loop.
+
+    Returns:
+        The step in spaces, 0 if no line is indented, or -1 if any line is
+        indented with a tab.
+    """
+    data = np.frombuffer(source, dtype=np.uint8)
+    size = len(data)
+    line_starts = np.concatenate(([0], np.flatnonzero(data == _NEWLINE) + 1))
+
+    # Offset of the first non-space byte at or after each position; index
+    # size is a sentinel that reads as a newline (blank line)
+    positions = np.arange(size + 1)
+    non_space = np.append(data != _SPACE, True)
+    next_non_space = np.minimum.accumulate(np.where(non_space, positions, size)[::-1])[::-1]
+    first = next_non_space[line_starts]
+    first_bytes = np.append(data, _NEWLINE)[first]
+
+    if (first_bytes == _TAB).any():
+        return -1
+
+    content = (first_bytes != _NEWLINE) & (first_bytes != _CR)
+    indents = (first - line_starts)[content]
+    steps = np.abs(np.diff(indents, prepend=0))
+    steps = steps[steps > 0]
+    if not steps.size:
+        return 0
+    # argmax takes the smallest step on ties
+    return int(np.bincount(steps).argmax())
@@ -4,6 +4,7 @@ Unit tests for AST Parser utility module.
 Tests all functions in refactor_bot.utils.ast_parser against fixture files.
 """
 
+import threading
 from pathlib import Path
 
 import pytest
@@ -11,21 +12,51 @@ import pytest
 # NOTE: These imports will work once the engineer creates the source files
 from refactor_bot.utils.ast_parser import (
     detect_barrel_file,
+    detect_hooks_usage,
     detect_react_component,
     detect_server_component,
+    detect_server_component_path,
     detect_suspense_boundary,
     extract_exports,
+    extract_file_data,
     extract_imports,
     extract_symbols,
     get_language_for_file,
+    get_parser,
     parse_file,
 )
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
 
 @pytest.fixture
 def fixtures_dir():
     """Return the path to the fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_DIR
+
+
+@pytest.fixture(scope="module")
+def parsed():
+    """Return a loader that parses each fixture file once per module.
+
+    Tests only read the trees, so one (file_path, tree, language) per
+    fixture is shared by every test that asks for it.
+    """
+    cache: dict[str, tuple] = {}
+
+    def load(name: str) -> tuple:
+        if name not in cache:
+            file_path = str(FIXTURES_DIR / name)
+            cache[name] = (file_path, *parse_file(file_path))
+        return cache[name]
+
+    return load
+
+
+@pytest.fixture(scope="module")
+def fixture_bytes():
+    """Raw bytes of every top-level fixture file, read once per module."""
+    return {p.name: p.read_bytes() for p in FIXTURES_DIR.iterdir() if p.is_file()}
 
 
 class TestGetLanguageForFile:
@@ -53,6 +84,23 @@ class TestGetLanguageForFile:
             get_language_for_file("sample.py")
 
 
+class TestGetParser:
+    """Test parser reuse."""
+
+    def test_get_parser_reused_within_thread(self):
+        """The same thread should get the same Parser back for a language."""
+        assert get_parser("tsx") is get_parser("tsx")
+        assert get_parser("tsx") is not get_parser("javascript")
+
+    def test_get_parser_not_shared_across_threads(self):
+        """Each thread should build its own Parser."""
+        other: list = []
+        thread = threading.Thread(target=lambda: other.append(get_parser("tsx")))
+        thread.start()
+        thread.join()
+        assert other[0] is not get_parser("tsx")
+
+
 class TestParseFile:
     """Test file parsing with tree-sitter."""
 
@@ -88,39 +136,35 @@ class TestParseFile:
 class TestExtractSymbols:
     """Test symbol extraction from parsed trees."""
 
-    def test_extract_symbols_js_functions(self, fixtures_dir):
+    def test_extract_symbols_js_functions(self, parsed):
         """JavaScript file should extract both named and arrow functions."""
-        file_path = str(fixtures_dir / "sample.js")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.js")
         symbols = extract_symbols(tree, language, file_path)
 
         symbol_names = [s.name for s in symbols]
         assert "calculateTotal" in symbol_names
         assert "formatPrice" in symbol_names
 
-    def test_extract_symbols_ts_class(self, fixtures_dir):
+    def test_extract_symbols_ts_class(self, parsed):
         """TypeScript file should extract class and function definitions."""
-        file_path = str(fixtures_dir / "sample.ts")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.ts")
         symbols = extract_symbols(tree, language, file_path)
 
         symbol_names = [s.name for s in symbols]
         assert "UserService" in symbol_names
         assert "validateEmail" in symbol_names
 
-    def test_extract_symbols_tsx_component(self, fixtures_dir):
+    def test_extract_symbols_tsx_component(self, parsed):
         """TSX file should extract React component function."""
-        file_path = str(fixtures_dir / "sample.tsx")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.tsx")
         symbols = extract_symbols(tree, language, file_path)
 
         symbol_names = [s.name for s in symbols]
         assert "ProductCard" in symbol_names
 
-    def test_extract_symbols_line_numbers(self, fixtures_dir):
+    def test_extract_symbols_line_numbers(self, parsed):
         """Extracted symbols should have correct start and end line numbers."""
-        file_path = str(fixtures_dir / "sample.js")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.js")
         symbols = extract_symbols(tree, language, file_path)
 
         for symbol in symbols:
@@ -129,10 +173,9 @@ class TestExtractSymbols:
             assert symbol.start_byte >= 0
             assert symbol.end_byte > symbol.start_byte
 
-    def test_extract_symbols_source_code(self, fixtures_dir):
+    def test_extract_symbols_source_code(self, parsed):
         """Extracted symbols should contain the actual source code."""
-        file_path = str(fixtures_dir / "sample.js")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.js")
         symbols = extract_symbols(tree, language, file_path)
 
         for symbol in symbols:
@@ -140,22 +183,29 @@ class TestExtractSymbols:
             # Source code should contain the symbol name
             assert symbol.name in symbol.source_code
 
+    def test_extract_symbols_source_code_with_leading_whitespace(self, tmp_path):
+        """Source slices should line up even when the file starts with blank lines."""
+        source = tmp_path / "lead.js"
+        source.write_text("\n\n   function lead() { return 1; }\n")
+        tree, language = parse_file(str(source))
+
+        symbols = extract_symbols(tree, language, str(source))
+        assert [s.source_code for s in symbols] == ["function lead() { return 1; }"]
+
 
 class TestExtractImports:
     """Test import statement extraction."""
 
-    def test_extract_imports_relative(self, fixtures_dir):
+    def test_extract_imports_relative(self, parsed):
         """Should extract relative import paths."""
-        file_path = str(fixtures_dir / "sample.js")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.js")
         imports = extract_imports(tree, language)
 
         assert "./utils" in imports
 
-    def test_extract_imports_node_module(self, fixtures_dir):
+    def test_extract_imports_node_module(self, parsed):
         """Should extract node_modules import paths."""
-        file_path = str(fixtures_dir / "sample.tsx")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.tsx")
         imports = extract_imports(tree, language)
 
         assert "react" in imports
@@ -164,10 +214,9 @@ class TestExtractImports:
 class TestReactDetection:
     """Test React-specific detection functions."""
 
-    def test_detect_react_component_true(self, fixtures_dir):
+    def test_detect_react_component_true(self, parsed):
         """React components should be detected correctly."""
-        file_path = str(fixtures_dir / "sample.tsx")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.tsx")
         symbols = extract_symbols(tree, language, file_path)
 
         # ProductCard should be detected as a component
@@ -178,19 +227,17 @@ class TestReactDetection:
         detect_react_component(tree.root_node, tree.root_node.text)
         # Note: The actual implementation will check specific function nodes
 
-    def test_detect_react_component_false(self, fixtures_dir):
+    def test_detect_react_component_false(self, parsed):
         """Utility functions should not be detected as components."""
-        file_path = str(fixtures_dir / "utils.ts")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("utils.ts")
 
         # Utility functions don't return JSX
         detect_react_component(tree.root_node, tree.root_node.text)
         # Implementation should return False for non-component functions
 
-    def test_detect_hooks_usage(self, fixtures_dir):
+    def test_detect_hooks_usage(self, parsed):
         """Should detect React hooks usage in components."""
-        file_path = str(fixtures_dir / "sample.tsx")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.tsx")
 
         # Get the ProductCard function node and check for hooks
         symbols = extract_symbols(tree, language, file_path)
@@ -201,57 +248,91 @@ class TestReactDetection:
             # Actual implementation will search the function body for hook calls
             pass
 
-    def test_detect_suspense_boundary(self, fixtures_dir):
+    def test_detect_with_language_matches_tree_walk(self, parsed):
+        """Query-based detection should agree with the language-less tree walk."""
+        for name in ("sample.tsx", "sample.js", "utils.ts"):
+            _, tree, language = parsed(name)
+            for node in tree.root_node.children:
+                source = tree.root_node.text
+                assert detect_react_component(node, source, language) == detect_react_component(
+                    node, source
+                )
+                assert detect_hooks_usage(node, source, language) == detect_hooks_usage(
+                    node, source
+                )
+
+    def test_detect_suspense_boundary(self, parsed):
         """Should detect Suspense boundary in server components."""
-        file_path = str(fixtures_dir / "server_component.tsx")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("server_component.tsx")
 
         has_suspense = detect_suspense_boundary(tree, language)
         assert has_suspense is True
 
-    def test_detect_barrel_file_true(self, fixtures_dir):
+    def test_detect_barrel_file_true(self, parsed):
         """Barrel files with only re-exports should be detected."""
-        file_path = str(fixtures_dir / "barrel.ts")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("barrel.ts")
 
         is_barrel = detect_barrel_file(tree, language)
         assert is_barrel is True
 
-    def test_detect_barrel_file_false(self, fixtures_dir):
+    def test_detect_barrel_file_false(self, parsed):
         """Files with function/class definitions should not be barrels."""
-        file_path = str(fixtures_dir / "sample.ts")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.ts")
 
         is_barrel = detect_barrel_file(tree, language)
         assert is_barrel is False
 
-    def test_detect_server_component_true(self, fixtures_dir):
+    def test_detect_server_component_true(self, fixture_bytes):
         """Server components (without 'use client') should be detected."""
-        file_path = str(fixtures_dir / "server_component.tsx")
-        with open(file_path, 'rb') as f:
-            source_bytes = f.read()
-
-        is_server = detect_server_component(source_bytes)
+        is_server = detect_server_component(fixture_bytes["server_component.tsx"])
         assert is_server is True
 
-    def test_detect_server_component_false(self, fixtures_dir):
+    def test_detect_server_component_false(self, fixture_bytes):
         """Client components (with 'use client') should not be server components."""
-        file_path = str(fixtures_dir / "sample.tsx")
-        with open(file_path, 'rb') as f:
-            source_bytes = f.read()
-
-        is_server = detect_server_component(source_bytes)
+        is_server = detect_server_component(fixture_bytes["sample.tsx"])
         assert is_server is False
 
+    @pytest.mark.parametrize("name", ["server_component.tsx", "sample.tsx", "sample.js"])
+    def test_detect_server_component_path_matches_bytes(self, fixtures_dir, fixture_bytes, name):
+        """Reading only the file head should agree with the full-bytes check."""
+        assert detect_server_component_path(str(fixtures_dir / name)) == (
+            detect_server_component(fixture_bytes[name])
+        )
+
+    def test_detect_server_component_path_ignores_late_directive(self, tmp_path):
+        """A directive past the scanned head does not make a client component."""
+        source = tmp_path / "late.tsx"
+        source.write_bytes(b"\n" * 10 + b"'use client'\n")
+        assert detect_server_component_path(str(source)) is True
+        assert detect_server_component(source.read_bytes()) is True
+
 
 class TestExtractExports:
     """Test export statement extraction."""
 
-    def test_extract_exports(self, fixtures_dir):
+    def test_extract_exports(self, parsed):
         """Should extract export names from files."""
-        file_path = str(fixtures_dir / "sample.js")
-        tree, language = parse_file(file_path)
+        file_path, tree, language = parsed("sample.js")
         exports = extract_exports(tree, language)
 
         # sample.js exports calculateTotal and formatPrice
         assert len(exports) > 0
+
+
+class TestExtractFileData:
+    """Test the single-pass extraction."""
+
+    @pytest.mark.parametrize(
+        "name", ["sample.js", "sample.ts", "sample.tsx", "barrel.ts", "server_component.tsx"]
+    )
+    def test_matches_separate_extractors(self, parsed, name):
+        """Fused results should equal the individual extractor calls."""
+        file_path, tree, language = parsed(name)
+        symbols, imports, exports, has_suspense = extract_file_data(tree, language, file_path)
+
+        assert [s.model_dump() for s in symbols] == [
+            s.model_dump() for s in extract_symbols(tree, language, file_path)
+        ]
+        assert imports == extract_imports(tree, language)
+        assert exports == extract_exports(tree, language)
+        assert has_suspense == detect_suspense_boundary(tree, language)
@@ -83,36 +83,128 @@ def _make_base_repo_index(is_react_project: bool = True) -> RepoIndex:
     )
 
 
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def auditor() -> ConsistencyAuditor:
+    """One auditor for the module; audit() resets its per-run state."""
+    return ConsistencyAuditor()
+
+
+@pytest.fixture(scope="module")
+def base_repo_indexes() -> dict[bool, RepoIndex]:
+    """Base RepoIndex per is_react_project value, built once."""
+    return {
+        is_react: _make_base_repo_index(is_react_project=is_react)
+        for is_react in (True, False)
+    }
+
+
+# Diffs audited together against the React base index: (file_path, content).
+# Every check except signature mismatch and dependency integrity is per diff,
+# and neither of those links these files, so each file's findings match a
+# single-diff audit.
+REACT_INDEX_CASES = [
+    ("src/counter.ts", ORPHANED_IMPORT_CONTENT),
+    ("src/clean.ts", CLEAN_TS_CONTENT),
+    ("src/my_form.tsx", BARREL_IMPORT_CONTENT),
+    ("src/consumer.ts", NONEXISTENT_DEP_CONTENT),
+]
+
+
+@pytest.fixture(scope="module")
+def combined_report(auditor, base_repo_indexes) -> AuditReport:
+    """One audit over every REACT_INDEX_CASES diff."""
+    diffs = [
+        _make_file_diff(file_path, content, task_id=f"task-{i}")
+        for i, (file_path, content) in enumerate(REACT_INDEX_CASES, start=1)
+    ]
+    return auditor.audit(diffs, base_repo_indexes[True])
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 
-def test_audit_detects_orphaned_import():
-    """FileDiff with useCallback imported but unused → report.passed=False,
-    at least one orphaned_import finding with ERROR severity."""
-    auditor = ConsistencyAuditor()
-    diff = _make_file_diff("src/counter.ts", ORPHANED_IMPORT_CONTENT)
-    repo_index = _make_base_repo_index()
+def test_audit_combined_report_covers_all_diffs(combined_report):
+    """Every case diff is audited, and the error cases fail the whole report."""
+    assert combined_report.diffs_audited == len(REACT_INDEX_CASES)
+    assert combined_report.passed is False
+
+
+@pytest.mark.parametrize(
+    ("file_path", "finding_type", "severity", "file_passes", "mentions"),
+    [
+        # useCallback imported but unused -> ERROR orphaned_import
+        pytest.param(
+            "src/counter.ts", "orphaned_import", FindingSeverity.ERROR, False, "useCallback",
+            id="orphaned_import",
+        ),
+        # All imports used and no mismatches -> no errors for the file
+        pytest.param("src/clean.ts", None, None, True, None, id="clean_diff"),
+        # Barrel import signal (@mui/material) in a React project -> WARNING
+        # anti_pattern, which alone does not fail the file
+        pytest.param(
+            "src/my_form.tsx", "anti_pattern", FindingSeverity.WARNING, True, None,
+            id="react_anti_pattern_warning",
+        ),
+        # Import of './nonexistent', absent from repo_index.files -> ERROR
+        # dependency_integrity
+        pytest.param(
+            "src/consumer.ts", "dependency_integrity", FindingSeverity.ERROR, False, None,
+            id="dependency_integrity",
+        ),
+    ],
+)
+def test_audit_react_index_cases(
+    combined_report, file_path, finding_type, severity, file_passes, mentions
+):
+    """Check one file's slice of the combined report.
+
+    file_passes says whether the file has no ERROR findings, i.e. whether a
+    single-diff audit of it would pass; finding_type None means only that.
+    """
+    file_findings = [f for f in combined_report.findings if f.file_path == file_path]
+    has_errors = any(f.severity == FindingSeverity.ERROR for f in file_findings)
+    assert has_errors is not file_passes
+
+    if finding_type is None:
+        return
+
+    findings = [f for f in file_findings if f.finding_type == finding_type]
+    assert len(findings) >= 1
+    for finding in findings:
+        assert finding.severity == severity
+
+    if mentions is not None:
+        descriptions = " ".join((f.description or "") + (f.evidence or "") for f in findings)
+        assert mentions in descriptions
+
+
+def test_audit_clean_diff_passes(auditor, base_repo_indexes):
+    """A diff whose imports are all used produces a passing report."""
+    diff = _make_file_diff("src/counter.ts", CLEAN_TS_CONTENT)
 
-    report = auditor.audit([diff], repo_index)
+    report = auditor.audit([diff], base_repo_indexes[True])
 
-    assert report.passed is False
+    assert report.passed is True
+    assert report.error_count == 0
 
-    orphaned_findings = [
-        f for f in report.findings if f.finding_type == "orphaned_import"
-    ]
-    assert len(orphaned_findings) >= 1
 
-    # All orphaned_import findings should be ERROR severity
-    for finding in orphaned_findings:
-        assert finding.severity == FindingSeverity.ERROR
+def test_audit_non_react_skips_anti_pattern(auditor, base_repo_indexes):
+    """When is_react_project=False the auditor should not produce any
+    anti_pattern findings, even when the content matches a signal."""
+    diff = _make_file_diff("src/my_form.tsx", BARREL_IMPORT_CONTENT)
 
-    # The description or evidence should mention useCallback
-    descriptions = " ".join(
-        (f.description or "") + (f.evidence or "") for f in orphaned_findings
-    )
-    assert "useCallback" in descriptions
+    report = auditor.audit([diff], base_repo_indexes[False])
+
+    anti_pattern_findings = [
+        f for f in report.findings if f.finding_type == "anti_pattern"
+    ]
+    assert len(anti_pattern_findings) == 0
 
 
 def test_audit_detects_signature_mismatch():
@@ -173,53 +265,6 @@ export function fetchUser(id: string) {
         assert finding.severity == FindingSeverity.ERROR
 
 
-def test_audit_clean_diff_passes():
-    """Diff where all imports are used and no mismatches → report.passed=True,
-    error_count == 0."""
-    auditor = ConsistencyAuditor()
-    diff = _make_file_diff("src/counter.ts", CLEAN_TS_CONTENT)
-    repo_index = _make_base_repo_index()
-
-    report = auditor.audit([diff], repo_index)
-
-    assert report.passed is True
-    assert report.error_count == 0
-
-
-def test_audit_react_anti_pattern_warning():
-    """React project diff containing a barrel import signal (@mui/material)
-    should emit a WARNING finding with finding_type='anti_pattern'."""
-    auditor = ConsistencyAuditor()
-    diff = _make_file_diff("src/my_form.tsx", BARREL_IMPORT_CONTENT)
-    repo_index = _make_base_repo_index(is_react_project=True)
-
-    report = auditor.audit([diff], repo_index)
-
-    anti_pattern_findings = [
-        f for f in report.findings if f.finding_type == "anti_pattern"
-    ]
-    assert len(anti_pattern_findings) >= 1
-
-    # Anti-pattern findings must be WARNING (not ERROR), so the report may still pass
-    for finding in anti_pattern_findings:
-        assert finding.severity == FindingSeverity.WARNING
-
-
-def test_audit_non_react_skips_anti_pattern():
-    """When is_react_project=False the auditor should not produce any
-    anti_pattern findings, even when the content matches a signal."""
-    auditor = ConsistencyAuditor()
-    diff = _make_file_diff("src/my_form.tsx", BARREL_IMPORT_CONTENT)
-    repo_index = _make_base_repo_index(is_react_project=False)
-
-    report = auditor.audit([diff], repo_index)
-
-    anti_pattern_findings = [
-        f for f in report.findings if f.finding_type == "anti_pattern"
-    ]
-    assert len(anti_pattern_findings) == 0
-
-
 def test_audit_unsupported_extension_skipped():
     """A FileDiff with a .py extension should be handled gracefully.
     The audit must complete without raising an exception and may return
@@ -262,20 +307,19 @@ def test_audit_multiple_diffs():
     assert report.passed is False
 
 
-def test_audit_dependency_integrity():
-    """A diff that imports './nonexistent' (not present in repo_index.files)
-    should produce a dependency_integrity finding."""
-    auditor = ConsistencyAuditor()
-    diff = _make_file_diff("src/consumer.ts", NONEXISTENT_DEP_CONTENT)
+def test_audit_threaded_parse_matches_serial(combined_report, base_repo_indexes):
+    """Parsing diffs on threads yields the same findings, IDs and order."""
+    diffs = [
+        _make_file_diff(file_path, content, task_id=f"task-{i}")
+        for i, (file_path, content) in enumerate(REACT_INDEX_CASES, start=1)
+    ]
+    threaded = ConsistencyAuditor(max_workers=4).audit(diffs, base_repo_indexes[True])
+    serial = ConsistencyAuditor(max_workers=1).audit(diffs, base_repo_indexes[True])
 
-    # repo_index does not contain any file matching nonexistent
-    repo_index = _make_base_repo_index()
+    assert threaded.findings == serial.findings == combined_report.findings
 
-    report = auditor.audit([diff], repo_index)
 
-    dep_findings = [
-        f for f in report.findings if f.finding_type == "dependency_integrity"
-    ]
-    assert len(dep_findings) >= 1
-    for finding in dep_findings:
-        assert finding.severity == FindingSeverity.ERROR
+def test_auditor_rejects_max_workers_below_one():
+    """max_workers=0 is an error rather than a request for the CPU count."""
+    with pytest.raises(ValueError):
+        ConsistencyAuditor(max_workers=0)
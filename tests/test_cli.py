@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import json
+from contextlib import ExitStack
+from pathlib import Path
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -35,6 +39,12 @@ from refactor_bot.orchestrator.exceptions import GraphBuildError, OrchestratorEr
 # Helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def _parser():
+    """Build the CLI parser once; parse_args does not mutate it."""
+    return build_parser()
+
+
 def _mock_agents():
     """Return a mock agent dict matching create_agents() output."""
     return {k: MagicMock() for k in ("indexer", "retriever", "planner", "executor", "auditor", "validator")}
@@ -51,29 +61,30 @@ def _mock_result(**overrides):
     return base
 
 
-# Patch targets for lazy imports inside create_agents()
-_AGENT_PATCHES = [
-    "refactor_bot.rag.embeddings.EmbeddingService",
-    "refactor_bot.rag.vector_store.VectorStore",
-    "refactor_bot.rag.retriever.Retriever",
-    "refactor_bot.agents.repo_indexer.RepoIndexer",
-    "refactor_bot.agents.planner.Planner",
-    "refactor_bot.agents.refactor_executor.RefactorExecutor",
-    "refactor_bot.agents.consistency_auditor.ConsistencyAuditor",
-    "refactor_bot.agents.test_validator.TestValidator",
-]
+# Mock key -> patch target for lazy imports inside create_agents()
+_AGENT_PATCHES = {
+    "emb": "refactor_bot.rag.embeddings.EmbeddingService",
+    "vs": "refactor_bot.rag.vector_store.VectorStore",
+    "ret": "refactor_bot.rag.retriever.Retriever",
+    "idx": "refactor_bot.agents.repo_indexer.RepoIndexer",
+    "plan": "refactor_bot.agents.planner.Planner",
+    "exec": "refactor_bot.agents.refactor_executor.RefactorExecutor",
+    "aud": "refactor_bot.agents.consistency_auditor.ConsistencyAuditor",
+    "val": "refactor_bot.agents.test_validator.TestValidator",
+}
 
-_AGENT_KEYS = ["emb", "vs", "ret", "idx", "plan", "exec", "aud", "val"]
+
+@pytest.fixture(scope="module")
+def repo_dir(tmp_path_factory):
+    """Empty directory shared by tests that only need a valid repo path."""
+    return tmp_path_factory.mktemp("cli_repo")
 
 
 @pytest.fixture()
 def patched_agents():
     """Patch all agent constructors inside create_agents."""
-    patches = [patch(p) for p in _AGENT_PATCHES]
-    mocks = [p.start() for p in patches]
-    yield dict(zip(_AGENT_KEYS, mocks))
-    for p in patches:
-        p.stop()
+    with ExitStack() as stack:
+        yield {key: stack.enter_context(patch(target)) for key, target in _AGENT_PATCHES.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -81,14 +92,12 @@ def patched_agents():
 # ---------------------------------------------------------------------------
 class TestBuildParser:
     def test_parser_positional_args(self):
-        parser = build_parser()
-        args = parser.parse_args(["my directive", "/tmp"])
+        args = _parser().parse_args(["my directive", "/tmp"])
         assert args.directive == "my directive"
         assert args.repo_path == "/tmp"
 
     def test_parser_all_optional_flags(self):
-        parser = build_parser()
-        args = parser.parse_args([
+        args = _parser().parse_args([
             "directive text",
             "/tmp",
             "--max-retries", "5",
@@ -109,8 +118,7 @@ class TestBuildParser:
         assert args.output_pr_artifact_format == "json"
 
     def test_parser_defaults(self):
-        parser = build_parser()
-        args = parser.parse_args(["d", "/tmp"])
+        args = _parser().parse_args(["d", "/tmp"])
         assert args.max_retries == DEFAULT_MAX_RETRIES
         assert args.timeout == DEFAULT_TIMEOUT
         assert args.model == DEFAULT_MODEL
@@ -120,11 +128,15 @@ class TestBuildParser:
         assert args.verbose is False
         assert args.output_pr_artifact == ""
         assert args.output_pr_artifact_format == "json"
+        assert args.index_workers == 1
+
+    def test_parser_rejects_index_workers_below_one(self):
+        with pytest.raises(SystemExit):
+            _parser().parse_args(["d", "/tmp", "--index-workers", "0"])
 
     def test_parser_no_api_key_flags(self):
         """API keys removed from CLI args (SEC-C7-001); verify they don't exist."""
-        parser = build_parser()
-        args = parser.parse_args(["d", "/tmp"])
+        args = _parser().parse_args(["d", "/tmp"])
         assert not hasattr(args, "api_key")
         assert not hasattr(args, "openai_key")
 
@@ -133,9 +145,9 @@ class TestBuildParser:
 # TestValidateRepoPath
 # ---------------------------------------------------------------------------
 class TestValidateRepoPath:
-    def test_validate_valid_dir(self, tmp_path):
-        result = validate_repo_path(str(tmp_path))
-        assert result == str(tmp_path.resolve())
+    def test_validate_valid_dir(self, repo_dir):
+        result = validate_repo_path(str(repo_dir))
+        assert result == str(repo_dir.resolve())
 
     def test_validate_nonexistent(self):
         with pytest.raises(SystemExit) as exc_info:
@@ -154,11 +166,11 @@ class TestValidateRepoPath:
 # TestDryRun
 # ---------------------------------------------------------------------------
 class TestDryRun:
-    def test_dry_run_exits_zero(self, tmp_path):
-        assert main(["test", str(tmp_path), "--dry-run"]) == EXIT_SUCCESS
+    def test_dry_run_exits_zero(self, repo_dir):
+        assert main(["test", str(repo_dir), "--dry-run"]) == EXIT_SUCCESS
 
-    def test_dry_run_json_output(self, tmp_path, capsys):
-        rc = main(["test", str(tmp_path), "--dry-run", "--output-json"])
+    def test_dry_run_json_output(self, repo_dir, capsys):
+        rc = main(["test", str(repo_dir), "--dry-run", "--output-json"])
         assert rc == EXIT_SUCCESS
         captured = capsys.readouterr()
         data = json.loads(captured.out)
@@ -173,14 +185,19 @@ class TestDryRun:
 # ---------------------------------------------------------------------------
 class TestCreateAgents:
     def test_create_agents_returns_all_keys(self, patched_agents):
-        args = build_parser().parse_args(["d", "/tmp"])
+        args = _parser().parse_args(["d", "/tmp"])
         result = create_agents(args)
         assert set(result.keys()) == {
             "indexer", "retriever", "planner", "executor", "auditor", "validator",
         }
 
+    def test_create_agents_forwards_index_workers(self, patched_agents):
+        args = _parser().parse_args(["d", "/tmp", "--index-workers", "4"])
+        create_agents(args)
+        assert patched_agents["idx"].call_args.kwargs == {"max_workers": 4}
+
     def test_create_agents_forwards_provider_configuration(self, patched_agents):
-        args = build_parser().parse_args(
+        args = _parser().parse_args(
             [
                 "d",
                 "/tmp",
@@ -202,20 +219,20 @@ class TestCreateAgents:
 
     def test_create_agents_reads_env_api_key(self, patched_agents, monkeypatch):
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test123")
-        args = build_parser().parse_args(["d", "/tmp"])
+        args = _parser().parse_args(["d", "/tmp"])
         create_agents(args)
         for mock_cls in (patched_agents["plan"], patched_agents["exec"], patched_agents["val"]):
             assert mock_cls.call_args.kwargs.get("api_key") == "sk-test123"
 
     def test_create_agents_reads_env_openai_key(self, patched_agents, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "ok-test456")
-        args = build_parser().parse_args(["d", "/tmp"])
+        args = _parser().parse_args(["d", "/tmp"])
         create_agents(args)
         assert patched_agents["emb"].call_args.kwargs.get("api_key") == "ok-test456"
 
     def test_create_agents_enables_human_fallback_on_tty(self, patched_agents):
         with patch("refactor_bot.cli.main.sys.stdin.isatty", return_value=True):
-            args = build_parser().parse_args(["d", "/tmp"])
+            args = _parser().parse_args(["d", "/tmp"])
             create_agents(args)
 
             for mock_cls in (patched_agents["plan"], patched_agents["exec"], patched_agents["val"]):
@@ -238,6 +255,16 @@ class TestOutputFormatting:
         parsed = json.loads(output)
         assert parsed["directive"] == "refactor"
 
+    @pytest.mark.parametrize("directive", ["refactor", "réfactor ✓"])
+    def test_format_result_json_matches_stdlib(self, directive):
+        result = {
+            "errors": [],
+            "task_tree": [{"id": 1, "path": Path("src/a.ts"), "status": TaskStatus.PENDING}],
+            "scores": [0.5, float("nan"), float("inf")],
+            "directive": directive,
+        }
+        assert format_result_json(result) == json.dumps(result, indent=2, default=str)
+
     def test_determine_exit_code_success(self):
         result = {"errors": []}
         assert determine_exit_code(result) == EXIT_SUCCESS
@@ -261,22 +288,22 @@ class TestOutputFormatting:
 # ---------------------------------------------------------------------------
 class TestErrorHandling:
     @patch("refactor_bot.cli.main.create_agents", side_effect=AgentError("boom"))
-    def test_main_agent_error(self, _mock, tmp_path):
-        rc = main(["test", str(tmp_path)])
+    def test_main_agent_error(self, _mock, repo_dir):
+        rc = main(["test", str(repo_dir)])
         assert rc == EXIT_AGENT_ERROR
 
     @patch("refactor_bot.orchestrator.graph.build_graph", side_effect=GraphBuildError("boom"))
     @patch("refactor_bot.cli.main.create_agents")
-    def test_main_graph_build_error(self, mock_create, mock_build, tmp_path):
+    def test_main_graph_build_error(self, mock_create, mock_build, repo_dir):
         mock_create.return_value = _mock_agents()
-        rc = main(["test", str(tmp_path)])
+        rc = main(["test", str(repo_dir)])
         assert rc == EXIT_ORCHESTRATOR_ERROR
 
     @patch("refactor_bot.orchestrator.graph.build_graph", side_effect=OrchestratorError("boom"))
     @patch("refactor_bot.cli.main.create_agents")
-    def test_main_orchestrator_error(self, mock_create, mock_build, tmp_path):
+    def test_main_orchestrator_error(self, mock_create, mock_build, repo_dir):
         mock_create.return_value = _mock_agents()
-        rc = main(["test", str(tmp_path)])
+        rc = main(["test", str(repo_dir)])
         assert rc == EXIT_ORCHESTRATOR_ERROR
 
     def test_main_nonexistent_repo(self):
@@ -285,16 +312,16 @@ class TestErrorHandling:
 
     @patch("refactor_bot.orchestrator.graph.build_graph", side_effect=KeyboardInterrupt)
     @patch("refactor_bot.cli.main.create_agents")
-    def test_main_keyboard_interrupt(self, mock_create, mock_build, tmp_path):
+    def test_main_keyboard_interrupt(self, mock_create, mock_build, repo_dir):
         mock_create.return_value = _mock_agents()
-        rc = main(["test", str(tmp_path)])
+        rc = main(["test", str(repo_dir)])
         assert rc == EXIT_KEYBOARD_INTERRUPT
 
     @patch("refactor_bot.orchestrator.graph.build_graph", side_effect=RuntimeError("oops"))
     @patch("refactor_bot.cli.main.create_agents")
-    def test_main_unexpected_error(self, mock_create, mock_build, tmp_path):
+    def test_main_unexpected_error(self, mock_create, mock_build, repo_dir):
         mock_create.return_value = _mock_agents()
-        rc = main(["test", str(tmp_path)])
+        rc = main(["test", str(repo_dir)])
         assert rc == EXIT_UNEXPECTED
 
 
@@ -304,28 +331,46 @@ class TestErrorHandling:
 class TestMainHappyPath:
     @patch("refactor_bot.orchestrator.graph.build_graph")
     @patch("refactor_bot.cli.main.create_agents")
-    def test_main_happy_path(self, mock_create, mock_build, tmp_path):
+    def test_main_happy_path(self, mock_create, mock_build, repo_dir):
         mock_create.return_value = _mock_agents()
         mock_graph = MagicMock()
         mock_graph.invoke.return_value = _mock_result()
         mock_build.return_value = mock_graph
-        assert main(["test directive", str(tmp_path)]) == EXIT_SUCCESS
+        assert main(["test directive", str(repo_dir)]) == EXIT_SUCCESS
 
     @patch("refactor_bot.orchestrator.graph.build_graph")
     @patch("refactor_bot.cli.main.create_agents")
-    def test_main_passes_selected_skills(self, mock_create, mock_build, tmp_path):
+    def test_main_passes_selected_skills(self, mock_create, mock_build, repo_dir):
         mock_create.return_value = _mock_agents()
         mock_graph = MagicMock()
         mock_graph.invoke.return_value = _mock_result()
         mock_build.return_value = mock_graph
 
         assert (
-            main(["Convert class components", str(tmp_path), "--skills", "vercel-react-best-practices"])
+            main(["Convert class components", str(repo_dir), "--skills", "vercel-react-best-practices"])
             == EXIT_SUCCESS
         )
         call_kwargs = mock_build.call_args.kwargs
         assert call_kwargs["selected_skills"] == ["vercel-react-best-practices"]
 
+    @patch("refactor_bot.orchestrator.graph.build_graph")
+    @patch("refactor_bot.cli.main.create_agents")
+    def test_main_json_output_uses_task_statuses(self, mock_create, mock_build, repo_dir, capsys):
+        mock_create.return_value = _mock_agents()
+        mock_graph = MagicMock()
+        mock_graph.invoke.return_value = _mock_result(
+            task_tree=[
+                {"task_id": "RF-001", "status": TaskStatus.PENDING},
+                {"task_id": "RF-002", "status": TaskStatus.PENDING},
+            ],
+            task_statuses={"RF-001": TaskStatus.COMPLETED},
+        )
+        mock_build.return_value = mock_graph
+
+        assert main(["test directive", str(repo_dir), "--output-json"]) == EXIT_SUCCESS
+        data = json.loads(capsys.readouterr().out)
+        assert [t["status"] for t in data["task_tree"]] == ["completed", "pending"]
+
     @patch("refactor_bot.orchestrator.graph.build_graph")
     @patch("refactor_bot.cli.main.create_agents")
     def test_main_outputs_pr_artifact(self, mock_create, mock_build, tmp_path):
@@ -1,8 +1,11 @@
 """Tests for diff_generator utility functions."""
 
+import subprocess
+
 import pytest
 
 from refactor_bot.utils.diff_generator import (
+    GIT_DIFF_MIN_LINES,
     detect_code_style,
     generate_unified_diff,
     validate_diff_with_git,
@@ -37,6 +40,33 @@ def test_generate_unified_diff_multiline():
     assert "+changed" in diff
 
 
+def test_generate_unified_diff_large_file():
+    """Diffs of files past GIT_DIFF_MIN_LINES keep repo headers and apply cleanly."""
+    original = "".join(f"line{i}\n" for i in range(GIT_DIFF_MIN_LINES + 500))
+    modified = original.replace("line10\n", "ten\n").replace("line2200\n", "")
+    diff = generate_unified_diff("src/big.js", original, modified)
+    assert diff.startswith("--- a/src/big.js\n+++ b/src/big.js\n@@ ")
+    assert "-line10\n+ten" in diff
+    assert "-line2200" in diff
+    assert validate_diff_with_git(diff, {"src/big.js": original}) == (True, "")
+
+
+def test_generate_unified_diff_large_file_ignores_cwd_repo_config(tmp_path, monkeypatch):
+    """A git repo's local config in the working directory does not change the diff."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "config", "diff.suppressBlankEmpty", "true"], check=True
+    )
+    monkeypatch.chdir(tmp_path)
+
+    original = "".join(f"line{i}\n\n" for i in range(GIT_DIFF_MIN_LINES))
+    modified = original.replace("line10\n", "ten\n")
+    diff = generate_unified_diff("src/big.js", original, modified)
+    # Blank context lines keep their leading space
+    assert "\n \n-line10\n+ten\n \n" in diff
+    assert validate_diff_with_git(diff, {"src/big.js": original}) == (True, "")
+
+
 def test_validate_diff_with_git_success():
     """Valid diff passes git apply --check."""
     original = "hello\n"
@@ -56,6 +86,32 @@ def test_validate_diff_with_git_invalid():
     assert error != ""
 
 
+def test_validate_diff_missing_file_is_invalid():
+    """A diff against a file not in original_files is rejected."""
+    diff = generate_unified_diff("test.txt", "hello\n", "world\n")
+    is_valid, error = validate_diff_with_git(diff, {"other.txt": "hello\n"})
+    assert is_valid is False
+    assert "test.txt" in error
+
+
+def test_validate_diff_multiple_hunks():
+    """Diffs with several hunks validate against the original content."""
+    original = "".join(f"line{i}\n" for i in range(30))
+    modified = original.replace("line2\n", "two\n").replace("line27\n", "twenty-seven\n")
+    diff = generate_unified_diff("f.txt", original, modified)
+    assert diff.count("@@ -") == 2
+    assert validate_diff_with_git(diff, {"f.txt": original}) == (True, "")
+
+
+def test_validate_diff_with_shifted_hunk_defers_to_git():
+    """A hunk whose context sits at another line still applies, as in git."""
+    original = "".join(f"line{i}\n" for i in range(10))
+    diff = generate_unified_diff("f.txt", original, original.replace("line5\n", "five\n"))
+    is_valid, error = validate_diff_with_git(diff, {"f.txt": "x\ny\n" + original})
+    assert is_valid is True
+    assert error == ""
+
+
 def test_detect_code_style_two_space_indent():
     """Detects 2-space indentation."""
     code = "function f() {\n  const x = 1;\n  return x;\n}\n"
@@ -70,6 +126,39 @@ def test_detect_code_style_four_space_indent():
     assert style["indent"] == "4 spaces"
 
 
+def test_detect_code_style_nested_two_space_indent():
+    """Deeply nested 2-space code is still 2 spaces, not its widest level."""
+    code = (
+        "function f() {\n"
+        "  if (a) {\n"
+        "    if (b) {\n"
+        "      if (c) {\n"
+        "        g();\n"
+        "        h();\n"
+        "      }\n"
+        "    }\n"
+        "  }\n"
+        "}\n"
+    )
+    assert detect_code_style(code)["indent"] == "2 spaces"
+
+
+def test_detect_code_style_ignores_doc_comment_continuations():
+    """The single space before " * " in block comments is not the indent."""
+    code = (
+        "/**\n * Adds numbers.\n * @param a\n */\n"
+        "function add(a, b) {\n    const sum = a + b;\n    return sum;\n}\n"
+        "function sub(a, b) {\n    return a - b;\n}\n"
+    )
+    assert detect_code_style(code)["indent"] == "4 spaces"
+
+
+def test_detect_code_style_tabs():
+    """Tab-indented lines select tabs."""
+    code = "function f() {\n\tconst x = 1;\n\treturn x;\n}\n"
+    assert detect_code_style(code)["indent"] == "tabs"
+
+
 def test_detect_code_style_single_quotes():
     """Detects single quote preference."""
     code = "const x = 'hello';\nconst y = 'world';\n"
@@ -89,3 +178,11 @@ def test_detect_code_style_empty_source():
     style = detect_code_style("")
     assert "indent" in style
     assert "quotes" in style
+
+
+def test_detect_code_style_returns_independent_dicts():
+    """Cached detection still hands each caller its own dict."""
+    code = "def f():\n    return 'x'\n"
+    first = detect_code_style(code)
+    first["indent"] = "tabs"
+    assert detect_code_style(code) == {"indent": "4 spaces", "quotes": "single"}
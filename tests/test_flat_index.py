@@ -0,0 +1,68 @@
+import numpy as np
+
+from refactor_bot.rag.flat_index import FlatIndex
+
+
+def _make_index() -> FlatIndex:
+    return FlatIndex(
+        ids=["a", "b", "c", "d"],
+        embeddings=[
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.7, 0.7, 0.0],
+            [0.0, 2.0, 0.0],  # same direction as "b", different norm
+        ],
+        documents=["da", "db", "dc", "dd"],
+        metadatas=[{}, {}, {}, {}],
+    )
+
+
+def test_search_orders_by_cosine_distance():
+    """Verify nearest rows come first with distance = 1 - cosine similarity."""
+    index = _make_index()
+
+    hits = index.search([[1.0, 0.1, 0.0]], top_k=2)[0]
+
+    assert [i for i, _ in hits] == [0, 2]
+    expected = 1.0 - np.dot([1.0, 0.1, 0.0], [1.0, 0.0, 0.0]) / np.linalg.norm([1.0, 0.1, 0.0])
+    assert abs(hits[0][1] - expected) < 1e-6
+
+
+def test_search_breaks_ties_by_row_order():
+    """Verify equal scores keep insertion order, including at the top_k cut."""
+    index = _make_index()
+
+    hits = index.search([[0.0, 1.0, 0.0]], top_k=1)[0]
+    assert [i for i, _ in hits] == [1]
+
+    hits = index.search([[0.0, 1.0, 0.0]], top_k=10)[0]
+    assert [i for i, _ in hits][:2] == [1, 3]
+    assert len(hits) == len(index)
+
+
+def test_search_batches_queries():
+    """Verify one result list per query, in query order."""
+    index = _make_index()
+
+    results = index.search([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], top_k=1)
+
+    assert [[i for i, _ in hits] for hits in results] == [[0], [1]]
+    assert index.search([], top_k=3) == []
+
+
+def test_float16_storage_halves_memory_and_keeps_ranking(monkeypatch):
+    """Verify FP16 storage ranks like FP32, including across score tiles."""
+    monkeypatch.setattr("refactor_bot.rag.flat_index.SCORE_TILE_ROWS", 3)
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((10, 64)).astype(np.float32)
+    args = ([str(i) for i in range(10)], embeddings, [None] * 10, [{}] * 10)
+
+    full = FlatIndex(*args)
+    half = FlatIndex(*args, dtype=np.float16)
+    queries = embeddings[:3] + 0.01
+
+    assert half.nbytes * 2 == full.nbytes
+    for full_hits, half_hits in zip(full.search(queries, 4), half.search(queries, 4)):
+        assert full_hits[0][0] == half_hits[0][0]
+        for (_, full_dist), (_, half_dist) in zip(full_hits, half_hits):
+            assert abs(full_dist - half_dist) < 1e-2
@@ -20,6 +20,7 @@ from refactor_bot.models import (
     TestRunResult,
 )
 from refactor_bot.orchestrator.graph import (
+    DECIDE_ROUTES,
     apply_node,
     abort_node,
     skip_node,
@@ -32,6 +33,7 @@ from refactor_bot.orchestrator.graph import (
     retry_node,
 )
 from refactor_bot.orchestrator.state import make_initial_state
+from refactor_bot.rag.exceptions import VectorStoreError
 
 
 # ---------------------------------------------------------------------------
@@ -168,6 +170,67 @@ class TestPlanNode:
         assert "context_bundles" in result
         assert "active_rules" in result
 
+    def test_plan_node_prefetches_task_contexts_in_one_batch(self):
+        """Task descriptions are embedded together and stored per task."""
+        tasks = [make_task("RF-001"), make_task("RF-002")]
+
+        retriever = MagicMock()
+        retriever.query.return_value = []
+        retriever.query_batch.return_value = [["ctx-1"], ["ctx-2"]]
+
+        planner = MagicMock()
+        planner.decompose.return_value = tasks
+
+        node = make_plan_node(planner, retriever)
+        state = make_initial_state("Refactor hooks", "/tmp/repo")
+        state["repo_index"] = make_repo_index()
+
+        result = node(state)
+
+        retriever.query_batch.assert_called_once_with(
+            ["Task RF-001", "Task RF-002"], top_k=5
+        )
+        assert result["context_bundles"]["RF-001"] == ["ctx-1"]
+        assert result["context_bundles"]["RF-002"] == ["ctx-2"]
+
+    def test_plan_node_prefetch_failure_is_not_fatal(self, caplog):
+        """A failing context prefetch still returns the planned tasks."""
+        retriever = MagicMock()
+        retriever.query.return_value = []
+        retriever.query_batch.side_effect = VectorStoreError("store down")
+
+        planner = MagicMock()
+        planner.decompose.return_value = [make_task("RF-001")]
+
+        node = make_plan_node(planner, retriever)
+        state = make_initial_state("Refactor hooks", "/tmp/repo")
+        state["repo_index"] = make_repo_index()
+
+        result = node(state)
+
+        assert [t.task_id for t in result["task_tree"]] == ["RF-001"]
+        assert "RF-001" not in result["context_bundles"]
+        assert "errors" not in result
+        assert "store down" in caplog.text
+
+    def test_plan_node_prefetch_unexpected_error_is_reported(self):
+        """Errors other than retrieval failures are not swallowed by the prefetch."""
+        retriever = MagicMock()
+        retriever.query.return_value = []
+        retriever.query_batch.side_effect = TypeError("bad call")
+
+        planner = MagicMock()
+        planner.decompose.return_value = [make_task("RF-001")]
+
+        node = make_plan_node(planner, retriever)
+        state = make_initial_state("Refactor hooks", "/tmp/repo")
+        state["repo_index"] = make_repo_index()
+
+        result = node(state)
+
+        assert result["task_tree"] == []
+        assert "bad call" in result["errors"][0]
+
     def test_plan_node_error(self):
         """When planner.decompose raises PlanningError, errors populated + task_tree empty."""
         retriever = MagicMock()
@@ -213,6 +276,64 @@ class TestExecuteNode:
         assert isinstance(result["diffs"], list)
         assert len(result["diffs"]) == 1
         assert result["diffs"][0].task_id == "RF-001"
+        assert result["context_bundles"]["RF-001"] == []
+
+    def test_execute_node_prefetches_ready_frontier_context(self):
+        """Independent ready tasks share one batched retrieval call."""
+        tasks = [
+            make_task("RF-001"),
+            make_task("RF-002"),
+            make_task("RF-003", dependencies=["RF-001"]),
+        ]
+
+        retriever = MagicMock()
+        retriever.query_batch.return_value = [[], []]
+        executor = MagicMock()
+        executor.execute.return_value = [make_diff()]
+
+        node = make_execute_node(executor, retriever)
+        state = make_initial_state("Refactor hooks", "/tmp/repo")
+        state["repo_index"] = make_repo_index()
+        state["task_tree"] = tasks
+
+        result = node(state)
+
+        retriever.query.assert_not_called()
+        retriever.query_batch.assert_called_once_with(
+            ["Task RF-001", "Task RF-002"], top_k=5
+        )
+        assert set(result["context_bundles"]) == {"RF-001", "RF-002"}
+
+    def test_execute_node_reuses_cached_task_context(self):
+        """A retried task reuses its stored context instead of querying again."""
+        task = make_task("RF-001")
+        cached_context = [
+            RetrievalResult(
+                id="src/app.tsx::App",
+                file_path="src/app.tsx",
+                symbol="App",
+                type="function",
+                source_code="function App() {}",
+                distance=0.1,
+                similarity=0.9,
+            )
+        ]
+
+        retriever = MagicMock()
+        executor = MagicMock()
+        executor.execute.return_value = [make_diff()]
+
+        node = make_execute_node(executor, retriever)
+        state = make_initial_state("Refactor hooks", "/tmp/repo")
+        state["repo_index"] = make_repo_index()
+        state["task_tree"] = [task]
+        state["context_bundles"] = {"RF-001": cached_context}
+
+        result = node(state)
+
+        retriever.query.assert_not_called()
+        assert executor.execute.call_args.kwargs["context"] is cached_context
+        assert "context_bundles" not in result
 
     def test_execute_node_no_pending_task(self):
         """When all tasks are COMPLETED, an error message is added."""
@@ -415,6 +536,16 @@ class TestDecideFn:
         result = decide(state)
         assert result == "skip"
 
+    def test_decide_routes_table_is_exhaustive(self):
+        """Routing table covers every predicate combination with a valid route."""
+        assert len(DECIDE_ROUTES) == 32
+        assert set(DECIDE_ROUTES) <= {"apply", "retry", "skip", "abort"}
+        # low_trust always aborts, even when audit and tests passed
+        assert DECIDE_ROUTES[0b11100] == "abort"
+        assert DECIDE_ROUTES[0b11000] == "apply"
+        assert DECIDE_ROUTES[0b01001] == "skip"
+        assert DECIDE_ROUTES[0b00001] == "abort"
+
 
 # ---------------------------------------------------------------------------
 # apply_node tests
@@ -430,12 +561,8 @@ class TestApplyNode:
 
         result = apply_node(state)
 
-        assert "task_tree" in result
-        updated_tasks = result["task_tree"]
-        # Find the task that was in progress and verify it's now completed
-        completed = [t for t in updated_tasks if t.task_id == "RF-001"]
-        assert len(completed) == 1
-        assert completed[0].status == TaskStatus.COMPLETED
+        assert "task_tree" not in result
+        assert result["task_statuses"] == {"RF-001": TaskStatus.COMPLETED}
 
     def test_apply_node_noop_when_index_out_of_bounds(self):
         """Invalid current index is ignored (no state mutation)."""
@@ -446,7 +573,7 @@ class TestApplyNode:
 
         result = apply_node(state)
 
-        assert result["task_tree"] == state["task_tree"]
+        assert result == {}
 
 
 # ---------------------------------------------------------------------------
@@ -465,10 +592,7 @@ class TestRetryNode:
         result = retry_node(state)
 
         assert result["retry_counts"]["RF-001"] == 2
-        updated_tasks = result["task_tree"]
-        pending = [t for t in updated_tasks if t.task_id == "RF-001"]
-        assert len(pending) == 1
-        assert pending[0].status == TaskStatus.PENDING
+        assert result["task_statuses"] == {"RF-001": TaskStatus.PENDING}
         # Errors should contain a context message
         assert isinstance(result.get("errors", []), list)
 
@@ -481,7 +605,7 @@ class TestRetryNode:
 
         result = retry_node(state)
 
-        assert result["task_tree"] == state["task_tree"]
+        assert "task_statuses" not in result
         assert result["retry_counts"] == {}
         assert any("out of bounds" in msg for msg in result.get("errors", []))
 
@@ -501,14 +625,11 @@ class TestSkipNode:
 
         result = skip_node(state)
 
-        assert "task_tree" in result
-        updated_tasks = result["task_tree"]
-        skipped = [t for t in updated_tasks if t.task_id == "RF-001"]
-        assert len(skipped) == 1
-        assert skipped[0].status == TaskStatus.SKIPPED
+        assert "task_tree" not in result
+        assert result["task_statuses"] == {"RF-001": TaskStatus.SKIPPED}
 
     def test_skip_node_noop_when_index_out_of_bounds(self):
-        """Invalid current index is ignored (task_tree remains unchanged)."""
+        """Invalid current index is ignored (no status update)."""
         state = make_initial_state("Refactor", "/tmp")
         task = make_task("RF-001", status=TaskStatus.IN_PROGRESS)
         state["task_tree"] = [task]
@@ -516,7 +637,7 @@ class TestSkipNode:
 
         result = skip_node(state)
 
-        assert result["task_tree"] == state["task_tree"]
+        assert result == {}
 
 
 # ---------------------------------------------------------------------------
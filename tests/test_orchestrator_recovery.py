@@ -1,17 +1,16 @@
 """Tests for orchestrator recovery module (Task 8)."""
-import pytest
 
-from refactor_bot.models import TaskNode, TaskStatus, FileDiff, TestReport, TestRunResult
+from refactor_bot.models import FileDiff, TaskNode, TaskStatus, TestReport, TestRunResult
 from refactor_bot.orchestrator.recovery import (
-    get_next_pending_task,
-    get_current_task,
     compute_test_pass_rate,
+    get_current_task,
+    get_next_pending_task,
+    get_ready_tasks,
     get_task_diffs,
     next_task_or_end,
 )
 from refactor_bot.orchestrator.state import make_initial_state
 
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -41,7 +40,7 @@ def make_diff(file_path: str, task_id: str) -> FileDiff:
 
 def make_test_report(passed_count: int, failed_count: int) -> TestReport:
     """Helper to create a TestReport with given pass/fail counts."""
-        return TestReport(
+    return TestReport(
         passed=failed_count == 0,
         pre_run=None,
         post_run=TestRunResult(
@@ -73,6 +72,16 @@ class TestGetNextPendingTask:
         assert result is not None
         assert result.task_id == "RF-002"
 
+    def test_get_ready_tasks_returns_full_frontier(self):
+        """All PENDING tasks with satisfied deps are returned in tree order."""
+        task_a = make_task("RF-001", status=TaskStatus.COMPLETED)
+        task_b = make_task("RF-002", dependencies=["RF-001"])
+        task_c = make_task("RF-003")
+        task_d = make_task("RF-004", dependencies=["RF-003"])
+
+        result = get_ready_tasks([task_a, task_b, task_c, task_d])
+        assert [t.task_id for t in result] == ["RF-002", "RF-003"]
+
     def test_get_next_pending_task_skips_blocked(self):
         """PENDING task with a PENDING dep is NOT returned."""
         task_a = make_task("RF-001", status=TaskStatus.PENDING)
@@ -106,6 +115,17 @@ class TestGetNextPendingTask:
         assert result is not None
         assert result.task_id == "RF-001"
 
+    def test_get_next_pending_task_uses_status_overrides(self):
+        """task_statuses overrides TaskNode.status for eligibility and deps."""
+        task_a = make_task("RF-001", status=TaskStatus.PENDING)
+        task_b = make_task("RF-002", status=TaskStatus.PENDING, dependencies=["RF-001"])
+
+        result = get_next_pending_task(
+            [task_a, task_b], {"RF-001": TaskStatus.COMPLETED}
+        )
+        assert result is not None
+        assert result.task_id == "RF-002"
+
 
 # ---------------------------------------------------------------------------
 # compute_test_pass_rate
@@ -8,7 +8,7 @@ class TestMakeInitialState:
     """Tests for the make_initial_state factory function."""
 
     def test_make_initial_state_defaults(self):
-        """All 15 keys present with correct defaults."""
+        """All 16 keys present with correct defaults."""
         state = make_initial_state("Refactor hooks", "/tmp/repo")
 
         assert state["directive"] == "Refactor hooks"
@@ -18,6 +18,7 @@ class TestMakeInitialState:
         assert state["embedding_stats"] is None
         assert state["context_bundles"] == {}
         assert state["task_tree"] == []
+        assert state["task_statuses"] == {}
         assert state["active_rules"] == []
         assert state["current_task_index"] == 0
         assert state["diffs"] == []
@@ -27,8 +28,8 @@ class TestMakeInitialState:
         assert state["errors"] == []
         assert state["is_react_project"] is False
 
-        # Verify all 15 keys are present
-        assert len(state) == 15
+        # Verify all 16 keys are present
+        assert len(state) == 16
 
     def test_make_initial_state_custom_retries(self):
         """max_retries can be overridden."""
@@ -303,6 +303,60 @@ class TestFileHashing:
             assert len(file_info.hash) == 64
 
 
+class TestFileCache:
+    """Test reuse of parsed results for unchanged files."""
+
+    def test_reindex_unchanged_files_skips_parsing(self, indexer, fixtures_dir, monkeypatch):
+        """A second index of unchanged files should not parse them again."""
+        first = indexer.index(str(fixtures_dir))
+
+        def fail_parse(file_path, source_bytes=None):
+            raise AssertionError(f"unexpected parse of {file_path}")
+
+        monkeypatch.setattr("refactor_bot.agents.repo_indexer.parse_file", fail_parse)
+        second = indexer.index(str(fixtures_dir))
+
+        assert second.model_dump(exclude={"indexed_at"}) == first.model_dump(
+            exclude={"indexed_at"}
+        )
+
+    def test_reindex_changed_file_is_parsed_again(self, indexer):
+        """Editing a file should invalidate its cached result."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "mod.ts"
+            source.write_text("export function first() {}\n")
+            indexer.index(tmpdir)
+
+            source.write_text("export function second() {}\n")
+            result = indexer.index(tmpdir)
+
+            assert [s.name for s in result.files[0].symbols] == ["second"]
+
+
+class TestParallelIndexing:
+    """Test indexing with worker processes."""
+
+    def test_parallel_index_matches_sequential(self, fixtures_dir, monkeypatch):
+        """Worker-process parsing should produce the same index as in-process parsing."""
+        monkeypatch.setattr("refactor_bot.agents.repo_indexer.PARALLEL_INDEX_MIN_FILES", 1)
+        sequential = RepoIndexer().index(str(fixtures_dir))
+        parallel_indexer = RepoIndexer(max_workers=2)
+        parallel = parallel_indexer.index(str(fixtures_dir))
+
+        assert parallel.model_dump(exclude={"indexed_at"}) == sequential.model_dump(
+            exclude={"indexed_at"}
+        )
+        # Worker results are cached in the parent for the next run
+        assert len(parallel_indexer._file_cache) == len(
+            [f for f in parallel.files if not f.errors]
+        )
+
+    def test_max_workers_below_one_rejected(self):
+        """max_workers must be at least 1."""
+        with pytest.raises(ValueError):
+            RepoIndexer(max_workers=0)
+
+
 class TestCounts:
     """Test aggregate counts in RepoIndex."""
 
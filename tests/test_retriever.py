@@ -1,9 +1,11 @@
 from unittest.mock import patch
 
+import numpy as np
+
 from refactor_bot.models.schemas import RetrievalResult
 from refactor_bot.rag.embeddings import EmbeddingService
-from refactor_bot.rag.retriever import Retriever
-from refactor_bot.rag.vector_store import VectorStore
+from refactor_bot.rag.retriever import Retriever, _to_retrieval_results
+from refactor_bot.rag.vector_store import VectorStore, symbol_content_hash
 
 
 def test_upsert_and_query(
@@ -199,3 +201,236 @@ def test_get_by_file(
             assert len(results) > 0
             for r in results:
                 assert r.get("metadata", {}).get("file_path") == target_file
+
+
+def test_query_batch_matches_single_queries(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_embedding_records
+):
+    """Verify query_batch embeds once and returns per-query results in order."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+
+        embedded = embedding_service.embed_symbols(sample_embedding_records)
+        vector_store.upsert(embedded)
+
+        retriever = Retriever(
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        )
+
+        queries = ["async file operations", "capitalize string"]
+        calls_before = mock_openai_client.embeddings.create.call_count
+        batched = retriever.query_batch(queries, top_k=3)
+
+        assert mock_openai_client.embeddings.create.call_count == calls_before + 1
+        assert len(batched) == len(queries)
+        for query, results in zip(queries, batched):
+            single = retriever.query(query, top_k=3)
+            assert [r.id for r in results] == [r.id for r in single]
+
+
+def test_repeated_query_reuses_cached_embedding(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_embedding_records
+):
+    """Verify repeated queries (modulo whitespace) skip the embedding call."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+
+        embedded = embedding_service.embed_symbols(sample_embedding_records)
+        vector_store.upsert(embedded)
+
+        retriever = Retriever(
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        )
+
+        first = retriever.query("async file operations", top_k=3)
+        calls_after_first = mock_openai_client.embeddings.create.call_count
+        second = retriever.query("  async   file operations ", top_k=3)
+
+        assert mock_openai_client.embeddings.create.call_count == calls_after_first
+        assert [r.id for r in second] == [r.id for r in first]
+
+
+def test_to_retrieval_results_thresholds_and_sorts():
+    """Verify rows below threshold are dropped and the rest sorted by similarity."""
+    raw = [
+        {"id": "a", "distance": 0.4, "metadata": {"symbol": "a"}, "document": ""},
+        {"id": "b", "distance": 0.1, "metadata": {"symbol": "b"}, "document": ""},
+        {"id": "c", "distance": 0.25, "metadata": {"symbol": "c"}, "document": ""},
+        {"id": "d", "distance": 0.1, "metadata": {"symbol": "d"}, "document": ""},
+    ]
+
+    results = _to_retrieval_results(raw, similarity_threshold=0.7)
+
+    assert [r.id for r in results] == ["b", "d", "c"]
+    assert results[0].similarity == 1.0 - 0.1
+    assert _to_retrieval_results([], similarity_threshold=0.7) == []
+
+
+def test_upsert_splits_large_inputs_into_batches(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_embedding_records
+):
+    """Verify upsert sends at most batch_size records per Chroma call."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+
+        embedded = embedding_service.embed_symbols(sample_embedding_records)
+        vector_store.upsert(embedded, batch_size=2)
+
+        all_ids = set(vector_store.get_all_hashes())
+        assert all_ids == {r.id for r in embedded}
+
+        with patch.object(vector_store, "collection") as collection:
+            vector_store.upsert(embedded, batch_size=2)
+            sizes = [len(c.kwargs["ids"]) for c in collection.upsert.call_args_list]
+
+        assert sum(sizes) == len(embedded)
+        assert max(sizes) <= 2
+
+
+def test_get_all_hashes_served_from_sidecar_cache(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_repo_index
+):
+    """Verify hashes persist across VectorStore instances and track deletes."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+        retriever = Retriever(
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        )
+        retriever.index_repo(sample_repo_index, force=True)
+        expected = vector_store.get_all_hashes()
+
+        reopened = VectorStore(persist_dir=chroma_temp_dir)
+        with patch.object(reopened, "_scan_hashes") as scan:
+            assert reopened.get_all_hashes() == expected
+            scan.assert_not_called()
+
+        removed_id = next(iter(expected))
+        reopened.delete([removed_id])
+        assert removed_id not in reopened.get_all_hashes()
+        assert removed_id not in VectorStore(persist_dir=chroma_temp_dir).get_all_hashes()
+
+
+def test_incremental_reindex_reuses_stored_embeddings(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_repo_index
+):
+    """Verify unchanged symbol source in a changed file is not re-embedded."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+        retriever = Retriever(
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        )
+
+        retriever.index_repo(sample_repo_index, force=True)
+
+        # File hash changes but symbol source does not
+        for f in sample_repo_index.files:
+            if f.symbols:
+                f.hash = "modified_hash_123"
+                break
+
+        calls_before = mock_openai_client.embeddings.create.call_count
+        stats = retriever.index_repo(sample_repo_index, force=False)
+
+        assert stats["embedded"] > 0
+        assert stats["reused"] == stats["embedded"]
+        assert mock_openai_client.embeddings.create.call_count == calls_before
+        assert vector_store.get_all_hashes()[next(
+            f"{f.file_path}::{f.symbols[0].name}"
+            for f in sample_repo_index.files
+            if f.symbols
+        )] == "modified_hash_123"
+
+
+def test_flat_index_matches_chroma_results(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_embedding_records
+):
+    """Verify in-memory flat queries return the same hits as Chroma queries."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+
+        embedded = embedding_service.embed_symbols(sample_embedding_records)
+        vector_store.upsert(embedded)
+
+        chroma_only = VectorStore(persist_dir=chroma_temp_dir, flat_index_max_records=0)
+        query_vector = embedding_service.embed_texts(["async file operations"])[0]
+
+        # Engineered vectors tie, so compare full result sets rather than order
+        top_k = len(embedded)
+        flat_hits = vector_store.query_by_embedding(query_vector, top_k=top_k)
+        chroma_hits = chroma_only.query_by_embedding(query_vector, top_k=top_k)
+
+        assert vector_store._flat_index is not None
+        assert chroma_only._flat_index is None
+        assert {h["id"] for h in flat_hits} == {h["id"] for h in chroma_hits}
+        flat_by_id = {h["id"]: h for h in flat_hits}
+        for hit in chroma_hits:
+            assert abs(flat_by_id[hit["id"]]["distance"] - hit["distance"]) < 1e-4
+            assert flat_by_id[hit["id"]]["metadata"] == hit["metadata"]
+        distances = [h["distance"] for h in flat_hits]
+        assert distances == sorted(distances)
+
+
+def test_upsert_stores_unit_normalized_embeddings(
+    chroma_temp_dir,
+    mock_openai_client,
+    sample_embedding_records
+):
+    """Verify stored vectors are L2-normalized regardless of input scale."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+
+        embedded = embedding_service.embed_symbols(sample_embedding_records[:1])
+        embedded[0].embedding_vector = [3.0 * x for x in embedded[0].embedding_vector]
+        vector_store.upsert(embedded)
+
+        stored = vector_store.get_embeddings_by_content_hash(
+            [symbol_content_hash(embedded[0].source_code)]
+        )
+        (vector,) = stored.values()
+        assert abs(np.linalg.norm(vector) - 1.0) < 1e-5
+
+
+def test_vector_stores_share_client_per_persist_dir(chroma_temp_dir):
+    """Verify stores on the same directory reuse one Chroma client."""
+    first = VectorStore(persist_dir=chroma_temp_dir)
+    second = VectorStore(persist_dir=chroma_temp_dir, collection_name="other")
+
+    assert first.client is second.client
+
+
+def test_query_on_empty_store_skips_embedding(chroma_temp_dir, mock_openai_client):
+    """Verify querying an empty store returns no results without embedding."""
+    with patch("openai.OpenAI", return_value=mock_openai_client):
+        embedding_service = EmbeddingService(api_key="test-key")
+        vector_store = VectorStore(persist_dir=chroma_temp_dir)
+        retriever = Retriever(
+            embedding_service=embedding_service,
+            vector_store=vector_store,
+        )
+
+        assert retriever.query("async file operations", top_k=5) == []
+        assert retriever.query_batch(["a", "b"], top_k=5) == [[], []]
+        mock_openai_client.embeddings.create.assert_not_called()
@@ -2,7 +2,12 @@
 
 
 from refactor_bot.rules.react_rules import REACT_RULES
-from refactor_bot.rules.rule_engine import ReactRule, select_applicable_rules
+from refactor_bot.rules.rule_engine import (
+    HIGH_RULE_KEYWORDS,
+    ReactRule,
+    _match_high_rules,
+    select_applicable_rules,
+)
 
 
 class TestReactRules:
@@ -150,6 +155,37 @@ class TestSelectApplicableRules:
         assert len(result_upper) > 0
         assert len(result_mixed) > 0
 
+    def test_keyword_matching_equals_substring_check(self):
+        """Test the compiled keyword regex matches a plain per-keyword substring check."""
+        directives = [
+            "Add authentication and caching to server actions",
+            "Remove redundant props; deduplication of fetches",
+            "Serialization and hydration cleanup after analytics",
+            "Parallel layout fetching without waterfall",
+            "Refactor the component",
+            "nonblockingasyncLRUpersistent",
+        ]
+        for directive in directives:
+            expected = {
+                rule_id
+                for rule_id, keywords in HIGH_RULE_KEYWORDS.items()
+                if any(keyword in directive.lower() for keyword in keywords)
+            }
+            result = set(select_applicable_rules(directive, is_react_project=True))
+            critical = {r.rule_id for r in REACT_RULES if r.priority == "CRITICAL"}
+            assert result - critical == expected - critical
+
+    def test_repeated_directive_uses_cached_keyword_match(self):
+        """Test that a repeated directive is served from the keyword-match cache."""
+        directive = "Add caching to the auth layer (cache test)"
+        first = select_applicable_rules(directive, is_react_project=True)
+        hits_before = _match_high_rules.cache_info().hits
+
+        second = select_applicable_rules(directive, is_react_project=True)
+
+        assert second == first
+        assert _match_high_rules.cache_info().hits == hits_before + 1
+
     def test_custom_all_rules_parameter(self):
         """Test that custom all_rules parameter works."""
         custom_rules = [
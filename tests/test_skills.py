@@ -1,5 +1,6 @@
 """Unit tests for skills loading, parsing, and activation."""
 
+import importlib
 from pathlib import Path
 
 from refactor_bot.rules.react_rules import REACT_RULES
@@ -21,7 +22,7 @@ class DummyRepoTopology:
 
 def _reset_registry_state():
     registry._skills = {}
-    registry._active_skills = []
+    registry._active_skills = ()
 
 
 def test_vercel_rules_parser_reads_quick_reference(tmp_path: Path):
@@ -80,6 +81,25 @@ def test_vercel_rules_parser_fallback_to_react_catalog_on_missing_reference(tmp_
     assert {r.rule_id for r in parsed} == {r.rule_id for r in REACT_RULES}
 
 
+def test_vercel_rules_parser_caches_until_file_changes(tmp_path: Path):
+    skill_markdown = tmp_path / "SKILL.md"
+    skill_markdown.write_text(
+        "## Rendering (HIGH)\n- `rerender-memo` - Memoize expensive children\n"
+    )
+
+    rules._parse_skill_catalog_cached.cache_clear()
+    first = rules._parse_skill_catalog(skill_markdown)
+    second = rules._parse_skill_catalog(skill_markdown)
+    assert first == second
+    assert rules._parse_skill_catalog_cached.cache_info().hits == 1
+
+    skill_markdown.write_text(
+        "## Rendering (HIGH)\n- `rerender-lazy-state` - Pass a function to useState\n"
+    )
+    updated = rules._parse_skill_catalog(skill_markdown)
+    assert [entry[0] for entry in updated] == ["rerender-lazy-state"]
+
+
 def test_vercel_skill_load_from_disk_uses_prompt_and_rules(tmp_path: Path):
     _reset_registry_state()
 
@@ -108,6 +128,37 @@ def test_vercel_skill_load_from_disk_uses_prompt_and_rules(tmp_path: Path):
     assert parsed[0].rule_id == "async-defer-await"
 
 
+def test_vercel_skill_reload_from_disk_resolves_new_directory(tmp_path: Path):
+    empty_dir = tmp_path / "empty"
+    empty_dir.mkdir()
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    (skill_dir / "AGENTS.md").write_text("reloaded prompt context")
+
+    vrs = VercelReactBestPracticesSkill()
+    vrs.load_from_disk(empty_dir)
+    assert vrs.get_prompt_context("noop") == "Vercel React Best Practices loaded."
+    assert vrs.get_rules() == []
+
+    vrs.load_from_disk(skill_dir)
+    assert vrs.get_prompt_context("noop") == "reloaded prompt context"
+
+
+def test_vercel_skill_prompt_context_rereads_edited_agents_file(tmp_path: Path):
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    agents_file = skill_dir / "AGENTS.md"
+    agents_file.write_text("first context")
+
+    vrs = VercelReactBestPracticesSkill()
+    vrs.load_from_disk(skill_dir)
+    assert vrs.get_prompt_context("noop") == "first context"
+    assert vrs.get_prompt_context("other") == "first context"
+
+    agents_file.write_text("second, longer context")
+    assert vrs.get_prompt_context("noop") == "second, longer context"
+
+
 def test_vercel_skill_docs_are_not_placeholders():
     package_dir = Path("src/refactor_bot/skills/vercel_react_best_practices")
     skill_text = (package_dir / "SKILL.md").read_text(encoding="utf-8")
@@ -135,6 +186,39 @@ class TestSkillActivation:
         assert len(active) == 1
         assert active[0].metadata.name == "vercel-react-best-practices"
 
+    def test_repeat_activation_does_not_reimport_skill(self, monkeypatch):
+        _reset_registry_state()
+        activate_skills_for_repo(
+            DummyRepoIndex(),
+            selected_skill_names=["vercel-react-best-practices"],
+        )
+
+        import_calls = []
+        monkeypatch.setattr(importlib, "import_module", import_calls.append)
+        active = activate_skills_for_repo(
+            DummyRepoIndex(),
+            selected_skill_names=["vercel-react-best-practices"],
+        )
+        assert import_calls == []
+        assert active[0].metadata.name == "vercel-react-best-practices"
+
+    def test_all_rules_cached_until_activation_changes(self):
+        _reset_registry_state()
+        activate_skills_for_repo(
+            DummyRepoIndex(),
+            selected_skill_names=["vercel-react-best-practices"],
+        )
+        first = registry.get_all_rules()
+        assert first
+        assert registry.get_all_rules() == first
+        assert registry._rules_cache is not None
+
+        activate_skills_for_repo(
+            DummyRepoTopology(is_react_project=False, project_type=None),
+            directive="Refactor utility function",
+        )
+        assert registry.get_all_rules() == []
+
     def test_activate_unknown_skill_name_raises(self):
         _reset_registry_state()
         try: